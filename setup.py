@@ -47,6 +47,7 @@ setup(
     ],
     extras_require={
         "postgres": ["psycopg2-binary"],
+        "speedups": ["orjson>=3.6", "ijson>=3.1"],
         "dev": [
             "pytest",
             "pytest-cov",
@@ -19,16 +19,28 @@ __all__ = ["__version__"]
 
 # Import core functionality
 try:
-    from sparvi.profiler.profile_engine import profile_table
-    from sparvi.validations.validator import run_validations, load_rules_from_file
-    from sparvi.validations.default_validations import get_default_validations
+    from sparvi.cache import caching_schema
+    from sparvi.profiler.profile_engine import profile_table, profile_tables
+    from sparvi.validations.validator import (
+        run_validations, load_rules_from_file, iter_rules_from_file, CompiledRuleSet, ValidationRule
+    )
+    from sparvi.validations.default_validations import (
+        get_default_validations, get_default_validations_bulk, iter_default_validations
+    )
 
     # Add to public API
     __all__.extend([
         "profile_table",
+        "profile_tables",
         "run_validations",
         "load_rules_from_file",
-        "get_default_validations"
+        "iter_rules_from_file",
+        "CompiledRuleSet",
+        "ValidationRule",
+        "get_default_validations",
+        "get_default_validations_bulk",
+        "iter_default_validations",
+        "caching_schema"
     ])
 except ImportError:
     pass  # Allow partial imports
\ No newline at end of file
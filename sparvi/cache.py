@@ -0,0 +1,145 @@
+"""
+In-process caches shared by Sparvi Core.
+"""
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from collections.abc import MutableMapping
+from contextlib import contextmanager
+from typing import Optional
+
+
+class TTLCache(MutableMapping):
+    """
+    A size-bounded mapping whose entries expire a fixed time after being set.
+
+    When full, setting a new key evicts the least recently set entry. Safe to
+    use from several threads.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60, timer=time.monotonic):
+        """
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Seconds an entry stays valid after it is set
+            timer: Clock returning seconds, for testing
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __getitem__(self, key):
+        with self._lock:
+            expires, value = self._data[key]
+            if expires <= self._timer():
+                del self._data[key]
+                raise KeyError(key)
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (self._timer() + self.ttl, value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __delitem__(self, key):
+        with self._lock:
+            del self._data[key]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def _expire(self):
+        """Drop expired entries."""
+        now = self._timer()
+        for key in [key for key, (expires, _) in self._data.items() if expires <= now]:
+            del self._data[key]
+
+    def __iter__(self):
+        with self._lock:
+            self._expire()
+            return iter(list(self._data))
+
+    def __len__(self):
+        with self._lock:
+            self._expire()
+            return len(self._data)
+
+
+# Reflected layout of a table: column dicts as returned by the Inspector,
+# primary key column names and foreign key column names
+TableSchema = namedtuple("TableSchema", "columns primary_keys foreign_keys")
+
+# Seconds a reflected table schema is reused before it is read again
+SCHEMA_TTL_SECONDS = 300
+
+_schema_cache = TTLCache(maxsize=1024, ttl=SCHEMA_TTL_SECONDS)
+# Connection strings inside caching_schema(), with the schemas reflected there
+_pinned_schemas = {}
+
+
+def lookup_table_schema(connection_str: str, schema: Optional[str], table_name: str) -> Optional[TableSchema]:
+    """
+    Get a cached table schema
+
+    Args:
+        connection_str: Database connection string
+        schema: Schema the table lives in, or None for the default
+        table_name: Table name
+
+    Returns:
+        TableSchema, or None if it is not cached
+    """
+    store = _pinned_schemas.get(connection_str, _schema_cache)
+    return store.get((connection_str, schema, table_name))
+
+
+def store_table_schema(connection_str: str, schema: Optional[str], table_name: str,
+                       table_schema: TableSchema) -> None:
+    """
+    Cache a reflected table schema
+
+    Args:
+        connection_str: Database connection string
+        schema: Schema the table lives in, or None for the default
+        table_name: Table name
+        table_schema: Reflected TableSchema
+    """
+    store = _pinned_schemas.get(connection_str, _schema_cache)
+    store[(connection_str, schema, table_name)] = table_schema
+
+
+@contextmanager
+def caching_schema(connection_str: str):
+    """
+    Reflect each table of a database at most once inside the block
+
+    Schemas reflected inside the block do not expire until it ends and are
+    forgotten afterwards, so a batch of calls sees one consistent snapshot:
+
+        with caching_schema(conn_str):
+            for table in tables:
+                get_default_validations(conn_str, table)
+
+    Args:
+        connection_str: Database connection string
+    """
+    outermost = connection_str not in _pinned_schemas
+    if outermost:
+        _pinned_schemas[connection_str] = {}
+    try:
+        yield
+    finally:
+        if outermost:
+            del _pinned_schemas[connection_str]
+
+
+def clear() -> None:
+    """Forget all cached table schemas, e.g. after a schema change."""
+    _schema_cache.clear()
+    for pinned in _pinned_schemas.values():
+        pinned.clear()
@@ -13,6 +13,11 @@ from rich import box
 from sparvi.profiler.profile_engine import profile_table
 from sparvi.utils.env import get_connection_from_env
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 console = Console()
 
 
@@ -115,10 +120,23 @@ def profile(
     # Save to file if output path provided
     if output:
         output.parent.mkdir(parents=True, exist_ok=True)
-        with open(output, "w") as f:
-            json.dump(profile_results, f, indent=2)
+        _write_profile(profile_results, output)
         console.print(f"\nProfile saved to: [bold green]{output}[/bold green]")
 
+
+def _write_profile(profile_results, output: Path) -> None:
+    """Serialize a profile to JSON, using orjson when it is installed."""
+    if orjson is not None:
+        output.write_bytes(orjson.dumps(
+            profile_results,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC,
+            default=str
+        ))
+    else:
+        with open(output, "w") as f:
+            json.dump(profile_results, f, indent=2, default=str)
+
+
 def _print_minimal_summary(profile_results):
     """Print a minimal summary of profile results."""
     console.print(Panel(f"[bold]Profile Summary: {profile_results['table']}[/bold]"))
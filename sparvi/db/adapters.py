@@ -1,59 +1,152 @@
-from sqlalchemy import create_engine, text
+import functools
+import re
+import sys
+
+from sqlalchemy import text
+from sqlalchemy.sql.compiler import RESERVED_WORDS
 from typing import Optional, Dict, Any, List, Tuple, Union
 
+# Identifiers matching this pattern (and not reserved) are safe to leave unquoted
+_PLAIN_IDENTIFIER = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+# Substrings identifying each type family in a lowercased type name
+_NUMERIC_TYPE_RE = re.compile(r"int|float|numeric|double|decimal|number")
+_DATE_TYPE_RE = re.compile(r"date|time")
+_TEXT_TYPE_RE = re.compile(r"varchar|char|text|string")
+
+
+# Type names come from a small set (INTEGER, VARCHAR(255), TIMESTAMP, ...)
+# that repeats across columns and tables, so the checks are memoized.
+@functools.lru_cache(maxsize=256)
+def _is_numeric_type(col_type: str) -> bool:
+    return _NUMERIC_TYPE_RE.search(col_type.lower()) is not None
+
+
+@functools.lru_cache(maxsize=256)
+def _is_date_type(col_type: str) -> bool:
+    return _DATE_TYPE_RE.search(col_type.lower()) is not None
+
+
+@functools.lru_cache(maxsize=256)
+def _is_text_type(col_type: str) -> bool:
+    return _TEXT_TYPE_RE.search(col_type.lower()) is not None
+
+
+# Upper bound on memoized SQL fragments per builder method
+_FRAGMENT_CACHE_SIZE = 2048
+
+
+def _memoize_fragment(method):
+    """
+    Memoize a pure SQL fragment builder per adapter class.
+
+    Adapters hold no state, so a fragment depends only on the adapter class
+    and the arguments; results are shared between adapter instances and
+    interned. The cache is emptied when it reaches _FRAGMENT_CACHE_SIZE.
+    """
+    cache = {}
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if kwargs:
+            return method(self, *args, **kwargs)
+        key = (type(self), args)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        fragment = method(self, *args)
+        if isinstance(fragment, str):
+            fragment = sys.intern(fragment)
+        if len(cache) >= _FRAGMENT_CACHE_SIZE:
+            cache.clear()
+        cache[key] = fragment
+        return fragment
+
+    return wrapper
+
 
 class SqlAdapter:
     """Base adapter for database-specific SQL dialect handling."""
 
+    # Pure string builders called per column and statistic; overrides in
+    # subclasses are memoized by __init_subclass__
+    _memoized_fragments = ("percentile_query", "percentile_aggregate", "regex_match", "date_diff", "sample_query")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in cls._memoized_fragments:
+            if name in cls.__dict__:
+                setattr(cls, name, _memoize_fragment(cls.__dict__[name]))
+
     @staticmethod
     def get_adapter(connection_string_or_engine):
         """
         Factory method that returns the appropriate adapter for the given connection.
 
+        Adapters hold no state, so one shared instance is returned per
+        dialect.
+
         Args:
-            connection_string_or_engine: SQLAlchemy connection string or engine
+            connection_string_or_engine: SQLAlchemy connection string, engine
+                or connection
 
         Returns:
             An instance of the appropriate adapter class
         """
-        # Handle connection string
         if isinstance(connection_string_or_engine, str):
-            # Get the dialect name from the connection string without creating the engine
-            dialect = connection_string_or_engine.split(':')[0].lower()
-
-            # Handle unknown dialect without creating engine
-            if dialect not in ['postgresql', 'postgres', 'duckdb', 'sqlite', 'snowflake', 'bigquery', 'redshift']:
-                return GenericAdapter()
-
-            # For known dialects, create the engine
-            engine = create_engine(connection_string_or_engine)
-        else:
-            # If an engine was passed, use it directly
-            engine = connection_string_or_engine
-            dialect = engine.dialect.name.lower()
-
-        # Return the appropriate adapter based on dialect
-        # Prioritize Snowflake as the default
-        if 'snowflake' in dialect:
-            return SnowflakeAdapter()
-        elif 'postgres' in dialect or 'postgresql' in dialect:
-            return PostgresAdapter()
-        elif 'redshift' in dialect:
-            return RedshiftAdapter()
-        elif 'bigquery' in dialect:
-            return BigQueryAdapter()
-        elif 'duckdb' in dialect:
-            return DuckDBAdapter()
-        elif 'sqlite' in dialect:
-            return SQLiteAdapter()
+            # The dialect is the URL scheme without its driver, e.g.
+            # "postgresql" for "postgresql+psycopg2://..."
+            dialect = connection_string_or_engine.split(':', 1)[0].split('+', 1)[0]
         else:
-            # Default to a generic adapter
-            return GenericAdapter()
+            dialect = connection_string_or_engine.dialect.name
+        return _adapter_for_dialect(dialect.lower())
 
     def get_dialect_name(self, engine) -> str:
         """Get the dialect name from the engine."""
         return engine.dialect.name.lower()
 
+    # Character used to delimit quoted identifiers
+    identifier_quote = '"'
+
+    # Whether declared primary keys are enforced, i.e. guarantee unique rows
+    enforces_primary_keys = True
+
+    def quote_identifier(self, name: str) -> str:
+        """
+        Quote a column or table name if it needs quoting.
+
+        Plain lowercase names are returned unchanged so that dialects which
+        fold unquoted identifiers (e.g. Snowflake to upper case) still resolve
+        them as before; mixed case names, names with special characters and
+        reserved words are quoted.
+
+        Args:
+            name: Unquoted identifier
+
+        Returns:
+            Identifier safe to embed in SQL
+        """
+        q = self.identifier_quote
+        if _PLAIN_IDENTIFIER.match(name) and name not in RESERVED_WORDS:
+            return name
+        if len(name) > 1 and name.startswith(q) and name.endswith(q):
+            # Already quoted by the caller
+            return name
+        return f"{q}{name.replace(q, q + q)}{q}"
+
+    def quote_table(self, table: str) -> str:
+        """
+        Quote a possibly schema-qualified table name part by part.
+
+        Args:
+            table: Table name, optionally qualified as schema.table
+
+        Returns:
+            Table reference safe to embed in SQL
+        """
+        return ".".join(self.quote_identifier(part) for part in table.split("."))
+
     def percentile_query(self, column: str, percentile: float) -> str:
         """
         Generate SQL for calculating percentiles.
@@ -67,6 +160,20 @@ class SqlAdapter:
         """
         raise NotImplementedError("Subclasses must implement percentile_query")
 
+    def percentile_aggregate(self, column: str, percentile: float) -> Optional[str]:
+        """
+        Generate a percentile aggregate that can share a SELECT with other aggregates.
+
+        Args:
+            column: Column name
+            percentile: Percentile value (0-1)
+
+        Returns:
+            SQL aggregate fragment, or None if the dialect has no percentile
+            aggregate that can be combined with other aggregates in one scan
+        """
+        return None
+
     def regex_match(self, column: str, pattern: str) -> str:
         """
         Generate SQL for regex matching.
@@ -143,6 +250,85 @@ class SqlAdapter:
         """
         raise NotImplementedError("Subclasses must implement aggregate_array")
 
+    def cast_to_text(self, column: str) -> str:
+        """
+        Generate SQL for casting a column to the dialect's text type.
+
+        Args:
+            column: Column name or expression
+
+        Returns:
+            SQL fragment casting the column to text
+        """
+        return f"CAST({column} AS VARCHAR)"
+
+    def column_stat_exprs(self, column: str, kind: str, exact: bool = True) -> Tuple[str, ...]:
+        """
+        Generate the aggregates profiled for a column in the fused metrics query.
+
+        Args:
+            column: Column name
+            kind: Column category, "numeric", "text" or "date"
+            exact: Count distinct dates exactly rather than with
+                approx_distinct_expr
+
+        Returns:
+            Tuple of SQL aggregate expressions: MIN, MAX, AVG, SUM and the
+            standard deviation for numeric columns; MIN, MAX and AVG of the
+            length for text columns; MIN, MAX and the distinct count for
+            date columns
+        """
+        if kind == "numeric":
+            return (f"MIN({column})", f"MAX({column})", f"AVG({column})", f"SUM({column})",
+                    self.stddev_function(column))
+        if kind == "text":
+            length = self.length_function(column)
+            return f"MIN({length})", f"MAX({length})", f"AVG({length})"
+        if kind == "date":
+            distinct = f"COUNT(DISTINCT {column})" if exact else self.approx_distinct_expr(column)
+            return f"MIN({column})", f"MAX({column})", distinct
+        raise ValueError(f"Unknown column kind: {kind}")
+
+    def approx_distinct_expr(self, column: str) -> str:
+        """
+        Generate SQL for an approximate (HyperLogLog) distinct count.
+
+        Args:
+            column: Column name
+
+        Returns:
+            SQL fragment for approximate distinct count, or an exact
+            COUNT(DISTINCT) on dialects without an HLL aggregate
+        """
+        return f"COUNT(DISTINCT {column})"
+
+    def row_hash_expr(self, columns: List[str]) -> Optional[str]:
+        """
+        Generate SQL for a compact hash over all the given columns of a row.
+
+        Args:
+            columns: Column names to include in the hash
+
+        Returns:
+            SQL expression hashing the row, or None if the dialect has no
+            suitable function (callers should fall back to GROUP BY)
+        """
+        return None
+
+    def fast_row_count(self, conn, table: str) -> Optional[int]:
+        """
+        Get the row count of a table from catalog metadata without scanning it.
+
+        Args:
+            conn: Open SQLAlchemy connection
+            table: Table name, optionally schema-qualified
+
+        Returns:
+            Exact row count from metadata, or None if the platform does not
+            expose one (callers should fall back to COUNT(*))
+        """
+        return None
+
     def is_numeric_type(self, col_type: str) -> bool:
         """
         Check if a column type is numeric.
@@ -153,8 +339,7 @@ class SqlAdapter:
         Returns:
             True if the column type is numeric, False otherwise
         """
-        col_type = col_type.lower()
-        return any(t in col_type for t in ['int', 'float', 'numeric', 'double', 'decimal', 'number'])
+        return _is_numeric_type(col_type)
 
     def is_date_type(self, col_type: str) -> bool:
         """
@@ -166,8 +351,7 @@ class SqlAdapter:
         Returns:
             True if the column type is a date/time type, False otherwise
         """
-        col_type = col_type.lower()
-        return any(t in col_type for t in ['date', 'time', 'timestamp'])
+        return _is_date_type(col_type)
 
     def is_text_type(self, col_type: str) -> bool:
         """
@@ -179,22 +363,34 @@ class SqlAdapter:
         Returns:
             True if the column type is a text type, False otherwise
         """
-        col_type = col_type.lower()
-        return any(t in col_type for t in ['varchar', 'char', 'text', 'string'])
+        return _is_text_type(col_type)
 
 
 class SnowflakeAdapter(SqlAdapter):
     """Adapter for Snowflake."""
 
+    # Snowflake accepts PRIMARY KEY constraints but does not enforce them
+    enforces_primary_keys = False
+
     def percentile_query(self, column: str, percentile: float) -> str:
         return f"PERCENTILE_CONT({percentile}) WITHIN GROUP (ORDER BY {column})"
 
+    def percentile_aggregate(self, column: str, percentile: float) -> Optional[str]:
+        # t-digest based, avoids the sort PERCENTILE_CONT needs
+        return f"APPROX_PERCENTILE({column}, {percentile})"
+
     def regex_match(self, column: str, pattern: str) -> str:
         return f"REGEXP_LIKE({column}, '{pattern}')"
 
     def date_diff(self, unit: str, start_date: str, end_date: str) -> str:
         return f"DATEDIFF('{unit}', {start_date}, {end_date})"
 
+    def row_hash_expr(self, columns: List[str]) -> Optional[str]:
+        return f"HASH({', '.join(columns)})"
+
+    def approx_distinct_expr(self, column: str) -> str:
+        return f"APPROX_COUNT_DISTINCT({column})"
+
     def length_function(self, column: str) -> str:
         return f"LENGTH({column})"
 
@@ -208,6 +404,36 @@ class SnowflakeAdapter(SqlAdapter):
     def aggregate_array(self, column: str) -> str:
         return f"ARRAY_AGG({column})"
 
+    def fast_row_count(self, conn, table: str) -> Optional[int]:
+        # ROW_COUNT is maintained by Snowflake's metadata layer and is exact for
+        # tables; it is NULL for views, in which case we fall back to COUNT(*)
+        raw_parts = table.split('.')
+        parts = [p.strip('"') if p.startswith('"') else p.upper() for p in raw_parts]
+        table_name = parts[-1]
+        if len(parts) > 1:
+            schema_filter = "TABLE_SCHEMA = :schema"
+            params = {"table": table_name, "schema": parts[-2]}
+        else:
+            schema_filter = "TABLE_SCHEMA = CURRENT_SCHEMA()"
+            params = {"table": table_name}
+        # A database-qualified table is looked up in that database's catalog,
+        # not the current database's
+        catalog = "INFORMATION_SCHEMA"
+        if len(parts) > 2:
+            catalog = f"{self.quote_identifier(raw_parts[-3])}.{catalog}"
+
+        query = f"""
+        SELECT ROW_COUNT FROM {catalog}.TABLES
+        WHERE TABLE_NAME = :table AND {schema_filter}
+        """
+        try:
+            result = conn.execute(text(query), params).fetchone()
+        except Exception:
+            return None
+        if result is None or result[0] is None:
+            return None
+        return int(result[0])
+
     def optimize_query(self, query: str) -> str:
         """Apply Snowflake-specific query optimizations."""
         # This can be expanded with more optimizations
@@ -220,12 +446,18 @@ class DuckDBAdapter(SqlAdapter):
     def percentile_query(self, column: str, percentile: float) -> str:
         return f"PERCENTILE_CONT({percentile}) WITHIN GROUP (ORDER BY {column})"
 
+    def percentile_aggregate(self, column: str, percentile: float) -> Optional[str]:
+        return self.percentile_query(column, percentile)
+
     def regex_match(self, column: str, pattern: str) -> str:
         return f"{column} ~ '{pattern}'"
 
     def date_diff(self, unit: str, start_date: str, end_date: str) -> str:
         return f"DATEDIFF('{unit}', {start_date}, {end_date})"
 
+    def row_hash_expr(self, columns: List[str]) -> Optional[str]:
+        return f"HASH({', '.join(columns)})"
+
     def length_function(self, column: str) -> str:
         return f"LENGTH({column})"
 
@@ -242,6 +474,9 @@ class PostgresAdapter(SqlAdapter):
     def percentile_query(self, column: str, percentile: float) -> str:
         return f"PERCENTILE_CONT({percentile}) WITHIN GROUP (ORDER BY {column})"
 
+    def percentile_aggregate(self, column: str, percentile: float) -> Optional[str]:
+        return self.percentile_query(column, percentile)
+
     def regex_match(self, column: str, pattern: str) -> str:
         return f"{column} ~ '{pattern}'"
 
@@ -256,6 +491,9 @@ class PostgresAdapter(SqlAdapter):
             # Default to days
             return f"DATE_PART('day', {end_date}::timestamp - {start_date}::timestamp)"
 
+    def row_hash_expr(self, columns: List[str]) -> Optional[str]:
+        return f"MD5(ROW({', '.join(columns)})::text)"
+
     def length_function(self, column: str) -> str:
         return f"LENGTH({column})"
 
@@ -269,6 +507,9 @@ class PostgresAdapter(SqlAdapter):
 class RedshiftAdapter(SqlAdapter):
     """Adapter for Amazon Redshift."""
 
+    # Redshift primary keys are informational only
+    enforces_primary_keys = False
+
     def percentile_query(self, column: str, percentile: float) -> str:
         # Redshift does not support PERCENTILE_CONT directly, use approximate percentile
         return f"APPROXIMATE PERCENTILE_DISC({percentile}) WITHIN GROUP (ORDER BY {column})"
@@ -281,6 +522,9 @@ class RedshiftAdapter(SqlAdapter):
         # Redshift uses DATEDIFF function
         return f"DATEDIFF({unit}, {start_date}, {end_date})"
 
+    def approx_distinct_expr(self, column: str) -> str:
+        return f"APPROXIMATE COUNT(DISTINCT {column})"
+
     def length_function(self, column: str) -> str:
         return f"LEN({column})"
 
@@ -299,10 +543,19 @@ class RedshiftAdapter(SqlAdapter):
 class BigQueryAdapter(SqlAdapter):
     """Adapter for Google BigQuery."""
 
+    identifier_quote = "`"
+
+    # BigQuery primary keys are declared NOT ENFORCED
+    enforces_primary_keys = False
+
     def percentile_query(self, column: str, percentile: float) -> str:
         # BigQuery uses PERCENTILE_CONT for percentile calculation
         return f"PERCENTILE_CONT({column}, {percentile}) OVER()"
 
+    def percentile_aggregate(self, column: str, percentile: float) -> Optional[str]:
+        # PERCENTILE_CONT is analytic-only in BigQuery; APPROX_QUANTILES is an aggregate
+        return f"APPROX_QUANTILES({column}, 100)[OFFSET({int(round(percentile * 100))})]"
+
     def regex_match(self, column: str, pattern: str) -> str:
         # BigQuery uses REGEXP_CONTAINS for regex matching
         return f"REGEXP_CONTAINS({column}, r'{pattern}')"
@@ -312,6 +565,15 @@ class BigQueryAdapter(SqlAdapter):
         bq_unit = unit.upper()
         return f"DATE_DIFF({end_date}, {start_date}, {bq_unit})"
 
+    def row_hash_expr(self, columns: List[str]) -> Optional[str]:
+        return f"FARM_FINGERPRINT(TO_JSON_STRING(STRUCT({', '.join(columns)})))"
+
+    def approx_distinct_expr(self, column: str) -> str:
+        return f"APPROX_COUNT_DISTINCT({column})"
+
+    def cast_to_text(self, column: str) -> str:
+        return f"CAST({column} AS STRING)"
+
     def length_function(self, column: str) -> str:
         return f"LENGTH({column})"
 
@@ -399,6 +661,27 @@ def is_supported_dialect(dialect_name: str) -> bool:
     return any(s in dialect_name for s in supported)
 
 
+@functools.lru_cache(maxsize=64)
+def _adapter_for_dialect(dialect: str) -> SqlAdapter:
+    """Return the shared adapter for a lowercase dialect name."""
+    # Prioritize Snowflake as the default
+    if 'snowflake' in dialect:
+        return SnowflakeAdapter()
+    elif 'postgres' in dialect:
+        return PostgresAdapter()
+    elif 'redshift' in dialect:
+        return RedshiftAdapter()
+    elif 'bigquery' in dialect:
+        return BigQueryAdapter()
+    elif 'duckdb' in dialect:
+        return DuckDBAdapter()
+    elif 'sqlite' in dialect:
+        return SQLiteAdapter()
+    else:
+        # Default to a generic adapter
+        return GenericAdapter()
+
+
 def get_adapter_for_connection(connection_string_or_engine) -> SqlAdapter:
     """Get the appropriate adapter for a connection string or engine."""
     return SqlAdapter.get_adapter(connection_string_or_engine)
\ No newline at end of file
@@ -1,19 +1,23 @@
 """
 Connection management module for database adapters with Snowflake optimizations.
 """
+import atexit
+import functools
+import hashlib
 import os
+import threading
 import urllib.parse
 from typing import Dict, Any, Optional, Union
 
-from sqlalchemy import create_engine
-from sqlalchemy.engine import Engine
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.pool import NullPool
 
 from sparvi.db.adapters import get_adapter_for_connection
 
 # Default configuration for Snowflake
 SNOWFLAKE_CONFIG = {
-    "warehouse_size": "X-SMALL",
+    "warehouse_size": "X-SMALL",  # Preferred size when picking a running warehouse
     "timeout": 60,
     "role": None,  # Default to user's default role
     "query_tag": "Sparvi_Profiler",
@@ -23,6 +27,9 @@ SNOWFLAKE_CONFIG = {
 class ConnectionManager:
     """Base connection manager class for database connections."""
 
+    # Pool class get_engine uses when none is given; None for the dialect's default
+    default_poolclass = None
+
     def __init__(self, connection_string: str):
         """
         Initialize connection manager with a connection string.
@@ -53,10 +60,27 @@ class ConnectionManager:
         """
         return create_engine(self.connection_string, **kwargs)
 
+    def pool_class(self) -> type:
+        """
+        Get the pool class get_engine uses when no poolclass is given.
+
+        Callers can tell from it whether sizing options such as pool_size
+        apply; only QueuePool and its subclasses accept them.
+
+        Returns:
+            Pool subclass
+        """
+        if self.default_poolclass is not None:
+            return self.default_poolclass
+        url = make_url(self.connection_string)
+        return url.get_dialect().get_pool_class(url)
+
 
 class SnowflakeConnectionManager(ConnectionManager):
     """Manages Snowflake connections with optimized settings."""
 
+    default_poolclass = NullPool
+
     def __init__(self, connection_string: str):
         """
         Initialize Snowflake connection manager.
@@ -67,14 +91,23 @@ class SnowflakeConnectionManager(ConnectionManager):
         """
         super().__init__(connection_string)
         self._parse_connection_params()
+        # Snowflake-specific connection arguments; session parameters are
+        # applied at login, so no ALTER SESSION round trip is needed later
+        self._connect_args = {
+            "application": "Sparvi",
+            "session_parameters": {
+                "QUERY_TAG": SNOWFLAKE_CONFIG["query_tag"],
+                "USE_CACHED_RESULT": True
+            }
+        }
 
     def _parse_connection_params(self) -> None:
         """Parse connection parameters from the connection string."""
         try:
-            # Extract parts of the connection string
-            parts = self.connection_string.split("://")[1].split("@")
-            auth_part = parts[0]
-            location_part = parts[1]
+            # One urlsplit call; the account is taken from the raw netloc
+            # because SplitResult.hostname lowercases it
+            url = urllib.parse.urlsplit(self.connection_string)
+            auth_part, _, account = url.netloc.rpartition("@")
 
             # Extract user and password
             if ":" in auth_part:
@@ -84,23 +117,16 @@ class SnowflakeConnectionManager(ConnectionManager):
                 self.params["password"] = None
 
             # Extract account, database, schema
-            location_parts = location_part.split("/")
-            self.params["account"] = location_parts[0]
-
+            self.params["account"] = account
+            location_parts = url.path.lstrip("/").split("/") if url.path.strip("/") else []
+            if len(location_parts) > 0:
+                self.params["database"] = location_parts[0]
             if len(location_parts) > 1:
-                self.params["database"] = location_parts[1]
-
-            if len(location_parts) > 2:
-                # Handle schema and query parameters
-                schema_and_params = location_parts[2]
-                if "?" in schema_and_params:
-                    self.params["schema"], query_string = schema_and_params.split("?", 1)
-                    query_params = urllib.parse.parse_qs(query_string)
-                    # Convert lists to single values
-                    for key, value in query_params.items():
-                        self.params[key] = value[0] if len(value) == 1 else value
-                else:
-                    self.params["schema"] = schema_and_params
+                self.params["schema"] = location_parts[1]
+
+            # Convert lists to single values
+            for key, value in urllib.parse.parse_qs(url.query).items():
+                self.params[key] = value[0] if len(value) == 1 else value
 
         except Exception as e:
             # In case of parsing errors, just leave params empty
@@ -118,18 +144,15 @@ class SnowflakeConnectionManager(ConnectionManager):
         """
         connect_args = kwargs.pop("connect_args", {})
 
-        # Add Snowflake-specific connection arguments
-        connect_args.update({
-            "application": "Sparvi",
-            "session_parameters": {
-                "QUERY_TAG": SNOWFLAKE_CONFIG["query_tag"]
-            }
-        })
+        # Add the Snowflake-specific connection arguments built at init
+        connect_args.update(self._connect_args)
 
-        # Set default warehouse if not specified
+        # Pick a warehouse if not specified; if none can be picked the user's
+        # default warehouse applies
         if "warehouse" not in self.params and not connect_args.get("warehouse"):
-            warehouse = kwargs.pop("warehouse", SNOWFLAKE_CONFIG["warehouse_size"])
-            connect_args["warehouse"] = warehouse
+            warehouse = kwargs.pop("warehouse", None) or pick_snowflake_warehouse(self.connection_string)
+            if warehouse:
+                connect_args["warehouse"] = warehouse
 
         # Set role if specified
         if SNOWFLAKE_CONFIG["role"] and "role" not in connect_args:
@@ -143,7 +166,7 @@ class SnowflakeConnectionManager(ConnectionManager):
         return create_engine(
             self.connection_string,
             connect_args=connect_args,
-            poolclass=kwargs.pop("poolclass", NullPool),  # Default to NullPool for Snowflake
+            poolclass=kwargs.pop("poolclass", self.default_poolclass),  # Default to NullPool for Snowflake
             **kwargs
         )
 
@@ -195,6 +218,8 @@ class PostgresConnectionManager(ConnectionManager):
 class BigQueryConnectionManager(ConnectionManager):
     """Manages BigQuery connections."""
 
+    default_poolclass = NullPool  # BigQuery works well with NullPool
+
     def get_engine(self, **kwargs) -> Engine:
         """
         Create SQLAlchemy engine for BigQuery with optimizations.
@@ -223,7 +248,7 @@ class BigQueryConnectionManager(ConnectionManager):
         return create_engine(
             self.connection_string,
             connect_args=connect_args,
-            poolclass=kwargs.pop("poolclass", NullPool),  # BigQuery works well with NullPool
+            poolclass=kwargs.pop("poolclass", self.default_poolclass),
             **kwargs
         )
 
@@ -263,6 +288,52 @@ class RedshiftConnectionManager(ConnectionManager):
         )
 
 
+# Warehouse sizes from smallest to largest, as reported by SHOW WAREHOUSES
+_WAREHOUSE_SIZES = (
+    "X-SMALL", "SMALL", "MEDIUM", "LARGE", "X-LARGE",
+    "2X-LARGE", "3X-LARGE", "4X-LARGE", "5X-LARGE", "6X-LARGE",
+)
+
+
+@functools.lru_cache(maxsize=8)
+def pick_snowflake_warehouse(connection_string: str) -> Optional[str]:
+    """
+    Pick a running Snowflake warehouse for a connection without one.
+
+    Runs SHOW WAREHOUSES once per connection string (cached for the process)
+    and returns the smallest warehouse that is already started, preferring
+    the configured size, so profiling never waits for a cold warehouse to resume.
+
+    Args:
+        connection_string: Snowflake connection string without a warehouse
+
+    Returns:
+        Warehouse name, or None if no started warehouse is visible or the
+        lookup fails
+    """
+    try:
+        engine = create_engine(connection_string, poolclass=NullPool)
+        try:
+            with engine.connect() as conn:
+                rows = conn.execute(text("SHOW WAREHOUSES")).fetchall()
+        finally:
+            engine.dispose()
+    except Exception:
+        return None
+
+    started = []
+    for row in rows:
+        info = {str(key).lower(): value for key, value in row._mapping.items()}
+        if str(info.get("state", "")).upper() != "STARTED":
+            continue
+        size = str(info.get("size", "")).upper()
+        rank = _WAREHOUSE_SIZES.index(size) if size in _WAREHOUSE_SIZES else len(_WAREHOUSE_SIZES)
+        other_size = size != SNOWFLAKE_CONFIG["warehouse_size"]
+        started.append((other_size, rank, info.get("name")))
+
+    return min(started)[2] if started else None
+
+
 def get_connection_manager(connection_string: str) -> ConnectionManager:
     """
     Factory function to get the appropriate connection manager.
@@ -302,4 +373,53 @@ def create_db_engine(connection_string: str, **kwargs) -> Engine:
         SQLAlchemy Engine instance
     """
     manager = get_connection_manager(connection_string)
-    return manager.get_engine(**kwargs)
\ No newline at end of file
+    return manager.get_engine(**kwargs)
+
+
+# Engines shared by the whole process, keyed by a digest of the connection
+# string and engine options so credentials are not kept as dictionary keys
+_ENGINE_CACHE: Dict[str, Engine] = {}
+_ENGINE_CACHE_LOCK = threading.Lock()
+
+
+def get_or_create_engine(connection_string: str, **kwargs) -> Engine:
+    """
+    Get the process-wide engine for a connection string, creating it once.
+
+    Engine creation, dialect initialization and the first login (hundreds of
+    milliseconds on Snowflake) are paid once per process; later calls reuse
+    the engine and its connection pool. Engines are disposed at exit.
+
+    Args:
+        connection_string: Database connection string
+        **kwargs: Additional arguments to pass to the connection manager;
+            calls with different arguments get different engines
+
+    Returns:
+        SQLAlchemy Engine instance
+    """
+    key = hashlib.sha1(f"{connection_string}\0{sorted(kwargs.items())!r}".encode()).hexdigest()
+    with _ENGINE_CACHE_LOCK:
+        engine = _ENGINE_CACHE.get(key)
+    if engine is not None:
+        return engine
+
+    # Build the engine outside the lock: creating one can log in (e.g. to pick
+    # a Snowflake warehouse), which must not hold up lookups for other engines
+    created = create_db_engine(connection_string, **kwargs)
+    with _ENGINE_CACHE_LOCK:
+        engine = _ENGINE_CACHE.setdefault(key, created)
+    if engine is not created:
+        # Another thread cached an engine for the same key first
+        created.dispose()
+    return engine
+
+
+@atexit.register
+def dispose_engines() -> None:
+    """Dispose and forget every engine created by get_or_create_engine."""
+    with _ENGINE_CACHE_LOCK:
+        engines = list(_ENGINE_CACHE.values())
+        _ENGINE_CACHE.clear()
+    for engine in engines:
+        engine.dispose()
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""
+Table reflection helpers shared by the profiler and the validation rule generator.
+"""
+from typing import Dict, Iterable, List, Optional
+
+from sqlalchemy import inspect
+
+from sparvi.cache import TableSchema
+
+try:
+    # SQLAlchemy 2.0+: lets the get_multi_* methods reflect views too
+    from sqlalchemy.engine import ObjectKind
+except ImportError:
+    ObjectKind = None
+
+
+def fk_columns(foreign_keys: List[Dict]) -> List[str]:
+    """Flatten reflected foreign key constraints into their column names."""
+    columns = []
+    for fk in foreign_keys:
+        if 'constrained_columns' in fk and fk['constrained_columns']:
+            columns.extend(fk['constrained_columns'])
+    return columns
+
+
+def reflect_table(inspector, table_name: str, schema: Optional[str] = None) -> TableSchema:
+    """
+    Reflect one table's columns, primary key and foreign key columns
+
+    Args:
+        inspector: SQLAlchemy Inspector
+        table_name: Table name
+        schema: Optional schema the table lives in
+
+    Returns:
+        TableSchema
+    """
+    columns = inspector.get_columns(table_name, schema=schema)
+    try:
+        primary_keys = inspector.get_pk_constraint(table_name, schema=schema).get('constrained_columns') or []
+    except Exception:
+        # Not every dialect/privilege level can reflect constraints
+        primary_keys = []
+    try:
+        foreign_keys = fk_columns(inspector.get_foreign_keys(table_name, schema=schema))
+    except Exception:
+        # Some databases might not support foreign key inspection
+        foreign_keys = []
+    return TableSchema(columns, primary_keys, foreign_keys)
+
+
+def reflect_many(engine, tables: Iterable[str], schema: Optional[str] = None,
+                 inspector=None) -> Dict[str, TableSchema]:
+    """
+    Reflect several tables of one schema at once
+
+    On SQLAlchemy 2.0+ the Inspector's get_multi_* methods read all tables'
+    columns, primary keys and foreign keys with one call each (a single
+    information schema scan on Snowflake) instead of three per table. Older
+    versions fall back to reflecting the tables one by one. Views and
+    materialized views are reflected alongside tables.
+
+    Args:
+        engine: SQLAlchemy Engine or Connection
+        tables: Table names
+        schema: Optional schema the tables live in
+        inspector: Optional Inspector to reuse instead of inspecting the engine
+
+    Returns:
+        Dictionary mapping each table name to its TableSchema
+
+    Raises:
+        NoSuchTableError: If one of the tables does not exist
+    """
+    tables = list(tables)
+    inspector = inspector or inspect(engine)
+
+    if ObjectKind is None or not hasattr(inspector, 'get_multi_columns'):
+        return {table: reflect_table(inspector, table, schema) for table in tables}
+
+    kind = ObjectKind.ANY
+    multi_columns = inspector.get_multi_columns(schema=schema, filter_names=tables, kind=kind)
+    multi_pks = inspector.get_multi_pk_constraint(schema=schema, filter_names=tables, kind=kind)
+    try:
+        multi_fks = inspector.get_multi_foreign_keys(schema=schema, filter_names=tables, kind=kind)
+    except Exception:
+        # Some databases might not support foreign key inspection
+        multi_fks = {}
+
+    reflected = {}
+    for table in tables:
+        key = (schema, table)
+        if key not in multi_columns:
+            # Not returned by the bulk pass (e.g. an object kind the dialect
+            # does not list); reflect it alone, which raises NoSuchTableError
+            # if it does not exist
+            reflected[table] = reflect_table(inspector, table, schema)
+            continue
+        reflected[table] = TableSchema(
+            multi_columns[key],
+            (multi_pks.get(key) or {}).get('constrained_columns', []),
+            fk_columns(multi_fks.get(key, [])),
+        )
+    return reflected
@@ -2,23 +2,810 @@
 Enhanced profile engine with Snowflake optimizations.
 """
 import datetime
-import json
+import functools
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
 from typing import Dict, Any, List, Optional, Tuple, Union
 
 import pandas as pd
 import numpy as np
 from sqlalchemy import create_engine, inspect, text
 
+from sparvi.cache import TableSchema, lookup_table_schema, store_table_schema
 from sparvi.db.adapters import get_adapter_for_connection
-from sparvi.db.connection import create_db_engine
+from sparvi.db.reflection import reflect_many, reflect_table
+from sparvi.db.connection import get_or_create_engine
 from sparvi.utils.env import get_snowflake_connection_from_env
 
+# Projection for the per-column null count in the fused metrics query
+_NULL_COUNT_TEMPLATE = "SUM(CASE WHEN {0} IS NULL THEN 1 ELSE 0 END)"
+# Projection for the per-column distinct count when profiling with exact=True
+_EXACT_DISTINCT_TEMPLATE = "COUNT(DISTINCT {0})"
+
+# Anomaly detection: a value is anomalous when it deviates from the historical
+# mean by more than ANOMALY_STD_THRESHOLD standard deviations, and by more than
+# a minimum tolerance so a short, flat history does not flag every change
+ANOMALY_STD_THRESHOLD = 3.0
+ROW_COUNT_TOLERANCE = 0.1  # Fraction of the historical mean
+NULL_RATE_TOLERANCE = 5.0  # Percentage points
+MAX_TREND_POINTS = 50
+
+_QUARTILES = (0.25, 0.5, 0.75)
+
+# Value patterns counted for text columns, as (text_patterns key, regex)
+_TEXT_PATTERNS = (
+    ("email_pattern_count", ".*@.*\\..*"),
+    ("numeric_pattern_count", "^[0-9]+$"),
+    ("date_pattern_count", "^[0-9]{2,4}[/-][0-9]{1,2}[/-][0-9]{1,2}$"),
+)
+
+
+def _coerce(value: Any) -> Any:
+    """
+    Convert driver/NumPy scalar types into plain JSON-friendly Python values.
+
+    Args:
+        value: Value returned by the database driver
+
+    Returns:
+        The value as int, float, bool or ISO-8601 string where applicable,
+        otherwise the value unchanged
+    """
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return float(value)
+    if isinstance(value, np.bool_):
+        return bool(value)
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    return value
+
+
+def _get_engine(connection_str: str):
+    """
+    Get the shared engine for a connection string.
+
+    Repeated profiles reuse the process-wide engine and its connection pool
+    instead of re-resolving the dialect and reconnecting every call.
+    Pre-ping discards pooled connections that went stale between calls.
+
+    Args:
+        connection_str: Database connection string
+
+    Returns:
+        SQLAlchemy Engine instance
+    """
+    return get_or_create_engine(connection_str, pool_pre_ping=True)
+
+
+def _introspect_columns(
+        connection_str: str,
+        table: str
+) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Read a table's columns and primary key and categorize the columns by type.
+
+    The reflected schema is shared with rule generation through sparvi.cache,
+    so it is read again once it expires or after ``sparvi.cache.clear()``.
+
+    Args:
+        connection_str: Database connection string
+        table: Table name
+
+    Returns:
+        Tuple of (column_names, numeric_cols, text_cols, date_cols, pk_cols)
+    """
+    engine = _get_engine(connection_str)
+    adapter = get_adapter_for_connection(engine)
+    schema_info = lookup_table_schema(connection_str, None, table)
+    if schema_info is None:
+        try:
+            schema_info = reflect_table(inspect(engine), table)
+        except Exception as e:
+            raise ValueError(f"Error inspecting table {table}: {str(e)}. Check if the table exists and you have access.")
+        store_table_schema(connection_str, None, table, schema_info)
+
+    return _column_layout(type(adapter), schema_info.columns, schema_info.primary_keys)
+
+
+def _column_layout(
+        adapter_cls,
+        columns: List[Dict[str, Any]],
+        pk_cols
+) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Categorize reflected columns by type.
+
+    Args:
+        adapter_cls: SqlAdapter subclass for the connection
+        columns: Column dictionaries as returned by the Inspector
+        pk_cols: Primary key column names, or None
+
+    Returns:
+        Tuple of (column_names, numeric_cols, text_cols, date_cols, pk_cols)
+    """
+    schema = tuple((col["name"], str(col["type"])) for col in columns)
+    column_names = tuple(name for name, _ in schema)
+    numeric_cols, text_cols, date_cols = _classify_columns(adapter_cls, schema)
+
+    return column_names, numeric_cols, text_cols, date_cols, tuple(pk_cols or ())
+
+
+@functools.lru_cache(maxsize=256)
+def _classify_columns(
+        adapter_type: type,
+        schema: Tuple[Tuple[str, str], ...]
+) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Categorize columns by type using the adapter's type checks.
+
+    Cached on the (name, type) schema fingerprint, so tables that share a
+    schema, such as date-partitioned copies, are classified once.
+
+    Args:
+        adapter_type: SqlAdapter subclass for the dialect
+        schema: Tuple of (column name, column type) pairs
+
+    Returns:
+        Tuple of (numeric_cols, text_cols, date_cols)
+    """
+    adapter = adapter_type()
+
+    numeric_cols = tuple(name for name, col_type in schema if adapter.is_numeric_type(col_type))
+    text_cols = tuple(name for name, col_type in schema if adapter.is_text_type(col_type))
+    date_cols = tuple(name for name, col_type in schema if adapter.is_date_type(col_type))
+
+    return numeric_cols, text_cols, date_cols
+
+
+# Fused metrics statement for one table layout: the select lists with and
+# without fused quartiles, and where each metric group starts in the result row
+# (scan_count_index and hash_index are None when the query does not carry them)
+MetricsPlan = namedtuple(
+    "MetricsPlan",
+    "select_list percentile_select_list fused_percentile_cols scan_count_index null_offset "
+    "distinct_offset numeric_offset text_offset date_offset hash_index percentile_offset"
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _metrics_plan(
+        adapter_type: type,
+        layout: Tuple[Tuple[str, ...], ...],
+        count_rows: bool,
+        check_duplicates: bool,
+        exact: bool
+) -> MetricsPlan:
+    """
+    Build the fused metrics select list for a table layout.
+
+    Cached on the layout, so tables that share a schema, such as
+    date-partitioned copies, reuse one prebuilt statement and only substitute
+    their table name.
+
+    Args:
+        adapter_type: SqlAdapter subclass for the dialect
+        layout: Column layout as returned by _column_layout
+        count_rows: Whether the row count has to be computed by the scan
+        check_duplicates: Whether to count distinct row hashes for duplicates
+        exact: Count distinct values exactly instead of estimating them
+
+    Returns:
+        MetricsPlan
+    """
+    adapter = adapter_type()
+    column_names, numeric_cols, text_cols, date_cols, _ = layout
+
+    quoted = {col: adapter.quote_identifier(col) for col in column_names}
+    qcols = tuple(quoted.values())
+
+    # Fuse row count, null counts, distinct counts and the simple numeric/text/date
+    # aggregates into one statement: a single table scan and a single round trip
+    projections = ["COUNT(*)"] if count_rows else []
+    null_offset = len(projections)
+    projections.extend(map(_NULL_COUNT_TEMPLATE.format, qcols))
+    distinct_offset = len(projections)
+    distinct_expr = _EXACT_DISTINCT_TEMPLATE.format if exact else adapter.approx_distinct_expr
+    projections.extend(map(distinct_expr, qcols))
+    numeric_offset = len(projections)
+    for col in numeric_cols:
+        projections.extend(adapter.column_stat_exprs(quoted[col], "numeric"))
+    text_offset = len(projections)
+    for col in text_cols:
+        projections.extend(adapter.column_stat_exprs(quoted[col], "text"))
+    date_offset = len(projections)
+    for col in date_cols:
+        projections.extend(adapter.column_stat_exprs(quoted[col], "date", exact))
+
+    # Duplicate rows are counted as COUNT(*) - distinct row hashes so the
+    # aggregation only carries a fixed-width hash instead of the whole row.
+    # Both counts come from this scan, never from a metadata row count
+    row_hash = adapter.row_hash_expr(qcols) if check_duplicates else None
+    scan_count_index = 0 if count_rows else None
+    hash_index = None
+    if row_hash is not None:
+        if scan_count_index is None:
+            scan_count_index = len(projections)
+            projections.append("COUNT(*)")
+        hash_index = len(projections)
+        projections.append(f"COUNT(DISTINCT {row_hash})")
+
+    # Quartiles are folded into the same scan where the dialect has a plain
+    # percentile aggregate; the rest fall back to a per-column query
+    percentile_offset = len(projections)
+    percentile_projections = []
+    fused_percentile_cols = []
+    for col in numeric_cols:
+        exprs = [adapter.percentile_aggregate(quoted[col], q) for q in _QUARTILES]
+        if None not in exprs:
+            percentile_projections.extend(exprs)
+            fused_percentile_cols.append(col)
+
+    return MetricsPlan(
+        ", ".join(projections),
+        ", ".join(projections + percentile_projections) if percentile_projections else None,
+        tuple(fused_percentile_cols),
+        scan_count_index,
+        null_offset,
+        distinct_offset,
+        numeric_offset,
+        text_offset,
+        date_offset,
+        hash_index,
+        percentile_offset
+    )
+
+
+def _percentiles_for_column(engine, adapter, table: str, col: str) -> Dict[str, Any]:
+    """
+    Calculate quartiles for a numeric column on its own connection.
+
+    Args:
+        engine: SQLAlchemy engine
+        adapter: SQL adapter for the engine's dialect
+        table: Quoted table name
+        col: Quoted numeric column name
+
+    Returns:
+        Dictionary with q1, median and q3 (None on failure)
+    """
+    stats = {"q1": None, "median": None, "q3": None}
+    try:
+        # Use appropriate SQL via adapter for percentiles
+        median_expr = adapter.percentile_query(col, 0.5)
+        q1_expr = adapter.percentile_query(col, 0.25)
+        q3_expr = adapter.percentile_query(col, 0.75)
+
+        percentile_query = f"""
+        SELECT 
+            {q1_expr} as q1,
+            {median_expr} as median,
+            {q3_expr} as q3
+        FROM {table}
+        WHERE {col} IS NOT NULL
+        """
+
+        with engine.connect() as conn:
+            result = conn.execute(text(percentile_query)).fetchone()
+        if result:
+            stats["q1"] = _coerce(result[0])
+            stats["median"] = _coerce(result[1])
+            stats["q3"] = _coerce(result[2])
+    except Exception as e:
+        print(f"Error calculating percentiles for {col}: {str(e)}")
+    return stats
+
+
+def _pattern_projections(adapter, col: str) -> List[str]:
+    """Build one SUM(CASE ...) match count per entry of _TEXT_PATTERNS for a column."""
+    return [
+        f"SUM(CASE WHEN {adapter.regex_match(col, pattern)} THEN 1 ELSE 0 END)"
+        for _, pattern in _TEXT_PATTERNS
+    ]
+
+
+def _pattern_counts(values) -> Dict[str, int]:
+    """Map match counts, in _TEXT_PATTERNS order, to the text_patterns keys."""
+    return {key: _coerce(value) or 0 for (key, _), value in zip(_TEXT_PATTERNS, values)}
+
+
+def _text_patterns_for_column(engine, adapter, table: str, col: str) -> Dict[str, int]:
+    """
+    Count common value patterns in a text column on its own connection.
+
+    Args:
+        engine: SQLAlchemy engine
+        adapter: SQL adapter for the engine's dialect
+        table: Quoted table name
+        col: Quoted text column name
+
+    Returns:
+        Dictionary of email, numeric and date pattern counts
+    """
+    try:
+        pattern_query = f"""
+        SELECT {', '.join(_pattern_projections(adapter, col))}
+        FROM {table}
+        WHERE {col} IS NOT NULL
+        """
+
+        with engine.connect() as conn:
+            result = conn.execute(text(pattern_query)).fetchone()
+        if result:
+            return _pattern_counts(result)
+    except Exception as e:
+        print(f"Error analyzing text patterns for {col}: {str(e)}")
+    return _pattern_counts(())
+
+
+def _text_patterns(engine, adapter, table: str, columns: Dict[str, str]) -> Dict[str, Dict[str, int]]:
+    """
+    Count common value patterns for all text columns in a single scan.
+
+    The regex aggregates run in their own statement rather than the fused
+    metrics query, since regex support varies by dialect and a failure here
+    should not lose the other metrics. Falls back to one query per column if
+    the batch fails.
+
+    Args:
+        engine: SQLAlchemy engine
+        adapter: SQL adapter for the engine's dialect
+        table: Quoted table name
+        columns: Mapping of text column name to quoted identifier
+
+    Returns:
+        Dictionary mapping column name to its pattern counts
+    """
+    if not columns:
+        return {}
+
+    projections = []
+    for qcol in columns.values():
+        projections.extend(_pattern_projections(adapter, qcol))
+
+    try:
+        with engine.connect() as conn:
+            result = conn.execute(text(f"SELECT {', '.join(projections)} FROM {table}")).fetchone()
+        width = len(_TEXT_PATTERNS)
+        return {
+            col: _pattern_counts(result[i * width:(i + 1) * width])
+            for i, col in enumerate(columns)
+        }
+    except Exception as e:
+        print(f"Error analyzing text patterns in batch, retrying per column: {str(e)}")
+        return {
+            col: _text_patterns_for_column(engine, adapter, table, qcol)
+            for col, qcol in columns.items()
+        }
+
+
+def _date_stats(conn, adapter, ranges: Dict[str, tuple]) -> Dict[str, Dict[str, Any]]:
+    """
+    Build date column stats from their fused MIN/MAX/COUNT(DISTINCT) values.
+
+    The day spans of all columns are computed by one constant SELECT.
+
+    Args:
+        conn: Open SQLAlchemy connection
+        adapter: SQL adapter for the engine's dialect
+        ranges: Column name -> (min_date, max_date, distinct_count)
+
+    Returns:
+        Dictionary mapping each column to min_date, max_date, distinct_count
+        and date_range_days
+    """
+    stats = {
+        col: {"min_date": None, "max_date": None, "distinct_count": 0, "date_range_days": None}
+        for col in ranges
+    }
+    spans = [(col, min_date, max_date) for col, (min_date, max_date, _) in ranges.items()
+             if min_date and max_date]
+    if not spans:
+        return stats
+
+    # Use adapter-specific date diff function; the dates are bound as
+    # parameters so the driver passes them with their date/timestamp type
+    try:
+        diff_query = "SELECT " + ", ".join(
+            adapter.date_diff('day', f"(:start_{i})", f"(:end_{i})") for i in range(len(spans))
+        )
+        params = {}
+        for i, (_, min_date, max_date) in enumerate(spans):
+            params[f"start_{i}"] = min_date
+            params[f"end_{i}"] = max_date
+        days = conn.execute(text(diff_query), params).fetchone()
+    except Exception as e:
+        print(f"Error analyzing date ranges: {str(e)}")
+        days = None
+        if conn.in_transaction():
+            conn.rollback()
+
+    for i, (col, min_date, max_date) in enumerate(spans):
+        stats[col] = {
+            "min_date": _coerce(min_date),
+            "max_date": _coerce(max_date),
+            "distinct_count": _coerce(ranges[col][2]),
+            "date_range_days": _coerce(days[i]) if days else None
+        }
+    return stats
+
+
+def _frequent_value_for_column(engine, table: str, col: str, row_count: int) -> Optional[Dict[str, Any]]:
+    """
+    Find the most frequent non-null value of a column on its own connection.
+
+    Args:
+        engine: SQLAlchemy engine
+        table: Quoted table name
+        col: Quoted column name
+        row_count: Total row count, used for the percentage
+
+    Returns:
+        Dictionary with value, frequency and percentage, or None
+    """
+    try:
+        freq_query = f"""
+        SELECT 
+            {col} as value,
+            COUNT(*) as frequency,
+            COUNT(*) * 100.0 / :row_count as percentage
+        FROM {table}
+        WHERE {col} IS NOT NULL
+        GROUP BY {col}
+        ORDER BY frequency DESC
+        LIMIT 1
+        """
+
+        with engine.connect() as conn:
+            result = conn.execute(text(freq_query), {"row_count": row_count}).fetchone()
+        if result:
+            return {
+                "value": _coerce(result[0]),
+                "frequency": _coerce(result[1]),
+                "percentage": round(_coerce(result[2]), 2) if result[2] else 0
+            }
+    except Exception as e:
+        print(f"Error finding frequent values for {col}: {str(e)}")
+    return None
+
+
+def _outliers_for_column(engine, adapter, table: str, col: str) -> List[Any]:
+    """
+    Find values more than three standard deviations from the mean on its own connection.
+
+    Args:
+        engine: SQLAlchemy engine
+        adapter: SQL adapter for the engine's dialect
+        table: Quoted table name
+        col: Quoted numeric column name
+
+    Returns:
+        Up to 10 outlier values
+    """
+    try:
+        # Use adapter-specific stddev function
+        std_expr = adapter.stddev_function(col)
+
+        outlier_query = f"""
+        WITH stats AS (
+            SELECT 
+                AVG({col}) as avg_val,
+                {std_expr} as stddev_val
+            FROM {table}
+            WHERE {col} IS NOT NULL
+        )
+        SELECT {col}
+        FROM {table}, stats
+        WHERE {col} IS NOT NULL
+        AND ({col} > stats.avg_val + 3 * stats.stddev_val
+        OR {col} < stats.avg_val - 3 * stats.stddev_val)
+        LIMIT 10
+        """
+
+        with engine.connect() as conn:
+            results = conn.execute(text(outlier_query)).fetchall()
+        return [_coerce(row[0]) for row in results]
+    except Exception as e:
+        print(f"Error detecting outliers for {col}: {str(e)}")
+        return []
+
+
+def _from_text(value: Optional[str], numeric: bool) -> Any:
+    """
+    Convert a value that was cast to text for a UNION ALL back to a number.
+
+    Args:
+        value: Text value returned by the database
+        numeric: Whether the source column is numeric
+
+    Returns:
+        int or float for numeric columns, otherwise the value unchanged
+    """
+    if value is None or not numeric:
+        return value
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+
+def _frequent_values(
+        engine,
+        adapter,
+        table: str,
+        columns: Dict[str, str],
+        numeric_cols: Tuple[str, ...],
+        row_count: int
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Find the most frequent value of every column in a single UNION ALL query.
+
+    Each branch is tagged with the column's position so results can be bucketed
+    back per column. Falls back to one query per column if the batch fails.
+
+    Args:
+        engine: SQLAlchemy engine
+        adapter: SQL adapter for the engine's dialect
+        table: Quoted table name
+        columns: Mapping of column name to quoted identifier for the columns to analyze
+        numeric_cols: Numeric column names, whose values are converted back from text
+        row_count: Total row count, used for the percentage
+
+    Returns:
+        Dictionary mapping column name to value, frequency and percentage
+    """
+    if not columns or not row_count:
+        return {}
+
+    names = list(columns)
+    branches = [
+        f"""SELECT * FROM (
+            SELECT {i} AS col_id, {adapter.cast_to_text(qcol)} AS val, COUNT(*) AS cnt
+            FROM {table}
+            WHERE {qcol} IS NOT NULL
+            GROUP BY {qcol}
+            ORDER BY cnt DESC
+            LIMIT 1
+        ) AS freq_{i}"""
+        for i, qcol in enumerate(columns.values())
+    ]
+
+    frequent_values = {}
+    try:
+        with engine.connect() as conn:
+            rows = conn.execute(text(" UNION ALL ".join(branches))).fetchall()
+        for col_id, value, frequency in rows:
+            col = names[col_id]
+            frequency = _coerce(frequency)
+            frequent_values[col] = {
+                "value": _from_text(value, col in numeric_cols),
+                "frequency": frequency,
+                "percentage": round(frequency * 100.0 / row_count, 2)
+            }
+    except Exception as e:
+        print(f"Error finding frequent values in batch, retrying per column: {str(e)}")
+        for col, qcol in columns.items():
+            result = _frequent_value_for_column(engine, table, qcol, row_count)
+            if result is not None:
+                frequent_values[col] = result
+    return frequent_values
+
+
+def _outliers(
+        engine,
+        adapter,
+        table: str,
+        quoted: Dict[str, str],
+        bounds: Dict[str, Tuple[float, float]]
+) -> Dict[str, List[Any]]:
+    """
+    Find up to 10 outliers per numeric column in a single UNION ALL query.
+
+    Values are cast to text so integer and decimal columns can share one result
+    column without being widened, then converted back to numbers.
+
+    Args:
+        engine: SQLAlchemy engine
+        adapter: SQL adapter for the engine's dialect
+        table: Quoted table name
+        quoted: Mapping of column name to quoted identifier
+        bounds: Mapping of column name to (lower, upper) bounds; values outside
+            the bounds are outliers
+
+    Returns:
+        Dictionary mapping column name to its outlier values
+    """
+    if not bounds:
+        return {}
+
+    columns = list(bounds)
+    branches = []
+    params = {}
+    for i, col in enumerate(columns):
+        qcol = quoted[col]
+        branches.append(f"""SELECT * FROM (
+            SELECT {i} AS col_id, {adapter.cast_to_text(qcol)} AS val
+            FROM {table}
+            WHERE {qcol} < :lower_{i} OR {qcol} > :upper_{i}
+            LIMIT 10
+        ) AS outliers_{i}""")
+        params[f"lower_{i}"], params[f"upper_{i}"] = bounds[col]
+
+    outliers = {}
+    try:
+        with engine.connect() as conn:
+            rows = conn.execute(text(" UNION ALL ".join(branches)), params).fetchall()
+        for col_id, value in rows:
+            outliers.setdefault(columns[col_id], []).append(_from_text(value, True))
+    except Exception as e:
+        print(f"Error detecting outliers in batch, retrying per column: {str(e)}")
+        for col in columns:
+            result = _outliers_for_column(engine, adapter, table, quoted[col])
+            if result:
+                outliers[col] = result
+    return outliers
+
+
+def _build_trends(historical_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Collect the historical series for row counts, duplicates and null rates.
+
+    A historical profile carries the series of the runs before it in "trends"
+    plus its own values; both are combined, oldest first.
+
+    Args:
+        historical_data: Previous profile, or None
+
+    Returns:
+        Dictionary with row_counts, duplicates and null_rates (per column) lists
+    """
+    trends = {"row_counts": [], "null_rates": {}, "duplicates": []}
+    if not historical_data:
+        return trends
+
+    previous = historical_data.get("trends") or {}
+    trends["row_counts"] = list(previous.get("row_counts") or [])
+    trends["duplicates"] = list(previous.get("duplicates") or [])
+    trends["null_rates"] = {col: list(rates) for col, rates in (previous.get("null_rates") or {}).items()}
+
+    # Avoid counting the previous run twice when it already appended itself
+    if historical_data.get("row_count") is not None and not previous.get("row_counts"):
+        trends["row_counts"].append(historical_data["row_count"])
+    if historical_data.get("duplicate_count") is not None and not previous.get("duplicates"):
+        trends["duplicates"].append(historical_data["duplicate_count"])
+    for col, stats in (historical_data.get("completeness") or {}).items():
+        if stats.get("null_percentage") is not None and not trends["null_rates"].get(col):
+            trends["null_rates"].setdefault(col, []).append(stats["null_percentage"])
+    return trends
+
+
+def _deviations(
+        history: np.ndarray,
+        current: np.ndarray,
+        min_tolerance: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compare current values against NaN-padded history rows in one pass.
+
+    Args:
+        history: 2-D array, one row of historical values per series
+        current: 1-D array of current values, one per series
+        min_tolerance: 1-D array with the minimum deviation to flag per series
+
+    Returns:
+        Tuple of (anomalous mask, historical means, deviation / threshold ratios)
+    """
+    means = np.nanmean(history, axis=1)
+    stds = np.nanstd(history, axis=1)
+    thresholds = np.maximum(ANOMALY_STD_THRESHOLD * stds, min_tolerance)
+    deviations = np.abs(current - means)
+    ratios = np.divide(deviations, thresholds, out=np.zeros_like(deviations), where=thresholds > 0)
+    return deviations > thresholds, means, ratios
+
+
+def _severity(ratio: float) -> str:
+    """Map how far a deviation exceeds its threshold to a severity label."""
+    return "high" if ratio >= 2 else "medium"
+
+
+def _detect_anomalies(profile: Dict[str, Any], trends: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Flag row count and null rate values that deviate from their history.
+
+    Args:
+        profile: Current profile
+        trends: Historical series from _build_trends
+
+    Returns:
+        List of anomaly dictionaries
+    """
+    anomalies = []
+
+    row_counts = trends["row_counts"]
+    if row_counts:
+        history = np.asarray([row_counts], dtype=np.float64)
+        mean = history.mean()
+        current = np.asarray([profile["row_count"]], dtype=np.float64)
+        mask, means, ratios = _deviations(history, current, np.asarray([ROW_COUNT_TOLERANCE * mean]))
+        if mask[0]:
+            anomalies.append({
+                "type": "row_count",
+                "column": None,
+                "description": f"Row count changed from an average of {means[0]:.0f} to {profile['row_count']}",
+                "severity": _severity(float(ratios[0])),
+                "observed": profile["row_count"],
+                "expected": float(means[0])
+            })
+
+    # One NaN-padded row per column present in both the history and this profile
+    completeness = profile["completeness"]
+    columns = [col for col in completeness if trends["null_rates"].get(col)]
+    if columns:
+        width = max(len(trends["null_rates"][col]) for col in columns)
+        history = np.full((len(columns), width), np.nan)
+        for i, col in enumerate(columns):
+            rates = trends["null_rates"][col]
+            history[i, :len(rates)] = rates
+        current = np.fromiter((completeness[col]["null_percentage"] for col in columns),
+                              dtype=np.float64, count=len(columns))
+        mask, means, ratios = _deviations(history, current, np.full(len(columns), NULL_RATE_TOLERANCE))
+
+        for i in np.flatnonzero(mask):
+            col = columns[i]
+            anomalies.append({
+                "type": "null_rate",
+                "column": col,
+                "description": f"Null rate for {col} changed from an average of {means[i]:.2f}% "
+                               f"to {current[i]:.2f}%",
+                "severity": _severity(float(ratios[i])),
+                "observed": float(current[i]),
+                "expected": float(means[i])
+            })
+
+    return anomalies
+
+
+def _detect_schema_shifts(profile: Dict[str, Any], historical_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Report columns added or removed since the historical profile.
+
+    Args:
+        profile: Current profile
+        historical_data: Previous profile
+
+    Returns:
+        List of schema shift dictionaries
+    """
+    previous = historical_data.get("completeness")
+    if not previous:
+        return []
+
+    current = profile["completeness"]
+    shifts = [
+        {"type": "column_added", "column": col, "description": f"Column {col} was added"}
+        for col in current if col not in previous
+    ]
+    shifts.extend(
+        {"type": "column_removed", "column": col, "description": f"Column {col} was removed"}
+        for col in previous if col not in current
+    )
+    return shifts
+
 
 def profile_table(
         connection_str: str = None,
         table: str = None,
         historical_data: Optional[Dict[str, Any]] = None,
-        include_samples: bool = False
+        include_samples: bool = False,
+        schema_info: Optional[TableSchema] = None,
+        exact: bool = False
 ) -> Dict[str, Any]:
     """
     Profile a table for data completeness, uniqueness, distribution, and numeric stats.
@@ -29,6 +816,10 @@ def profile_table(
         table: Table name to profile
         historical_data: Optional dictionary containing historical profile data for comparison
         include_samples: Whether to include sample data in the profile (default: False)
+        schema_info: Optional TableSchema already reflected for the table
+            (e.g. by sparvi.db.reflection.reflect_many); skips introspection
+        exact: Count distinct values exactly; by default dialects with a
+            HyperLogLog aggregate (Snowflake, BigQuery, Redshift) estimate them
 
     Returns:
         Dictionary containing profiling results
@@ -43,346 +834,187 @@ def profile_table(
     print(f"Starting profiling for table: {table}")
     print(f"Include samples: {include_samples}")
 
-    # Create engine using connection manager for optimized settings
-    engine = create_db_engine(connection_str)
+    # Reuse a cached engine built by the connection manager for optimized settings
+    engine = _get_engine(connection_str)
     adapter = get_adapter_for_connection(engine)  # Get the appropriate SQL adapter
-    inspector = inspect(engine)
-
-    try:
-        columns = inspector.get_columns(table)
-    except Exception as e:
-        raise ValueError(f"Error inspecting table {table}: {str(e)}. Check if the table exists and you have access.")
+    if schema_info is not None:
+        layout = _column_layout(type(adapter), schema_info.columns, schema_info.primary_keys)
+    else:
+        layout = _introspect_columns(connection_str, table)
+    column_names, numeric_cols, text_cols, date_cols, pk_cols = layout
 
-    column_names = [col["name"] for col in columns]
-
-    # Categorize columns using adapter methods for type checking
-    numeric_cols = [col["name"] for col in columns if
-                    adapter.is_numeric_type(str(col["type"]))]
-
-    text_cols = [col["name"] for col in columns if
-                 adapter.is_text_type(str(col["type"]))]
-
-    date_cols = [col["name"] for col in columns if
-                 adapter.is_date_type(str(col["type"]))]
+    # Quote identifiers once so every statement is built from the same SQL text
+    qtable = adapter.quote_table(table)
+    quoted = {col: adapter.quote_identifier(col) for col in column_names}
+    qcols = tuple(quoted.values())
 
     # Check if we're using Snowflake for optimizations
     is_snowflake = 'snowflake' in str(engine.dialect).lower()
 
+    # Snowflake session parameters (result cache, query tag) are set at login
+    # by the connection manager, once per pooled connection
     with engine.connect() as conn:
-        # If Snowflake, set session parameters for better performance
-        if is_snowflake:
-            try:
-                conn.execute(text("ALTER SESSION SET USE_CACHED_RESULT = TRUE"))
-                conn.execute(text("ALTER SESSION SET QUERY_TAG = 'SPARVI_PROFILER'"))
-                print("Snowflake session optimizations applied")
-            except Exception as e:
-                print(f"Warning: Could not set Snowflake session parameters: {str(e)}")
+        # Prefer a metadata row count where the platform keeps one; otherwise
+        # COUNT(*) is folded into the fused metrics query below
+        row_count = adapter.fast_row_count(conn, table)
 
-        # Create separate queries for basic metrics
-        row_count_query = f"SELECT COUNT(*) FROM {table}"
-        null_counts_query = f"SELECT {', '.join([f'SUM(CASE WHEN {col} IS NULL THEN 1 ELSE 0 END) AS {col}_nulls' for col in column_names])} FROM {table}"
-        distinct_counts_query = f"SELECT {', '.join([f'COUNT(DISTINCT {col}) AS {col}_distinct' for col in column_names])} FROM {table}"
+        # An enforced primary key (or fewer than two rows) rules out duplicates,
+        # so the duplicate check can be skipped entirely
+        skip_duplicates = (bool(pk_cols) and adapter.enforces_primary_keys) or \
+            (row_count is not None and row_count < 2)
 
-        # Execute separate queries for clarity and reliability
-        print("Executing row count query...")
-        row_count = conn.execute(text(row_count_query)).fetchone()[0]
-        print(f"Row count: {row_count}")
-
-        print("Executing null counts query...")
-        null_counts_result = conn.execute(text(null_counts_query)).fetchone()
+        # The fused statement is prebuilt once per table layout and shared by
+        # tables with the same schema
+        plan = _metrics_plan(type(adapter), layout, row_count is None, not skip_duplicates, exact)
+        fused_percentile_cols = plan.fused_percentile_cols
+        null_offset, distinct_offset = plan.null_offset, plan.distinct_offset
+        numeric_offset, text_offset, date_offset = plan.numeric_offset, plan.text_offset, plan.date_offset
+        percentile_offset = plan.percentile_offset
 
-        print("Executing distinct counts query...")
-        distinct_counts_result = conn.execute(text(distinct_counts_query)).fetchone()
+        print("Executing fused metrics query...")
+        metrics = ()
+        if plan.percentile_select_list:
+            try:
+                metrics_query = f"SELECT {plan.percentile_select_list} FROM {qtable}"
+                metrics = conn.execute(text(metrics_query)).fetchone()
+            except Exception as e:
+                print(f"Error calculating fused percentiles, retrying per column: {str(e)}")
+                fused_percentile_cols = ()
+                if conn.in_transaction():
+                    conn.rollback()
+        if not metrics and plan.select_list:
+            metrics_query = f"SELECT {plan.select_list} FROM {qtable}"
+            metrics = conn.execute(text(metrics_query)).fetchone()
+        if row_count is None:
+            row_count = metrics[0]
+        print(f"Row count: {row_count}")
 
         # Duplicate check
         print("Checking for duplicates...")
-        # Use adapter-specific duplicate check query
-        if is_snowflake:
-            # Snowflake optimized query with QUALIFY
-            dup_check = f"""
-            SELECT COUNT(*) AS duplicate_rows FROM (
-                SELECT COUNT(*) as count 
-                FROM {table}
-                GROUP BY {', '.join(column_names)}
-                HAVING count > 1
-            )
-            """
+        if skip_duplicates or row_count < 2:
+            duplicate_count = 0
+        elif plan.hash_index is not None:
+            duplicate_count = (metrics[plan.scan_count_index] or 0) - (metrics[plan.hash_index] or 0)
         else:
-            # Standard query for other databases
+            # No row hash function for this dialect, fall back to grouping on every
+            # column; each group of n identical rows contributes n - 1 surplus rows
             dup_check = f"""
-            SELECT COUNT(*) AS duplicate_rows FROM (
-                SELECT COUNT(*) as count FROM {table} GROUP BY {', '.join(column_names)} HAVING count > 1
+            SELECT COALESCE(SUM(count - 1), 0) AS duplicate_rows FROM (
+                SELECT COUNT(*) as count FROM {qtable} GROUP BY {', '.join(qcols)} HAVING COUNT(*) > 1
             ) AS duplicates
             """
 
-        try:
-            duplicates_result = conn.execute(text(dup_check)).fetchone()
-            duplicate_count = duplicates_result[0] if duplicates_result else 0
-        except Exception as e:
-            print(f"Error checking for duplicates: {str(e)}")
-            duplicate_count = 0
+            try:
+                duplicates_result = conn.execute(text(dup_check)).fetchone()
+                duplicate_count = duplicates_result[0] if duplicates_result else 0
+            except Exception as e:
+                print(f"Error checking for duplicates: {str(e)}")
+                duplicate_count = 0
 
-        # Process null counts and distinct counts from results
-        null_counts = {}
-        distinct_counts = {}
+        # Slice null counts and distinct counts out of the fused result and
+        # compute the completeness percentages for all columns at once
+        column_count = len(column_names)
+        null_counts = np.fromiter(
+            (int(v or 0) for v in metrics[null_offset:distinct_offset]), dtype=np.int64, count=column_count
+        )
+        distinct_counts = np.fromiter(
+            (int(v or 0) for v in metrics[distinct_offset:numeric_offset]), dtype=np.int64, count=column_count
+        )
+        if row_count > 0:
+            null_percentages = np.round(null_counts / row_count * 100, 2)
+            distinct_percentages = np.round(distinct_counts / row_count * 100, 2)
+        else:
+            null_percentages = np.zeros(column_count)
+            distinct_percentages = np.zeros(column_count)
 
-        for i, col in enumerate(column_names):
-            null_counts[col] = null_counts_result[i] if i < len(null_counts_result) else 0
-            distinct_counts[col] = distinct_counts_result[i] if i < len(distinct_counts_result) else 0
+        completeness = {
+            col: {
+                "nulls": int(nulls),
+                "null_percentage": float(null_pct),
+                "distinct_count": int(distinct),
+                "distinct_percentage": float(distinct_pct)
+            }
+            for col, nulls, null_pct, distinct, distinct_pct in zip(
+                column_names,
+                null_counts.tolist(),
+                null_percentages.tolist(),
+                distinct_counts.tolist(),
+                distinct_percentages.tolist()
+            )
+        }
 
-        # Numeric statistics - optimized for each database type
-        print("Calculating numeric statistics...")
+        # Numeric statistics - simple aggregates come from the fused query, and
+        # so do percentiles where they were fused; the rest are filled in from
+        # the per-column tasks below
         numeric_stats = {}
-        for col in numeric_cols:
-            try:
-                # Use appropriate SQL via adapter for percentiles
-                median_expr = adapter.percentile_query(col, 0.5)
-                q1_expr = adapter.percentile_query(col, 0.25)
-                q3_expr = adapter.percentile_query(col, 0.75)
-                std_expr = adapter.stddev_function(col)
-
-                numeric_query = f"""
-                SELECT 
-                    MIN({col}) as min,
-                    MAX({col}) as max,
-                    AVG({col}) as avg,
-                    SUM({col}) as sum,
-                    {std_expr} as stdev,
-                    {q1_expr} as q1,
-                    {median_expr} as median,
-                    {q3_expr} as q3
-                FROM {table}
-                WHERE {col} IS NOT NULL
-                """
-
-                result = conn.execute(text(numeric_query)).fetchone()
-                if result:
-                    numeric_stats[col] = {
-                        "min": result[0],
-                        "max": result[1],
-                        "avg": result[2],
-                        "sum": result[3],
-                        "stdev": result[4],
-                        "q1": result[5],
-                        "median": result[6],
-                        "q3": result[7]
-                    }
-            except Exception as e:
-                print(f"Error calculating numeric stats for {col}: {str(e)}")
-                # Provide empty stats on error
-                numeric_stats[col] = {
-                    "min": None, "max": None, "avg": None, "sum": None,
-                    "stdev": None, "q1": None, "median": None, "q3": None
-                }
-
-        # Text Lengths - use adapter for appropriate LENGTH function
-        print("Calculating text statistics...")
+        for i, col in enumerate(numeric_cols):
+            base = numeric_offset + i * 5
+            numeric_stats[col] = {
+                "min": _coerce(metrics[base]),
+                "max": _coerce(metrics[base + 1]),
+                "avg": _coerce(metrics[base + 2]),
+                "sum": _coerce(metrics[base + 3]),
+                "stdev": _coerce(metrics[base + 4])
+            }
+        for i, col in enumerate(fused_percentile_cols):
+            base = percentile_offset + i * 3
+            numeric_stats[col].update({
+                "q1": _coerce(metrics[base]),
+                "median": _coerce(metrics[base + 1]),
+                "q3": _coerce(metrics[base + 2])
+            })
+
+        # Text lengths come straight from the fused query
         text_length_stats = {}
-        for col in text_cols:
-            try:
-                length_func = adapter.length_function(col)
-                text_query = f"""
-                SELECT 
-                    MIN({length_func}) as min_length,
-                    MAX({length_func}) as max_length,
-                    AVG({length_func}) as avg_length
-                FROM {table}
-                WHERE {col} IS NOT NULL
-                """
-
-                result = conn.execute(text(text_query)).fetchone()
-                if result:
-                    text_length_stats[col] = {
-                        "min_length": result[0],
-                        "max_length": result[1],
-                        "avg_length": result[2]
-                    }
-            except Exception as e:
-                print(f"Error calculating text stats for {col}: {str(e)}")
-                text_length_stats[col] = {
-                    "min_length": None, "max_length": None, "avg_length": None
-                }
-
-        # Pattern recognition for text columns
-        print("Analyzing text patterns...")
-        text_patterns = {}
-        for col in text_cols:
-            try:
-                # Use adapter-specific regex matching
-                email_pattern = adapter.regex_match(col, ".*@.*\\..*")
-                numeric_pattern = adapter.regex_match(col, "^[0-9]+$")
-                date_pattern = adapter.regex_match(col, "^[0-9]{2,4}[/-][0-9]{1,2}[/-][0-9]{1,2}$")
-
-                pattern_query = f"""
-                SELECT 
-                    SUM(CASE WHEN {email_pattern} THEN 1 ELSE 0 END) as email_count,
-                    SUM(CASE WHEN {numeric_pattern} THEN 1 ELSE 0 END) as numeric_count,
-                    SUM(CASE WHEN {date_pattern} THEN 1 ELSE 0 END) as date_count
-                FROM {table}
-                WHERE {col} IS NOT NULL
-                """
-
-                result = conn.execute(text(pattern_query)).fetchone()
-                if result:
-                    text_patterns[col] = {
-                        "email_pattern_count": result[0] or 0,
-                        "numeric_pattern_count": result[1] or 0,
-                        "date_pattern_count": result[2] or 0
-                    }
-            except Exception as e:
-                print(f"Error analyzing text patterns for {col}: {str(e)}")
-                text_patterns[col] = {
-                    "email_pattern_count": 0,
-                    "numeric_pattern_count": 0,
-                    "date_pattern_count": 0
-                }
-
-        # Date range check for date columns
-        print("Analyzing date columns...")
-        date_stats = {}
-        for col in date_cols:
-            try:
-                date_query = f"""
-                SELECT 
-                    MIN({col}) as min_date,
-                    MAX({col}) as max_date,
-                    COUNT(DISTINCT {col}) as distinct_count
-                FROM {table}
-                WHERE {col} IS NOT NULL
-                """
-
-                result = conn.execute(text(date_query)).fetchone()
-                if result and result[0] and result[1]:
-                    # Use adapter-specific date diff function
-                    min_date = result[0]
-                    max_date = result[1]
-
-                    # Calculate date range using adapter
-                    date_range_query = f"""
-                    SELECT {adapter.date_diff('day', f"'{min_date}'", f"'{max_date}'")}
-                    """
-
-                    date_range_result = conn.execute(text(date_range_query)).fetchone()
-                    date_range_days = date_range_result[0] if date_range_result else None
-
-                    date_stats[col] = {
-                        "min_date": min_date,
-                        "max_date": max_date,
-                        "distinct_count": result[2],
-                        "date_range_days": date_range_days
-                    }
-                else:
-                    date_stats[col] = {
-                        "min_date": None,
-                        "max_date": None,
-                        "distinct_count": 0,
-                        "date_range_days": None
-                    }
-            except Exception as e:
-                print(f"Error analyzing date stats for {col}: {str(e)}")
-                date_stats[col] = {
-                    "min_date": None,
-                    "max_date": None,
-                    "distinct_count": 0,
-                    "date_range_days": None
-                }
-
-        # Most Frequent Values
-        print("Finding most frequent values...")
-        frequent_values = {}
-        for col in column_names:
-            try:
-                # Skip if table has too many rows to avoid expensive query
-                if row_count > 1000000:
-                    continue
+        for i, col in enumerate(text_cols):
+            base = text_offset + i * 3
+            text_length_stats[col] = {
+                "min_length": _coerce(metrics[base]),
+                "max_length": _coerce(metrics[base + 1]),
+                "avg_length": _coerce(metrics[base + 2])
+            }
 
-                # Use optimization based on database type
-                if is_snowflake:
-                    # Snowflake optimized query
-                    freq_query = f"""
-                    SELECT 
-                        {col} as value,
-                        COUNT(*) as frequency,
-                        COUNT(*) * 100.0 / {row_count} as percentage
-                    FROM {table}
-                    WHERE {col} IS NOT NULL
-                    GROUP BY {col}
-                    ORDER BY frequency DESC
-                    LIMIT 1
-                    """
-                else:
-                    # Standard query for other databases
-                    freq_query = f"""
-                    SELECT 
-                        {col} as value,
-                        COUNT(*) as frequency,
-                        COUNT(*) * 100.0 / {row_count} as percentage
-                    FROM {table}
-                    WHERE {col} IS NOT NULL
-                    GROUP BY {col}
-                    ORDER BY frequency DESC
-                    LIMIT 1
-                    """
-
-                result = conn.execute(text(freq_query)).fetchone()
-                if result:
-                    frequent_values[col] = {
-                        "value": result[0],
-                        "frequency": result[1],
-                        "percentage": round(result[2], 2) if result[2] else 0
-                    }
-            except Exception as e:
-                print(f"Error finding frequent values for {col}: {str(e)}")
+        # Date ranges come from the fused query too; only their day spans need
+        # one more (table-free) statement
+        date_stats = _date_stats(conn, adapter, {
+            col: tuple(metrics[date_offset + i * 3:date_offset + i * 3 + 3])
+            for i, col in enumerate(date_cols)
+        })
 
-        # Get outliers for numeric columns
-        print("Detecting outliers...")
-        outliers = {}
-        for col in numeric_cols:
-            try:
-                # Use adapter-specific stddev function
-                std_expr = adapter.stddev_function(col)
+        # Outlier bounds reuse the fused AVG/STDDEV rather than recomputing them
+        outlier_bounds = {
+            col: (stats["avg"] - 3 * stats["stdev"], stats["avg"] + 3 * stats["stdev"])
+            for col, stats in numeric_stats.items()
+            if stats["avg"] is not None and stats["stdev"]
+        }
 
-                # Different query based on DB type
-                if is_snowflake:
-                    # Snowflake uses QUALIFY
-                    outlier_query = f"""
-                    WITH stats AS (
-                        SELECT 
-                            AVG({col}) as avg_val,
-                            {std_expr} as stddev_val
-                        FROM {table}
-                        WHERE {col} IS NOT NULL
-                    )
-                    SELECT {col}
-                    FROM {table}, stats
-                    WHERE {col} IS NOT NULL
-                    AND ({col} > stats.avg_val + 3 * stats.stddev_val
-                    OR {col} < stats.avg_val - 3 * stats.stddev_val)
-                    LIMIT 10
-                    """
-                else:
-                    # Standard query
-                    outlier_query = f"""
-                    WITH stats AS (
-                        SELECT 
-                            AVG({col}) as avg_val,
-                            {std_expr} as stddev_val
-                        FROM {table}
-                        WHERE {col} IS NOT NULL
-                    )
-                    SELECT {col}
-                    FROM {table}, stats
-                    WHERE {col} IS NOT NULL
-                    AND ({col} > stats.avg_val + 3 * stats.stddev_val
-                    OR {col} < stats.avg_val - 3 * stats.stddev_val)
-                    LIMIT 10
-                    """
-
-                results = conn.execute(text(outlier_query)).fetchall()
-                if results:
-                    outliers[col] = [row[0] for row in results]
-            except Exception as e:
-                print(f"Error detecting outliers for {col}: {str(e)}")
+        # The remaining queries are independent, so overlap their latency on a
+        # bounded pool; each task checks out its own connection
+        print("Calculating percentiles, text patterns, frequent values and outliers...")
+        # Skip frequent values if table has too many rows to avoid expensive queries
+        frequent_cols = quoted if row_count <= 1000000 else {}
+        task_count = len(numeric_cols) - len(fused_percentile_cols) + 3
+        executor = ThreadPoolExecutor(max_workers=min(16, task_count))
+        try:
+            percentile_futures = {
+                col: executor.submit(_percentiles_for_column, engine, adapter, qtable, quoted[col])
+                for col in numeric_cols if col not in fused_percentile_cols
+            }
+            pattern_future = executor.submit(
+                _text_patterns, engine, adapter, qtable, {col: quoted[col] for col in text_cols}
+            )
+            frequent_future = executor.submit(
+                _frequent_values, engine, adapter, qtable, frequent_cols, numeric_cols, row_count
+            )
+            outlier_future = executor.submit(_outliers, engine, adapter, qtable, quoted, outlier_bounds)
+
+            for col, future in percentile_futures.items():
+                numeric_stats[col].update(future.result())
+            text_patterns = pattern_future.result()
+            frequent_values = frequent_future.result()
+            outliers = outlier_future.result()
+        finally:
+            executor.shutdown(wait=True)
 
         # Sample Data (only if explicitly requested and include_samples is True)
         samples = []
@@ -392,17 +1024,19 @@ def profile_table(
                 # Use optimized sample query based on DB type
                 if is_snowflake:
                     # Snowflake optimized sampling
-                    sample_query = f"SELECT * FROM {table} SAMPLE (10 ROWS)"
+                    sample_query = f"SELECT * FROM {qtable} SAMPLE (10 ROWS)"
                 else:
                     # Standard limit for other databases
-                    sample_query = f"SELECT * FROM {table} LIMIT 10"
-
-                sample_results = conn.execute(text(sample_query))
-                if sample_results:
-                    # Convert to list of dictionaries
-                    columns = sample_results.keys()
-                    rows = sample_results.fetchall()
-                    samples = [dict(zip(columns, row)) for row in rows]
+                    sample_query = f"SELECT * FROM {qtable} LIMIT 10"
+
+                # Stream rows through a server-side cursor where the driver supports
+                # one, so larger sample limits are never buffered in full
+                sample_results = conn.execute(
+                    text(sample_query).execution_options(stream_results=True, max_row_buffer=100)
+                )
+                columns = list(sample_results.keys())
+                for row in sample_results:
+                    samples.append({k: _coerce(v) for k, v in zip(columns, row)})
             except Exception as e:
                 print(f"Error getting samples: {str(e)}")
 
@@ -412,15 +1046,7 @@ def profile_table(
         "timestamp": datetime.datetime.now().isoformat(),
         "row_count": row_count,
         "duplicate_count": duplicate_count,
-        "completeness": {
-            col: {
-                "nulls": null_counts[col],
-                "null_percentage": round((null_counts[col] / row_count) * 100, 2) if row_count > 0 else 0,
-                "distinct_count": distinct_counts[col],
-                "distinct_percentage": round((distinct_counts[col] / row_count) * 100, 2) if row_count > 0 else 0
-            }
-            for col in column_names
-        },
+        "completeness": completeness,
         "numeric_stats": numeric_stats,
         "text_patterns": text_patterns,
         "text_length_stats": text_length_stats,
@@ -435,23 +1061,91 @@ def profile_table(
         print(f"Added {len(samples)} sample rows to profile (will be used for display only)")
 
     # Compare with historical data to detect anomalies
+    trends = _build_trends(historical_data)
     anomalies = []
     schema_shifts = []
     if historical_data:
         print("Comparing with historical data...")
-        # Anomaly detection logic goes here
-        # This would compare current profile with historical data
+        anomalies = _detect_anomalies(profile, trends)
+        schema_shifts = _detect_schema_shifts(profile, historical_data)
 
     # Add anomalies to profile
     profile["anomalies"] = anomalies
     profile["schema_shifts"] = schema_shifts
 
-    # Prepare trend data structure (will be populated from historical runs)
+    # Extend the historical trends with this run
+    trends["row_counts"].append(row_count)
+    trends["duplicates"].append(duplicate_count)
+    for col, stats in profile["completeness"].items():
+        trends["null_rates"].setdefault(col, []).append(stats["null_percentage"])
     profile["trends"] = {
-        "row_counts": [],
-        "null_rates": {},
-        "duplicates": []
+        "row_counts": trends["row_counts"][-MAX_TREND_POINTS:],
+        "null_rates": {col: trends["null_rates"][col][-MAX_TREND_POINTS:] for col in profile["completeness"]},
+        "duplicates": trends["duplicates"][-MAX_TREND_POINTS:]
     }
 
     print(f"Profiling completed for table: {table}")
-    return profile
\ No newline at end of file
+    return profile
+
+
+def profile_tables(
+        connection_str: str = None,
+        tables: List[str] = None,
+        historical_data: Optional[Dict[str, Dict[str, Any]]] = None,
+        include_samples: bool = False,
+        max_workers: int = 4,
+        exact: bool = False
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Profile several tables, sharing introspection work between tables with the same schema.
+
+    Tables are reflected up front in one bulk pass (see
+    sparvi.db.reflection.reflect_many). Column classification and the fused
+    metrics SQL are cached per schema fingerprint, so they are built once per
+    distinct schema (for example for date-partitioned copies of one table)
+    and only the table name is substituted. The tables are then profiled in
+    parallel.
+
+    Args:
+        connection_str: Database connection string. If None, will attempt to get from environment.
+        tables: Table names to profile
+        historical_data: Optional mapping of table name to its historical profile
+        include_samples: Whether to include sample data in the profiles (default: False)
+        max_workers: Maximum number of tables profiled concurrently
+        exact: Count distinct values exactly (see profile_table)
+
+    Returns:
+        Dictionary mapping table name to its profiling results
+    """
+    if connection_str is None:
+        connection_str = get_snowflake_connection_from_env()
+
+    if not tables:
+        raise ValueError("At least one table name is required for profiling")
+
+    historical_data = historical_data or {}
+    workers = max(1, min(max_workers, len(tables)))
+
+    # Reflect every table not already cached in one pass
+    reflected = {}
+    for table in tables:
+        cached = lookup_table_schema(connection_str, None, table)
+        if cached is not None:
+            reflected[table] = cached
+    missing = [table for table in tables if table not in reflected]
+    if missing:
+        try:
+            reflected.update(reflect_many(_get_engine(connection_str), missing))
+        except Exception as e:
+            raise ValueError(f"Error inspecting tables {', '.join(missing)}: {str(e)}. "
+                             f"Check if the tables exist and you have access.")
+        for table in missing:
+            store_table_schema(connection_str, None, table, reflected[table])
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            table: executor.submit(profile_table, connection_str, table, historical_data.get(table),
+                                   include_samples, reflected[table], exact)
+            for table in tables
+        }
+        return {table: future.result() for table, future in futures.items()}
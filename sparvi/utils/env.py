@@ -1,7 +1,35 @@
+import functools
 import os
-from typing import Dict, Optional, Any
+from typing import Dict, Optional, Any, Tuple
 from urllib.parse import quote_plus
 
+# Environment variables read by the Snowflake helpers, snapshotted in one pass
+_SNOWFLAKE_KEYS = (
+    "SNOWFLAKE_USER",
+    "SNOWFLAKE_PASSWORD",
+    "SNOWFLAKE_ACCOUNT",
+    "SNOWFLAKE_DATABASE",
+    "SNOWFLAKE_SCHEMA",
+    "SNOWFLAKE_WAREHOUSE",
+    "SNOWFLAKE_ROLE",
+    "SNOWFLAKE_TIMEOUT_SECONDS",
+)
+
+_SNOWFLAKE_REQUIRED_KEYS = ("SNOWFLAKE_USER", "SNOWFLAKE_PASSWORD", "SNOWFLAKE_ACCOUNT", "SNOWFLAKE_DATABASE")
+
+
+def _url_encode(value: str) -> str:
+    """URL encode a credential, skipping quote_plus when it has nothing to escape."""
+    if value.isascii() and value.replace("_", "").isalnum():
+        return value
+    return quote_plus(value)
+
+
+def _snowflake_env() -> Dict[str, Optional[str]]:
+    """Snapshot the Snowflake environment variables into a plain dict."""
+    environ = os.environ
+    return {key: environ.get(key) for key in _SNOWFLAKE_KEYS}
+
 
 def get_snowflake_connection_from_env() -> str:
     """
@@ -15,7 +43,8 @@ def get_snowflake_connection_from_env() -> str:
 
     Optional environment variables:
     - SNOWFLAKE_SCHEMA: Schema to use (defaults to PUBLIC)
-    - SNOWFLAKE_WAREHOUSE: Warehouse to use (defaults to COMPUTE_WH)
+    - SNOWFLAKE_WAREHOUSE: Warehouse to use (defaults to a running warehouse picked
+      at connect time, or the user's default warehouse)
     - SNOWFLAKE_ROLE: Role to assume (defaults to None)
 
     Returns:
@@ -24,36 +53,55 @@ def get_snowflake_connection_from_env() -> str:
     Raises:
         ValueError: If required environment variables are missing
     """
-    required_vars = ["SNOWFLAKE_USER", "SNOWFLAKE_PASSWORD", "SNOWFLAKE_ACCOUNT", "SNOWFLAKE_DATABASE"]
+    env = _snowflake_env()
 
     # Check if all required variables are present
-    missing = [var for var in required_vars if not os.environ.get(var)]
+    missing = [var for var in _SNOWFLAKE_REQUIRED_KEYS if not env[var]]
     if missing:
         raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
 
-    # Get required variables
-    user = os.environ["SNOWFLAKE_USER"]
-    password = os.environ["SNOWFLAKE_PASSWORD"]
-    account = os.environ["SNOWFLAKE_ACCOUNT"]
-    database = os.environ["SNOWFLAKE_DATABASE"]
+    # Keyed on the snapshot, so a changed environment builds a new string
+    return _build_snowflake_connection(tuple(env[key] for key in _SNOWFLAKE_KEYS))
 
-    # URL encode username and password to handle special characters
-    user_encoded = quote_plus(user)
-    password_encoded = quote_plus(password)
 
-    # Get optional variables with defaults
-    schema = os.environ.get("SNOWFLAKE_SCHEMA", "PUBLIC")
-    warehouse = os.environ.get("SNOWFLAKE_WAREHOUSE", "COMPUTE_WH")
-    role = os.environ.get("SNOWFLAKE_ROLE")
+@functools.lru_cache(maxsize=8)
+def _build_snowflake_connection(values: Tuple[Optional[str], ...]) -> str:
+    """
+    Build a Snowflake connection string from a snapshot of _SNOWFLAKE_KEYS values.
+
+    Args:
+        values: Environment values in _SNOWFLAKE_KEYS order
+
+    Returns:
+        str: Formatted SQLAlchemy connection string for Snowflake
+    """
+    env = dict(zip(_SNOWFLAKE_KEYS, values))
 
-    # Build the base connection string
-    connection_string = f"snowflake://{user_encoded}:{password_encoded}@{account}/{database}/{schema}?warehouse={warehouse}"
+    # URL encode username and password to handle special characters
+    user_encoded = _url_encode(env["SNOWFLAKE_USER"])
+    password_encoded = _url_encode(env["SNOWFLAKE_PASSWORD"])
 
-    # Add role if specified
+    # Get optional variables with defaults
+    schema = env["SNOWFLAKE_SCHEMA"] or "PUBLIC"
+    warehouse = env["SNOWFLAKE_WAREHOUSE"]
+    role = env["SNOWFLAKE_ROLE"]
+
+    # Build the connection string in one join
+    parts = [
+        "snowflake://", user_encoded, ":", password_encoded, "@", env["SNOWFLAKE_ACCOUNT"],
+        "/", env["SNOWFLAKE_DATABASE"], "/", schema
+    ]
+
+    # Add warehouse and role if specified; without a warehouse the connection
+    # manager picks a running one
+    separator = "?"
+    if warehouse:
+        parts.extend((separator, "warehouse=", warehouse))
+        separator = "&"
     if role:
-        connection_string += f"&role={role}"
+        parts.extend((separator, "role=", role))
 
-    return connection_string
+    return "".join(parts)
 
 
 def get_snowflake_config_from_env() -> Dict[str, Any]:
@@ -63,21 +111,22 @@ def get_snowflake_config_from_env() -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Configuration dictionary with Snowflake settings
     """
+    env = _snowflake_env()
     config = {
-        "user": os.environ.get("SNOWFLAKE_USER"),
-        "password": os.environ.get("SNOWFLAKE_PASSWORD"),
-        "account": os.environ.get("SNOWFLAKE_ACCOUNT"),
-        "database": os.environ.get("SNOWFLAKE_DATABASE"),
-        "schema": os.environ.get("SNOWFLAKE_SCHEMA", "PUBLIC"),
-        "warehouse": os.environ.get("SNOWFLAKE_WAREHOUSE", "COMPUTE_WH"),
-        "role": os.environ.get("SNOWFLAKE_ROLE"),
+        "user": env["SNOWFLAKE_USER"],
+        "password": env["SNOWFLAKE_PASSWORD"],
+        "account": env["SNOWFLAKE_ACCOUNT"],
+        "database": env["SNOWFLAKE_DATABASE"],
+        "schema": env["SNOWFLAKE_SCHEMA"] or "PUBLIC",
+        "warehouse": env["SNOWFLAKE_WAREHOUSE"] or None,
+        "role": env["SNOWFLAKE_ROLE"],
         # Additional configuration options
         "application": "Sparvi",
         "session_parameters": {
             "QUERY_TAG": "SPARVI_PROFILER",
             # Set optimized session parameters
             "USE_CACHED_RESULT": True,
-            "STATEMENT_TIMEOUT_IN_SECONDS": int(os.environ.get("SNOWFLAKE_TIMEOUT_SECONDS", "300"))
+            "STATEMENT_TIMEOUT_IN_SECONDS": int(env["SNOWFLAKE_TIMEOUT_SECONDS"] or "300")
         }
     }
 
@@ -98,15 +147,16 @@ def get_connection_from_env() -> Optional[str]:
         Optional[str]: Database connection string or None if not available
     """
     # Check for generic DATABASE_URL first
-    if "DATABASE_URL" in os.environ:
-        return os.environ["DATABASE_URL"]
+    database_url = os.environ.get("DATABASE_URL")
+    if database_url is not None:
+        return database_url
 
     # Check for Snowflake configuration
-    snowflake_vars = ["SNOWFLAKE_USER", "SNOWFLAKE_PASSWORD", "SNOWFLAKE_ACCOUNT", "SNOWFLAKE_DATABASE"]
-    if all(var in os.environ for var in snowflake_vars):
+    env = _snowflake_env()
+    if all(env[var] is not None for var in _SNOWFLAKE_REQUIRED_KEYS):
         return get_snowflake_connection_from_env()
 
     # Other database connections could be added here
 
     # No connection variables found
-    return None
\ No newline at end of file
+    return None
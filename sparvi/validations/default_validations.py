@@ -1,462 +1,822 @@
 """
 Default validation rules generator for Sparvi, modified to use database-specific adapters
 """
-from typing import List, Dict, Any, Optional, Union
+import functools
+import re
+import textwrap
+from collections import namedtuple
+from typing import Iterator, List, Dict, Any, Optional, Union
 import sqlalchemy as sa
-from sqlalchemy import inspect, create_engine
+from sqlalchemy import inspect
 
+from sparvi.cache import TableSchema, lookup_table_schema, store_table_schema
 from sparvi.db.adapters import get_adapter_for_connection
+from sparvi.db.connection import get_or_create_engine
+from sparvi.db.reflection import reflect_many, reflect_table
 
 
-def get_default_validations(connection_string: str, table_name: str) -> List[Dict[str, Any]]:
+class Rule(namedtuple("Rule", "name description query operator expected_value columns_to_results",
+                      defaults=(None,))):
+    """
+    An immutable generated validation rule.
+
+    A combined rule has no operator of its own; its query returns one column
+    per entry of columns_to_results, each checked as a separate rule.
+    """
+    __slots__ = ()
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the rule as the dictionary format used by run_validations."""
+        rule = self._asdict()
+        parts = rule.pop('columns_to_results')
+        if parts is not None:
+            del rule['operator'], rule['expected_value']
+            rule['columns_to_results'] = [
+                {'name': part.name, 'description': part.description,
+                 'operator': part.operator, 'expected_value': part.expected_value}
+                for part in parts
+            ]
+        return rule
+
+
+def _keyword_re(*keywords):
+    """Compile a regex matching any of the keywords as a substring."""
+    return re.compile("|".join(re.escape(k) for k in keywords))
+
+
+# Column and table name heuristics, matched against lowercased names
+_UNIQUE_NAME_RE = _keyword_re('id', 'code', 'number', 'uuid', 'guid', 'key', 'hash', 'identifier')
+_NEGATIVE_ALLOWED_RE = _keyword_re(
+    'balance', 'difference', 'delta', 'change', 'temperature',
+    'coordinate', 'adjustment', 'net', 'profit_loss', 'margin'
+)
+_NON_ZERO_RE = _keyword_re(
+    'price', 'amount', 'total', 'cost', 'rate', 'fee', 'tax',
+    'revenue', 'salary', 'income', 'expense'
+)
+_PAST_DATE_RE = _keyword_re(
+    'birth', 'created', 'start', 'registered', 'joined', 'purchase',
+    'transaction', 'order', 'payment', 'issued', 'shipped', 'received'
+)
+_END_DATE_RE = _keyword_re('end', 'finish', 'completed', 'closed', 'expiry', 'expiration')
+_PHONE_RE = _keyword_re('phone', 'mobile')
+_POSTAL_RE = _keyword_re('zip', 'postal')
+_REFERENCE_TABLE_RE = _keyword_re('ref', 'type', 'status', 'category', 'lookup')
+_IMPORTANT_COLUMN_RE = _keyword_re(
+    'name', 'description', 'address', 'city', 'state', 'country', 'postal', 'zip',
+    'email', 'phone', 'status', 'type', 'category', 'price', 'cost', 'amount'
+)
+_CATEGORICAL_RE = _keyword_re(
+    'status', 'type', 'category', 'level', 'tier', 'class', 'grade',
+    'priority', 'severity', 'state', 'region', 'stage', 'gender'
+)
+_UPDATED_RE = _keyword_re('updated', 'modified', 'edited', 'changed')
+_CREATED_RE = _keyword_re('created', 'inserted', 'added')
+
+# Phone number format handed to adapter.regex_match
+_PHONE_REGEX = r'(\+)?[0-9][0-9 ()-]+'
+
+# Relative change from the baseline row count flagged by the row growth check
+ROW_GROWTH_TOLERANCE = 0.2
+
+# Order in which rule categories are emitted by get_default_validations
+_RULE_CATEGORIES = (
+    'table', 'unique', 'not_null', 'positive', 'not_zero', 'date', 'text',
+    'outliers', 'ref_table_size', 'null_rate', 'distribution', 'ref_distribution',
+    'timestamp_order'
+)
+
+# Start-date guessing for end-date columns
+_START_TERM_MAP = {
+    'end': 'start', 'finish': 'start', 'completed': 'created',
+    'closed': 'opened', 'expiry': 'issue', 'expiration': 'issue'
+}
+_START_INDICATOR_RE = _keyword_re('start', 'created', 'opened', 'issue', 'begin')
+_DATE_INDICATOR_RE = _keyword_re('date', 'time', 'timestamp', 'dt')
+
+# Outlier thresholds by table name
+_LARGE_TABLE_RE = _keyword_re('fact', 'transaction', 'event', 'log', 'history', 'audit', 'detail')
+_MEDIUM_TABLE_RE = _keyword_re('order', 'customer', 'user', 'account', 'product', 'item')
+
+
+# Query templates for the generated rules; t is the table and c the column
+_ROW_COUNT_SQL = "SELECT COUNT(*) FROM {t}"
+_PK_UNIQUE_SQL = textwrap.dedent("""\
+    SELECT COUNT(*) FROM (
+        SELECT {cols}, COUNT(*) as count
+        FROM {t}
+        GROUP BY {cols}
+        HAVING COUNT(*) > 1
+    ) AS duplicates
+""").strip()
+_UNIQUE_SQL = textwrap.dedent("""\
+    SELECT COUNT(*) FROM (
+        SELECT {c}, COUNT(*) as count
+        FROM {t}
+        WHERE {c} IS NOT NULL
+        GROUP BY {c}
+        HAVING COUNT(*) > 1
+    ) AS duplicates
+""").strip()
+_NOT_NULL_SQL = "SELECT COUNT(*) FROM {t} WHERE {c} IS NULL"
+_NULL_RATE_SQL = textwrap.dedent("""\
+    SELECT (COUNT(*) FILTER (WHERE {c} IS NULL) * 100.0 / NULLIF(COUNT(*), 0))
+    FROM {t}
+""").strip()
+_NEGATIVE_SQL = "SELECT COUNT(*) FROM {t} WHERE {c} < 0"
+_ZERO_SQL = "SELECT COUNT(*) FROM {t} WHERE {c} = 0"
+_NUMERIC_CHECKS_SQL = textwrap.dedent("""\
+    WITH stats AS (
+        SELECT
+            AVG({c}) as avg_val,
+            {stddev} as stddev_val
+        FROM {t}
+        WHERE {c} IS NOT NULL
+    )
+    SELECT {counts}
+    FROM {t}, stats
+""").strip()
+_NEGATIVE_COUNT_SQL = "COALESCE(SUM(CASE WHEN {c} < 0 THEN 1 ELSE 0 END), 0)"
+_ZERO_COUNT_SQL = "COALESCE(SUM(CASE WHEN {c} = 0 THEN 1 ELSE 0 END), 0)"
+_OUTLIER_COUNT_SQL = ("COALESCE(SUM(CASE WHEN {c} > stats.avg_val + 3 * stats.stddev_val "
+                      "OR {c} < stats.avg_val - 3 * stats.stddev_val THEN 1 ELSE 0 END), 0)")
+_OUTLIERS_SQL = textwrap.dedent("""\
+    WITH stats AS (
+        SELECT
+            AVG({c}) as avg_val,
+            {stddev} as stddev_val
+        FROM {t}
+        WHERE {c} IS NOT NULL
+    )
+    SELECT COUNT(*) FROM {t}, stats
+    WHERE {c} > stats.avg_val + 3 * stats.stddev_val
+    OR {c} < stats.avg_val - 3 * stats.stddev_val
+""").strip()
+_FUTURE_DATE_SQL = "SELECT COUNT(*) FROM {t} WHERE {c} > CURRENT_DATE"
+_OLD_DATE_SQL = "SELECT COUNT(*) FROM {t} WHERE {c} < '1970-01-01'"
+_END_DATE_ORDER_SQL = textwrap.dedent("""\
+    SELECT COUNT(*) FROM {t}
+    WHERE {c} IS NOT NULL
+    AND {start} IS NOT NULL
+    AND {c} < {start}
+""").strip()
+_MAX_LENGTH_SQL = "SELECT COUNT(*) FROM {t} WHERE {length_expr} > {length}"
+_EMPTY_STRING_SQL = "SELECT COUNT(*) FROM {t} WHERE {c} = ''"
+_EMAIL_SQL = textwrap.dedent("""\
+    SELECT COUNT(*) FROM {t}
+    WHERE {c} IS NOT NULL
+    AND {c} NOT LIKE '%@%.%'
+""").strip()
+_PHONE_SQL = textwrap.dedent("""\
+    SELECT COUNT(*) FROM {t}
+    WHERE {c} IS NOT NULL
+    AND NOT {match}
+""").strip()
+_POSTAL_SQL = textwrap.dedent("""\
+    SELECT COUNT(*) FROM {t}
+    WHERE {c} IS NOT NULL
+    AND {trimmed_length} < 3
+""").strip()
+_DISTRIBUTION_SQL = textwrap.dedent("""\
+    WITH val_counts AS (
+        SELECT {c}, COUNT(*) as count,
+        (COUNT(*) * 100.0 / NULLIF((SELECT COUNT(*) FROM {t}), 0)) as pct
+        FROM {t}
+        WHERE {c} IS NOT NULL
+        GROUP BY {c}
+    )
+    SELECT COUNT(*) FROM val_counts
+    WHERE pct > 95.0
+""").strip()
+_REF_DISTRIBUTION_SQL = textwrap.dedent("""\
+    SELECT CASE
+      WHEN (SELECT COUNT(DISTINCT {c}) FROM {t} WHERE {c} IS NOT NULL) = 1
+      THEN 1 ELSE 0 END
+""").strip()
+_TIMESTAMP_ORDER_SQL = textwrap.dedent("""\
+    SELECT COUNT(*) FROM {t}
+    WHERE {updated} IS NOT NULL
+    AND {created} IS NOT NULL
+    AND {updated} < {created}
+""").strip()
+
+# Templates with the dialect's SQL fragments filled in, leaving {c} (and the
+# other per-rule fields) open; see _dialect_templates
+_DialectTemplates = namedtuple("_DialectTemplates", "outliers numeric_checks max_length phone postal")
+
+# Stands in for the column while a dialect fragment is rendered
+_COLUMN_PLACEHOLDER = "\0c\0"
+
+
+class _KeepFields(dict):
+    """format_map mapping that leaves unknown fields as they are."""
+
+    def __missing__(self, key):
+        return "{" + key + "}"
+
+
+def _specialize(template: str, **fragments: str) -> str:
+    """Fill fragments into a template, keeping {c} and the other fields open."""
+    escaped = {
+        key: fragment.replace("{", "{{").replace("}", "}}").replace(_COLUMN_PLACEHOLDER, "{c}")
+        for key, fragment in fragments.items()
+    }
+    return template.format_map(_KeepFields(escaped))
+
+
+@functools.lru_cache(maxsize=None)
+def _dialect_templates(adapter_cls) -> _DialectTemplates:
+    """
+    Render the adapter-dependent query templates once per adapter class
+
+    Each column then fills its table and column into a ready template with
+    a single str.format call instead of asking the adapter for fragments.
+
+    Args:
+        adapter_cls: SqlAdapter subclass
+
+    Returns:
+        _DialectTemplates of bound str.format methods
+    """
+    adapter = adapter_cls()
+    c = _COLUMN_PLACEHOLDER
+    stddev = adapter.stddev_function(c)
+    return _DialectTemplates(
+        outliers=_specialize(_OUTLIERS_SQL, stddev=stddev).format,
+        numeric_checks=_specialize(_NUMERIC_CHECKS_SQL, stddev=stddev).format,
+        max_length=_specialize(_MAX_LENGTH_SQL, length_expr=adapter.length_function(c)).format,
+        phone=_specialize(_PHONE_SQL, match=adapter.regex_match(c, _PHONE_REGEX)).format,
+        postal=_specialize(_POSTAL_SQL, trimmed_length=adapter.length_function("TRIM(" + c + ")")).format,
+    )
+
+
+def get_default_validations(connection_string_or_engine: Union[str, sa.engine.Engine, sa.engine.Connection],
+                            table_name: str,
+                            inspector: Optional[sa.engine.Inspector] = None,
+                            schema: Optional[str] = None,
+                            baseline_provider: Optional[Any] = None,
+                            reference_table_max_rows: Optional[int] = None,
+                            combine_numeric_checks: bool = False,
+                            schema_info: Optional[TableSchema] = None) -> List[Dict[str, Any]]:
     """
     Generate default validation rules that can be applied to any table
 
     Args:
-        connection_string: Database connection string
+        connection_string_or_engine: Database connection string, Engine or Connection
         table_name: Name of the table to generate validations for
+        inspector: Optional Inspector to reuse across tables, so its reflection
+            cache is shared between calls
+        schema: Optional schema the table lives in
+        baseline_provider: Optional mapping-like object whose get(table_name)
+            returns the table's previous row count; enables the row growth check
+        reference_table_max_rows: Optional row limit for reference/lookup
+            tables; enables the reference table size check
+        combine_numeric_checks: Merge the sign, zero and outlier checks of
+            each numeric column into one rule that scans the table once;
+            run_validations reports each check separately
+        schema_info: Optional TableSchema already reflected for the table
+            (e.g. by sparvi.db.reflection.reflect_many); skips reflection
 
     Returns:
         List of validation rule dictionaries
     """
+    return [rule.as_dict() for rule in
+            iter_default_validations(connection_string_or_engine, table_name, inspector, schema,
+                                     baseline_provider, reference_table_max_rows,
+                                     combine_numeric_checks, schema_info)]
+
+
+def iter_default_validations(connection_string_or_engine: Union[str, sa.engine.Engine, sa.engine.Connection],
+                             table_name: str,
+                             inspector: Optional[sa.engine.Inspector] = None,
+                             schema: Optional[str] = None,
+                             baseline_provider: Optional[Any] = None,
+                             reference_table_max_rows: Optional[int] = None,
+                             combine_numeric_checks: bool = False,
+                             schema_info: Optional[TableSchema] = None) -> Iterator[Rule]:
+    """
+    Iterate over the default validation rules for a table as Rule tuples
+
+    Rules are shared with the rule cache rather than copied, which makes this
+    cheaper than get_default_validations for callers that only read them.
+
+    When a connection string is given, the process-wide engine for it (see
+    sparvi.db.connection.get_or_create_engine) is used, so repeated calls
+    reuse its pooled connections.
+
+    Args:
+        connection_string_or_engine: Database connection string, Engine or Connection
+        table_name: Name of the table to generate validations for
+        inspector: Optional Inspector to reuse across tables, so its reflection
+            cache is shared between calls
+        schema: Optional schema the table lives in
+        baseline_provider: Optional mapping-like object whose get(table_name)
+            returns the table's previous row count; enables the row growth check
+        reference_table_max_rows: Optional row limit for reference/lookup
+            tables; enables the reference table size check
+        combine_numeric_checks: Merge the sign, zero and outlier checks of
+            each numeric column into one rule that scans the table once;
+            run_validations reports each check separately
+        schema_info: Optional TableSchema already reflected for the table
+            (e.g. by sparvi.db.reflection.reflect_many); skips reflection
+
+    Returns:
+        Iterator of Rule tuples
+    """
+    # Reflection of a connection string's tables is shared through sparvi.cache
+    cache_key = connection_string_or_engine if isinstance(connection_string_or_engine, str) and inspector is None else None
+    cached = schema_info
+    if cached is None and cache_key:
+        cached = lookup_table_schema(cache_key, schema, table_name)
+
     # Connect to database and get table metadata
-    engine = create_engine(connection_string)
-    adapter = get_adapter_for_connection(engine)  # Get the appropriate SQL adapter
-    inspector = inspect(engine)
-
-    # Get column information
-    columns = inspector.get_columns(table_name)
-    primary_keys = inspector.get_pk_constraint(table_name).get('constrained_columns', [])
-    foreign_keys = []
-    try:
-        for fk in inspector.get_foreign_keys(table_name):
-            if 'constrained_columns' in fk and fk['constrained_columns']:
-                foreign_keys.extend(fk['constrained_columns'])
-    except Exception:
-        # Some databases might not support foreign key inspection
-        pass
-
-    # Initialize validation rules list
-    validations = []
+    bind = _resolve_bind(connection_string_or_engine, inspector)
+    adapter = get_adapter_for_connection(bind)  # Get the appropriate SQL adapter
+    if cached is None:
+        inspector = inspector or inspect(bind)
+        cached = reflect_table(inspector, table_name, schema)
+        if cache_key:
+            store_table_schema(cache_key, schema, table_name, cached)
+    columns, primary_keys, foreign_keys = cached
+
+    return iter(_rules_for_table(adapter, table_name, schema, columns, primary_keys, foreign_keys,
+                                 baseline_provider, reference_table_max_rows, combine_numeric_checks))
+
+
+def get_default_validations_bulk(connection_string_or_engine: Union[str, sa.engine.Engine, sa.engine.Connection],
+                                 table_names: List[str],
+                                 schema: Optional[str] = None,
+                                 inspector: Optional[sa.engine.Inspector] = None,
+                                 baseline_provider: Optional[Any] = None,
+                                 reference_table_max_rows: Optional[int] = None,
+                                 combine_numeric_checks: bool = False) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Generate default validation rules for several tables of one schema
 
-    # =====================
-    # TABLE-LEVEL VALIDATIONS
-    # =====================
+    Columns, primary keys and foreign keys are reflected for all tables at
+    once with the Inspector's get_multi_* methods (SQLAlchemy 2.0+), which
+    dialects such as PostgreSQL and Snowflake answer with one query each
+    instead of one per table.
 
-    # 1. Row count validation - ensure table is not empty
-    validations.append({
-        "name": f"check_{table_name}_not_empty",
-        "description": f"Ensure {table_name} table has at least one row",
-        "query": f"SELECT COUNT(*) FROM {table_name}",
-        "operator": "greater_than",
-        "expected_value": 0
-    })
+    Args:
+        connection_string_or_engine: Database connection string, Engine or Connection
+        table_names: Names of the tables to generate validations for
+        schema: Optional schema the tables live in
+        inspector: Optional Inspector to reuse
+        baseline_provider: Optional mapping-like object whose get(table_name)
+            returns the table's previous row count; enables the row growth check
+        reference_table_max_rows: Optional row limit for reference/lookup
+            tables; enables the reference table size check
+        combine_numeric_checks: Merge the sign, zero and outlier checks of
+            each numeric column into one rule that scans the table once
 
-    # 2. Duplicate primary key check (if primary keys exist)
-    if primary_keys:
-        pk_columns = ", ".join(primary_keys)
-        validations.append({
-            "name": f"check_{table_name}_pk_unique",
-            "description": f"Ensure primary key ({pk_columns}) has no duplicates",
-            "query": f"""
-                SELECT COUNT(*) FROM (
-                    SELECT {pk_columns}, COUNT(*) as count 
-                    FROM {table_name} 
-                    GROUP BY {pk_columns} 
-                    HAVING COUNT(*) > 1
-                ) AS duplicates
-            """,
-            "operator": "equals",
-            "expected_value": 0
-        })
-
-    # 3. Row growth check - detect sudden large changes in row count
-    validations.append({
-        "name": f"check_{table_name}_row_growth",
-        "description": f"Detect unusual growth in {table_name} row count (>20% change)",
-        "query": f"""
-            WITH current_count AS (
-                SELECT COUNT(*) as count FROM {table_name}
-            ),
-            prev_count AS (
-                -- Replace with your historical count logic or reference table
-                SELECT 
-                    CASE 
-                        WHEN COUNT(*) = 0 THEN NULL 
-                        ELSE COUNT(*) 
-                    END as count 
-                FROM {table_name}
-            )
-            SELECT 
-                CASE
-                    WHEN prev_count.count IS NULL THEN 0
-                    WHEN ABS(current_count.count - prev_count.count) > prev_count.count * 0.2 THEN 1
-                    ELSE 0
-                END
-            FROM current_count, prev_count
-        """,
-        "operator": "equals",
-        "expected_value": 0
-    })
-
-    # 4. Duplicate detection for non-PK columns that should be unique
-    # Check columns with names suggesting uniqueness
-    unique_name_patterns = ['id', 'code', 'number', 'uuid', 'guid', 'key', 'hash', 'identifier']
+    Returns:
+        Dictionary mapping each table name to its list of validation rule dictionaries
+
+    Raises:
+        NoSuchTableError: If one of the tables does not exist
+    """
+    table_names = list(table_names)
+    cache_key = connection_string_or_engine if isinstance(connection_string_or_engine, str) and inspector is None else None
+    reflected = {}
+    if cache_key:
+        for table_name in table_names:
+            cached = lookup_table_schema(cache_key, schema, table_name)
+            if cached is not None:
+                reflected[table_name] = cached
+    missing = [table_name for table_name in table_names if table_name not in reflected]
+
+    bind = _resolve_bind(connection_string_or_engine, inspector)
+    adapter = get_adapter_for_connection(bind)
+
+    if missing:
+        reflected.update(reflect_many(bind, missing, schema, inspector))
+        if cache_key:
+            for table_name in missing:
+                store_table_schema(cache_key, schema, table_name, reflected[table_name])
+
+    return {
+        table_name: [rule.as_dict() for rule in _rules_for_table(
+            adapter, table_name, schema, *reflected[table_name],
+            baseline_provider, reference_table_max_rows, combine_numeric_checks)]
+        for table_name in table_names
+    }
+
+
+def _resolve_bind(connection_string_or_engine, inspector):
+    """
+    Pick the Engine or Connection to reflect with.
+
+    Returns:
+        The given Engine or Connection, the inspector's bind, or the shared
+        engine for a connection string
+    """
+    if isinstance(connection_string_or_engine, (sa.engine.Engine, sa.engine.Connection)):
+        return connection_string_or_engine
+    if inspector is not None:
+        return inspector.bind
+    return get_or_create_engine(connection_string_or_engine, pool_pre_ping=True)
+
+
+def _rules_for_table(adapter, table_name, schema, columns, primary_keys, foreign_keys,
+                     baseline_provider, reference_table_max_rows, combine_numeric_checks):
+    """
+    Build the rules for a reflected table, adding the baseline growth check.
+
+    Returns:
+        Tuple of Rule tuples
+    """
+    # The rules depend only on the dialect, table name and column layout, so
+    # they are built once per distinct schema
+    schema_fingerprint = tuple(
+        (c['name'], str(c['type']), bool(c['nullable']), getattr(c['type'], 'length', None))
+        for c in columns
+    )
+    rules = _build_rules(type(adapter), table_name, schema, schema_fingerprint,
+                         tuple(primary_keys), tuple(foreign_keys), reference_table_max_rows,
+                         combine_numeric_checks)
+
+    # The growth check depends on the current baseline, so it is added
+    # outside the cache, right after the other table-level rules
+    baseline = baseline_provider.get(table_name) if baseline_provider is not None else None
+    if baseline is not None:
+        qtable = adapter.quote_table(f"{schema}.{table_name}" if schema else table_name)
+        position = 2 if primary_keys else 1
+        rules = rules[:position] + (_row_growth_rule(table_name, qtable, baseline),) + rules[position:]
+    return rules
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_rules(adapter_cls, table_name, schema, schema_fingerprint, primary_keys, foreign_keys,
+                 reference_table_max_rows=None, combine_numeric_checks=False):
+    """
+    Build the default rules for a table layout.
+
+    Args:
+        adapter_cls: SqlAdapter subclass for the table's dialect
+        table_name: Name of the table
+        schema: Schema the table lives in, or None for the default schema
+        schema_fingerprint: Tuple of (name, type, nullable, length) per column
+        primary_keys: Tuple of primary key column names
+        foreign_keys: Tuple of foreign key column names
+        reference_table_max_rows: Row limit for reference tables, or None to
+            skip the reference table size check
+        combine_numeric_checks: Merge each numeric column's checks into one rule
+
+    Returns:
+        Tuple of Rule tuples
+    """
+    adapter = adapter_cls()
+    columns = tuple(
+        {'name': name, 'type': col_type, 'nullable': nullable, 'length': length}
+        for name, col_type, nullable, length in schema_fingerprint
+    )
+    # Sets for the per-column membership tests; the tuples keep key order
+    pk_set = frozenset(primary_keys)
+    fk_set = frozenset(foreign_keys)
+
+    # Name lookups for guessing the start column of end-date columns; the
+    # first column wins when names differ only by case
+    lname_to_name = {}
     for column in columns:
-        # Skip primary keys and foreign keys as they're already checked
-        if column['name'] in primary_keys or column['name'] in foreign_keys:
-            continue
-
-        # Check if column name suggests uniqueness
-        if any(unique_pattern in column['name'].lower() for unique_pattern in unique_name_patterns):
-            validations.append({
-                "name": f"check_{column['name']}_unique",
-                "description": f"Check that {column['name']} values are unique",
-                "query": f"""
-                    SELECT COUNT(*) FROM (
-                        SELECT {column['name']}, COUNT(*) as count 
-                        FROM {table_name} 
-                        WHERE {column['name']} IS NOT NULL
-                        GROUP BY {column['name']} 
-                        HAVING COUNT(*) > 1
-                    ) AS duplicates
-                """,
-                "operator": "equals",
-                "expected_value": 0
-            })
+        lname_to_name.setdefault(column['name'].lower(), column['name'])
+    date_lnames = [column['name'].lower() for column in columns
+                   if adapter.is_date_type(column['type'])]
+
+    # Identifiers are quoted once for use in the SQL; rule names and
+    # descriptions keep the plain names
+    qtable = adapter.quote_table(f"{schema}.{table_name}" if schema else table_name)
+    qcols = {column['name']: adapter.quote_identifier(column['name']) for column in columns}
+
+    # Rules are collected per category in a single pass over the columns and
+    # emitted in the category order below
+    buckets = {category: [] for category in _RULE_CATEGORIES}
 
     # =====================
-    # COLUMN-LEVEL VALIDATIONS
+    # TABLE-LEVEL VALIDATIONS
     # =====================
+    _append_table_checks(buckets, adapter, table_name, qtable, primary_keys, reference_table_max_rows)
 
-    # 5. NULL checks for non-nullable columns
-    for column in columns:
-        if not column['nullable'] and column['name'] not in primary_keys:
-            validations.append({
-                "name": f"check_{column['name']}_not_null",
-                "description": f"Ensure {column['name']} has no NULL values",
-                "query": f"SELECT COUNT(*) FROM {table_name} WHERE {column['name']} IS NULL",
-                "operator": "equals",
-                "expected_value": 0
-            })
-
-    # 6. Check for negative values in numeric columns (if not explicitly allowed)
-    for column in columns:
-        col_type = str(column['type']).lower()
-
-        # Use adapter to check if column is numeric
-        if adapter.is_numeric_type(col_type) and 'unsigned' not in col_type:
-            # Skip columns likely to allow negative values based on common naming patterns
-            negative_allowed_patterns = [
-                'balance', 'difference', 'delta', 'change', 'temperature',
-                'coordinate', 'adjustment', 'net', 'profit_loss', 'margin'
-            ]
-            if not any(neg_term in column['name'].lower() for neg_term in negative_allowed_patterns):
-                validations.append({
-                    "name": f"check_{column['name']}_positive",
-                    "description": f"Ensure {column['name']} has no negative values",
-                    "query": f"SELECT COUNT(*) FROM {table_name} WHERE {column['name']} < 0",
-                    "operator": "equals",
-                    "expected_value": 0
-                })
-
-    # 7. Check for zero values in columns that typically shouldn't be zero
+    # =====================
+    # COLUMN-LEVEL VALIDATIONS
+    # =====================
+    updated_columns = []
+    created_columns = []
     for column in columns:
-        col_type = str(column['type']).lower()
+        name = column['name']
+        qname = qcols[name]
+        name_lower = name.lower()
+        col_type = column['type'].lower()
+        is_key = name in pk_set or name in fk_set
+
+        # Duplicate detection for non-key columns whose names suggest uniqueness
+        if not is_key and _UNIQUE_NAME_RE.search(name_lower):
+            buckets['unique'].append(Rule(
+                name=f"check_{name}_unique",
+                description=f"Check that {name} values are unique",
+                query=_UNIQUE_SQL.format(t=qtable, c=qname),
+                operator="equals",
+                expected_value=0
+            ))
+
+        _append_null_checks(buckets, qtable, column, qname, name_lower, name in pk_set)
 
-        # Use adapter to check if column is numeric
         if adapter.is_numeric_type(col_type):
-            non_zero_patterns = [
-                'price', 'amount', 'total', 'cost', 'rate', 'fee', 'tax',
-                'revenue', 'salary', 'income', 'expense'
-            ]
-            if any(term in column['name'].lower() for term in non_zero_patterns):
-                validations.append({
-                    "name": f"check_{column['name']}_not_zero",
-                    "description": f"Ensure {column['name']} has no zero values",
-                    "query": f"SELECT COUNT(*) FROM {table_name} WHERE {column['name']} = 0",
-                    "operator": "equals",
-                    "expected_value": 0
-                })
-
-    # 8. Check for valid date ranges in date/datetime columns
-    for column in columns:
-        col_type = str(column['type']).lower()
+            _append_numeric_checks(buckets, adapter, table_name, qtable, name, qname, name_lower, col_type,
+                                   combine_numeric_checks)
 
-        # Use adapter to check if column is a date type
         if adapter.is_date_type(col_type):
-            # Validate no future dates for columns that typically shouldn't have future dates
-            past_date_patterns = [
-                'birth', 'created', 'start', 'registered', 'joined', 'purchase',
-                'transaction', 'order', 'payment', 'issued', 'shipped', 'received'
-            ]
-            if any(date_term in column['name'].lower() for date_term in past_date_patterns):
-                validations.append({
-                    "name": f"check_{column['name']}_not_future",
-                    "description": f"Ensure {column['name']} contains no future dates",
-                    "query": f"SELECT COUNT(*) FROM {table_name} WHERE {column['name']} > CURRENT_DATE",
-                    "operator": "equals",
-                    "expected_value": 0
-                })
-
-            # Check for no unreasonably old dates (before 1970)
-            validations.append({
-                "name": f"check_{column['name']}_reasonable_past",
-                "description": f"Ensure {column['name']} contains no unreasonably old dates",
-                "query": f"SELECT COUNT(*) FROM {table_name} WHERE {column['name']} < '1970-01-01'",
-                "operator": "equals",
-                "expected_value": 0
-            })
-
-            # For columns that should be in the past (end dates)
-            if any(term in column['name'].lower() for term in
-                   ['end', 'finish', 'completed', 'closed', 'expiry', 'expiration']):
-                start_date_col = guess_start_date_column(column['name'], columns)
-                validations.append({
-                    "name": f"check_{column['name']}_end_date_order",
-                    "description": f"Ensure {column['name']} occurs after any start date (if applicable)",
-                    "query": f"""
-                        SELECT COUNT(*) FROM {table_name} 
-                        WHERE {column['name']} IS NOT NULL 
-                        AND {start_date_col} IS NOT NULL
-                        AND {column['name']} < {start_date_col}
-                    """,
-                    "operator": "equals",
-                    "expected_value": 0
-                })
-
-    # 9. Check for string length constraints in varchar/text columns
-    for column in columns:
-        col_type = str(column['type']).lower()
-
-        # Use adapter to check if column is a text type
-        if adapter.is_text_type(col_type):
-            # If it's a defined length VARCHAR
-            if hasattr(column['type'], 'length') and column['type'].length is not None:
-                validations.append({
-                    "name": f"check_{column['name']}_max_length",
-                    "description": f"Ensure {column['name']} does not exceed max length ({column['type'].length})",
-                    "query": f"SELECT COUNT(*) FROM {table_name} WHERE {adapter.length_function(column['name'])} > {column['type'].length}",
-                    "operator": "equals",
-                    "expected_value": 0
-                })
-
-            # Check for empty strings in required string columns
-            if not column['nullable']:
-                validations.append({
-                    "name": f"check_{column['name']}_not_empty_string",
-                    "description": f"Ensure {column['name']} has no empty strings",
-                    "query": f"SELECT COUNT(*) FROM {table_name} WHERE {column['name']} = ''",
-                    "operator": "equals",
-                    "expected_value": 0
-                })
-
-            # Check for proper formatting of common data types
-            if 'email' in column['name'].lower():
-                validations.append({
-                    "name": f"check_{column['name']}_valid_email",
-                    "description": f"Ensure {column['name']} contains valid email format",
-                    "query": f"""
-                        SELECT COUNT(*) FROM {table_name} 
-                        WHERE {column['name']} IS NOT NULL 
-                        AND {column['name']} NOT LIKE '%@%.%'
-                    """,
-                    "operator": "equals",
-                    "expected_value": 0
-                })
-
-            if 'phone' in column['name'].lower() or 'mobile' in column['name'].lower():
-                # Store the regex pattern as a separate string, not in an f-string
-                phone_regex = r'(\+)?[0-9][0-9 ()-]+'
-
-                validations.append({
-                    "name": f"check_{column['name']}_valid_phone",
-                    "description": f"Ensure {column['name']} contains valid phone number format",
-                    "query": f"""
-                        SELECT COUNT(*) FROM {table_name} 
-                        WHERE {column['name']} IS NOT NULL 
-                        AND NOT {adapter.regex_match(column['name'], phone_regex)}
-                    """,
-                    "operator": "equals",
-                    "expected_value": 0
-                })
-
-            if 'zip' in column['name'].lower() or 'postal' in column['name'].lower():
-                validations.append({
-                    "name": f"check_{column['name']}_valid_postal",
-                    "description": f"Ensure {column['name']} follows postal/zip code patterns",
-                    "query": f"""
-                        SELECT COUNT(*) FROM {table_name} 
-                        WHERE {column['name']} IS NOT NULL 
-                        AND {adapter.length_function('TRIM(' + column['name'] + ')')} < 3
-                    """,
-                    "operator": "equals",
-                    "expected_value": 0
-                })
-
-    # 10. Check for outliers in numeric columns (using standard deviation)
-    for column in columns:
-        col_type = str(column['type']).lower()
-
-        # Use adapter to check if column is numeric
-        if adapter.is_numeric_type(col_type):
-            validations.append({
-                "name": f"check_{column['name']}_outliers",
-                "description": f"Check for extreme outliers in {column['name']} (> 3 std deviations)",
-                "query": f"""
-                    WITH stats AS (
-                        SELECT 
-                            AVG({column['name']}) as avg_val,
-                            {adapter.stddev_function(column['name'])} as stddev_val
-                        FROM {table_name}
-                        WHERE {column['name']} IS NOT NULL
-                    )
-                    SELECT COUNT(*) FROM {table_name}, stats
-                    WHERE {column['name']} > stats.avg_val + 3 * stats.stddev_val
-                    OR {column['name']} < stats.avg_val - 3 * stats.stddev_val
-                """,
-                "operator": "less_than",
-                "expected_value": get_outlier_threshold(table_name)
-            })
-
-    # 11. Check for reasonable row count for reference tables
-    if any(ref_term in table_name.lower() for ref_term in ['ref', 'type', 'status', 'category', 'lookup']):
-        # Reference tables should have a reasonable number of rows
-        validations.append({
-            "name": f"check_{table_name}_ref_table_size",
-            "description": f"Ensure reference table {table_name} has a reasonable number of rows",
-            "query": f"SELECT COUNT(*) FROM {table_name}",
-            "operator": "less_than",
-            "expected_value": 1000  # Arbitrary limit for reference tables
-        })
-
-    # 12. Check for acceptable NULL rate in columns
-    for column in columns:
-        # Skip primary keys and required columns
-        if column['name'] in primary_keys or not column['nullable']:
-            continue
-
-        # For important non-PK columns, check if NULL rate is reasonable
-        important_column_patterns = [
-            'name', 'description', 'address', 'city', 'state', 'country', 'postal', 'zip',
-            'email', 'phone', 'status', 'type', 'category', 'price', 'cost', 'amount'
-        ]
-        if any(pattern in column['name'].lower() for pattern in important_column_patterns):
-            validations.append({
-                "name": f"check_{column['name']}_null_rate",
-                "description": f"Ensure {column['name']} null rate is below acceptable threshold",
-                "query": f"""
-                    SELECT (COUNT(*) FILTER (WHERE {column['name']} IS NULL) * 100.0 / NULLIF(COUNT(*), 0)) 
-                    FROM {table_name}
-                """,
-                "operator": "less_than",
-                "expected_value": 25.0  # Max 25% NULL rate for important columns
-            })
-
-    # 13. Check for distribution of categorical columns
-    for column in columns:
-        col_type = str(column['type']).lower()
-        categorical_column_patterns = [
-            'status', 'type', 'category', 'level', 'tier', 'class', 'grade',
-            'priority', 'severity', 'state', 'region', 'stage', 'gender'
-        ]
-
-        # For string columns with categorical-like names
-        if adapter.is_text_type(col_type) and \
-                any(pattern in column['name'].lower() for pattern in categorical_column_patterns):
-            validations.append({
-                "name": f"check_{column['name']}_distribution",
-                "description": f"Ensure {column['name']} has a reasonable value distribution",
-                "query": f"""
-                    WITH val_counts AS (
-                        SELECT {column['name']}, COUNT(*) as count,
-                        (COUNT(*) * 100.0 / NULLIF((SELECT COUNT(*) FROM {table_name}), 0)) as pct
-                        FROM {table_name}
-                        WHERE {column['name']} IS NOT NULL
-                        GROUP BY {column['name']}
-                    )
-                    SELECT COUNT(*) FROM val_counts
-                    WHERE pct > 95.0
-                """,
-                "operator": "equals",
-                "expected_value": 0  # No single value should represent >95% of all values
-            })
-
-    # 14. Check for reasonable distinct count in reference columns
-    for column in columns:
-        if column['name'] in foreign_keys:
-            validations.append({
-                "name": f"check_{column['name']}_ref_distribution",
-                "description": f"Ensure {column['name']} references a reasonable number of distinct values",
-                "query": f"""
-                    SELECT CASE
-                      WHEN (SELECT COUNT(DISTINCT {column['name']}) FROM {table_name} WHERE {column['name']} IS NOT NULL) = 1 
-                      THEN 1 ELSE 0 END
-                """,
-                "operator": "equals",
-                "expected_value": 0  # At least 2 distinct values should be referenced
-            })
-
-    # 15. For timestamp columns with an 'updated' pattern, check that they're not older than created timestamps
-    timestamp_columns = [col['name'] for col in columns if
-                         adapter.is_date_type(str(col['type']).lower())]
-
-    updated_columns = [col for col in timestamp_columns if any(term in col.lower() for term in
-                                                               ['updated', 'modified', 'edited', 'changed'])]
-    created_columns = [col for col in timestamp_columns if any(term in col.lower() for term in
-                                                               ['created', 'inserted', 'added'])]
-
-    # If we have both updated and created timestamps, add a validation
+            _append_date_checks(buckets, adapter, qtable, name, qname, name_lower, lname_to_name, date_lnames)
+            if _UPDATED_RE.search(name_lower):
+                updated_columns.append(name)
+            if _CREATED_RE.search(name_lower):
+                created_columns.append(name)
+
+        is_text = adapter.is_text_type(col_type)
+        if is_text:
+            _append_text_checks(buckets, adapter, qtable, column, qname, name_lower)
+
+        # Distribution of categorical columns
+        if is_text and _CATEGORICAL_RE.search(name_lower):
+            buckets['distribution'].append(Rule(
+                name=f"check_{name}_distribution",
+                description=f"Ensure {name} has a reasonable value distribution",
+                query=_DISTRIBUTION_SQL.format(t=qtable, c=qname),
+                operator="equals",
+                expected_value=0  # No single value should represent >95% of all values
+            ))
+
+        # Reasonable distinct count in reference columns
+        if name in fk_set:
+            buckets['ref_distribution'].append(Rule(
+                name=f"check_{name}_ref_distribution",
+                description=f"Ensure {name} references a reasonable number of distinct values",
+                query=_REF_DISTRIBUTION_SQL.format(t=qtable, c=qname),
+                operator="equals",
+                expected_value=0  # At least 2 distinct values should be referenced
+            ))
+
+    # For timestamp columns with an 'updated' pattern, check that they're not older than created timestamps
     for updated_col in updated_columns:
         for created_col in created_columns:
-            validations.append({
-                "name": f"check_{updated_col}_after_{created_col}",
-                "description": f"Ensure {updated_col} is not before {created_col}",
-                "query": f"""
-                    SELECT COUNT(*) FROM {table_name}
-                    WHERE {updated_col} IS NOT NULL 
-                    AND {created_col} IS NOT NULL
-                    AND {updated_col} < {created_col}
-                """,
-                "operator": "equals",
-                "expected_value": 0
-            })
-
-    return validations
-
-
-def guess_start_date_column(end_date_column, columns):
+            buckets['timestamp_order'].append(Rule(
+                name=f"check_{updated_col}_after_{created_col}",
+                description=f"Ensure {updated_col} is not before {created_col}",
+                query=_TIMESTAMP_ORDER_SQL.format(t=qtable, updated=qcols[updated_col], created=qcols[created_col]),
+                operator="equals",
+                expected_value=0
+            ))
+
+    return tuple(rule for category in _RULE_CATEGORIES for rule in buckets[category])
+
+
+def _append_table_checks(buckets, adapter, table_name, qtable, primary_keys, reference_table_max_rows):
+    """Add the table-level row count, primary key and reference size checks."""
+    # Row count validation - ensure table is not empty
+    buckets['table'].append(Rule(
+        name=f"check_{table_name}_not_empty",
+        description=f"Ensure {table_name} table has at least one row",
+        query=_ROW_COUNT_SQL.format(t=qtable),
+        operator="greater_than",
+        expected_value=0
+    ))
+
+    # Duplicate primary key check (if primary keys exist)
+    if primary_keys:
+        pk_columns = ", ".join(primary_keys)
+        quoted_pks = ", ".join(adapter.quote_identifier(pk) for pk in primary_keys)
+        buckets['table'].append(Rule(
+            name=f"check_{table_name}_pk_unique",
+            description=f"Ensure primary key ({pk_columns}) has no duplicates",
+            query=_PK_UNIQUE_SQL.format(t=qtable, cols=quoted_pks),
+            operator="equals",
+            expected_value=0
+        ))
+
+    # Reference tables should have a reasonable number of rows
+    if reference_table_max_rows is not None and _REFERENCE_TABLE_RE.search(table_name.lower()):
+        buckets['ref_table_size'].append(Rule(
+            name=f"check_{table_name}_ref_table_size",
+            description=f"Ensure reference table {table_name} has a reasonable number of rows",
+            query=_ROW_COUNT_SQL.format(t=qtable),
+            operator="less_than",
+            expected_value=reference_table_max_rows
+        ))
+
+
+def _row_growth_rule(table_name, qtable, baseline):
+    """Build the check that the row count stays within tolerance of a baseline."""
+    return Rule(
+        name=f"check_{table_name}_row_growth",
+        description=f"Detect unusual growth in {table_name} row count "
+                    f"(>{ROW_GROWTH_TOLERANCE:.0%} change from {baseline})",
+        query=_ROW_COUNT_SQL.format(t=qtable),
+        operator="between",
+        expected_value=[baseline * (1 - ROW_GROWTH_TOLERANCE), baseline * (1 + ROW_GROWTH_TOLERANCE)]
+    )
+
+
+def _append_null_checks(buckets, qtable, column, qname, name_lower, is_primary_key):
+    """Add NOT NULL and NULL-rate checks for a column."""
+    name = column['name']
+    if is_primary_key:
+        return
+
+    # NULL checks for non-nullable columns
+    if not column['nullable']:
+        buckets['not_null'].append(Rule(
+            name=f"check_{name}_not_null",
+            description=f"Ensure {name} has no NULL values",
+            query=_NOT_NULL_SQL.format(t=qtable, c=qname),
+            operator="equals",
+            expected_value=0
+        ))
+
+    # For important nullable columns, check if NULL rate is reasonable
+    elif _IMPORTANT_COLUMN_RE.search(name_lower):
+        buckets['null_rate'].append(Rule(
+            name=f"check_{name}_null_rate",
+            description=f"Ensure {name} null rate is below acceptable threshold",
+            query=_NULL_RATE_SQL.format(t=qtable, c=qname),
+            operator="less_than",
+            expected_value=25.0  # Max 25% NULL rate for important columns
+        ))
+
+
+def _append_numeric_checks(buckets, adapter, table_name, qtable, name, qname, name_lower, col_type,
+                           combine=False):
     """
-    Try to guess the corresponding start date column for an end date
+    Add sign, zero and outlier checks for a numeric column.
+
+    With combine set, checks that apply are merged into one rule whose query
+    computes every count in a single scan of the table.
     """
-    # Convert end terms to start terms
-    start_term_map = {
-        'end': 'start', 'finish': 'start', 'completed': 'created',
-        'closed': 'opened', 'expiry': 'issue', 'expiration': 'issue'
-    }
+    templates = _dialect_templates(type(adapter))
+    checks = []  # (bucket, rule, count expression for the combined query)
+
+    # Check for negative values (unless the name suggests they are allowed)
+    if 'unsigned' not in col_type and not _NEGATIVE_ALLOWED_RE.search(name_lower):
+        checks.append(('positive', Rule(
+            name=f"check_{name}_positive",
+            description=f"Ensure {name} has no negative values",
+            query=_NEGATIVE_SQL.format(t=qtable, c=qname),
+            operator="equals",
+            expected_value=0
+        ), _NEGATIVE_COUNT_SQL))
+
+    # Check for zero values in columns that typically shouldn't be zero
+    if _NON_ZERO_RE.search(name_lower):
+        checks.append(('not_zero', Rule(
+            name=f"check_{name}_not_zero",
+            description=f"Ensure {name} has no zero values",
+            query=_ZERO_SQL.format(t=qtable, c=qname),
+            operator="equals",
+            expected_value=0
+        ), _ZERO_COUNT_SQL))
+
+    # Check for outliers (using standard deviation)
+    checks.append(('outliers', Rule(
+        name=f"check_{name}_outliers",
+        description=f"Check for extreme outliers in {name} (> 3 std deviations)",
+        query=templates.outliers(t=qtable, c=qname),
+        operator="less_than",
+        expected_value=get_outlier_threshold(table_name)
+    ), _OUTLIER_COUNT_SQL))
+
+    if not combine or len(checks) == 1:
+        for bucket, rule, _ in checks:
+            buckets[bucket].append(rule)
+        return
+
+    counts = ", ".join(count.format(c=qname) for _, _, count in checks)
+    buckets[checks[0][0]].append(Rule(
+        name=f"check_{name}_numeric",
+        description=f"Sign, zero and outlier checks for {name} in one scan",
+        query=templates.numeric_checks(t=qtable, c=qname, counts=counts),
+        operator=None,
+        expected_value=None,
+        columns_to_results=tuple(rule._replace(query=None) for _, rule, _ in checks)
+    ))
+
+
+def _append_date_checks(buckets, adapter, qtable, name, qname, name_lower, lname_to_name, date_lnames):
+    """Add range and ordering checks for a date/datetime column."""
+    rules = buckets['date']
+
+    # Validate no future dates for columns that typically shouldn't have future dates
+    if _PAST_DATE_RE.search(name_lower):
+        rules.append(Rule(
+            name=f"check_{name}_not_future",
+            description=f"Ensure {name} contains no future dates",
+            query=_FUTURE_DATE_SQL.format(t=qtable, c=qname),
+            operator="equals",
+            expected_value=0
+        ))
+
+    # Check for no unreasonably old dates (before 1970)
+    rules.append(Rule(
+        name=f"check_{name}_reasonable_past",
+        description=f"Ensure {name} contains no unreasonably old dates",
+        query=_OLD_DATE_SQL.format(t=qtable, c=qname),
+        operator="equals",
+        expected_value=0
+    ))
+
+    # For columns that should be in the past (end dates)
+    if _END_DATE_RE.search(name_lower):
+        start_date_col = guess_start_date_column(name, lname_to_name, date_lnames)
+        rules.append(Rule(
+            name=f"check_{name}_end_date_order",
+            description=f"Ensure {name} occurs after any start date (if applicable)",
+            query=_END_DATE_ORDER_SQL.format(t=qtable, c=qname, start=adapter.quote_identifier(start_date_col)),
+            operator="equals",
+            expected_value=0
+        ))
+
+
+def _append_text_checks(buckets, adapter, qtable, column, qname, name_lower):
+    """Add length, emptiness and format checks for a varchar/text column."""
+    rules = buckets['text']
+    name = column['name']
+    templates = _dialect_templates(type(adapter))
+
+    # If it's a defined length VARCHAR
+    length = column['length']
+    if length is not None:
+        rules.append(Rule(
+            name=f"check_{name}_max_length",
+            description=f"Ensure {name} does not exceed max length ({length})",
+            query=templates.max_length(t=qtable, c=qname, length=length),
+            operator="equals",
+            expected_value=0
+        ))
+
+    # Check for empty strings in required string columns
+    if not column['nullable']:
+        rules.append(Rule(
+            name=f"check_{name}_not_empty_string",
+            description=f"Ensure {name} has no empty strings",
+            query=_EMPTY_STRING_SQL.format(t=qtable, c=qname),
+            operator="equals",
+            expected_value=0
+        ))
+
+    # Check for proper formatting of common data types
+    if 'email' in name_lower:
+        rules.append(Rule(
+            name=f"check_{name}_valid_email",
+            description=f"Ensure {name} contains valid email format",
+            query=_EMAIL_SQL.format(t=qtable, c=qname),
+            operator="equals",
+            expected_value=0
+        ))
+
+    if _PHONE_RE.search(name_lower):
+        rules.append(Rule(
+            name=f"check_{name}_valid_phone",
+            description=f"Ensure {name} contains valid phone number format",
+            query=templates.phone(t=qtable, c=qname),
+            operator="equals",
+            expected_value=0
+        ))
+
+    if _POSTAL_RE.search(name_lower):
+        rules.append(Rule(
+            name=f"check_{name}_valid_postal",
+            description=f"Ensure {name} follows postal/zip code patterns",
+            query=templates.postal(t=qtable, c=qname),
+            operator="equals",
+            expected_value=0
+        ))
+
+
+def guess_start_date_column(end_date_column, lname_to_name, date_lnames):
+    """
+    Try to guess the corresponding start date column for an end date
 
+    Args:
+        end_date_column: Name of the end date column
+        lname_to_name: Lowercased column name -> column name, for every column
+        date_lnames: Lowercased names of the date/time columns, in table order
+
+    Returns:
+        Name of the likely start date column, or the end date column itself
+        if none is found
+    """
     # Find which end term is in the column name
-    found_term = next((term for term in start_term_map.keys() if term in end_date_column.lower()), None)
+    end_lname = end_date_column.lower()
+    found_term = next((term for term in _START_TERM_MAP if term in end_lname), None)
 
     if found_term:
-        start_term = start_term_map[found_term]
-        # Replace end term with start term in column name
-        potential_start_column = end_date_column.lower().replace(found_term, start_term)
-
-        # Check if this column exists
-        for column in columns:
-            if column['name'].lower() == potential_start_column:
-                return column['name']
+        # Replace end term with start term in column name and check if this column exists
+        potential_start_column = end_lname.replace(found_term, _START_TERM_MAP[found_term])
+        if potential_start_column in lname_to_name:
+            return lname_to_name[potential_start_column]
 
-    # Default fallback - find any column with 'start', 'created', etc.
-    start_indicators = ['start', 'created', 'opened', 'issue', 'begin']
-    date_indicators = ['date', 'time', 'timestamp', 'dt']
-
-    for column in columns:
-        col_name = column['name'].lower()
-        if any(start in col_name for start in start_indicators) and \
-                any(date in col_name for date in date_indicators):
-            return column['name']
+    # Default fallback - find any date column with 'start', 'created', etc.
+    for col_name in date_lnames:
+        if _START_INDICATOR_RE.search(col_name) and _DATE_INDICATOR_RE.search(col_name):
+            return lname_to_name[col_name]
 
     # Last resort - just return the end date column itself
     return end_date_column
@@ -467,14 +827,11 @@ def get_outlier_threshold(table_name):
     Determine a reasonable threshold for outliers based on table name/size
     """
     # For tables likely to have many rows
-    large_table_indicators = ['fact', 'transaction', 'event', 'log', 'history', 'audit', 'detail']
-
-    if any(indicator in table_name.lower() for indicator in large_table_indicators):
+    if _LARGE_TABLE_RE.search(table_name.lower()):
         return 50  # Allow up to 50 outliers in large tables
 
     # For medium tables
-    medium_table_indicators = ['order', 'customer', 'user', 'account', 'product', 'item']
-    if any(indicator in table_name.lower() for indicator in medium_table_indicators):
+    if _MEDIUM_TABLE_RE.search(table_name.lower()):
         return 20  # Allow up to 20 outliers in medium tables
 
     # For small/reference tables
@@ -1,17 +1,164 @@
+import copy
+import functools
 import json
-import os
+import mmap
+import operator
+import re
+import numpy as np
 import yaml
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Union, Optional
+from typing import Dict, Iterator, List, Any, MutableMapping, Union, Optional
 
-from sqlalchemy import create_engine, text
-from sparvi.db.adapters import get_adapter_for_connection
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import QueuePool
+
+from sparvi.db.connection import get_connection_manager, get_or_create_engine
+
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # ijson is only needed to stream JSON rule files
+    ijson = None
+
+_REQUIRED_RULE_FIELDS = ('name', 'query')
+_INVALID_FORMAT = "Invalid rule file format. Expected a list of rules or a dict with a 'rules' key"
+
+# Rule files at least this large are parsed from a memory map of the file
+_MMAP_MIN_SIZE = 64 * 1024
+
+# Comparison applied to (actual_value, expected_value) for each rule operator
+_OPERATORS = {
+    "equals": operator.eq, "==": operator.eq,
+    "greater_than": operator.gt, ">": operator.gt,
+    "less_than": operator.lt, "<": operator.lt,
+    "greater_than_or_equal": operator.ge, ">=": operator.ge,
+    "less_than_or_equal": operator.le, "<=": operator.le,
+    "not_equals": operator.ne, "!=": operator.ne,
+    "between": lambda actual, expected: expected[0] <= actual <= expected[1],
+}
+
+# Single-check rules whose query is a plain SELECT are fused, this many at a
+# time, into one statement that returns each rule's value as a column
+_BATCH_SIZE = 32
+_SELECT_RE = re.compile(r"^\s*select\b", re.IGNORECASE)
+
+# Batched "SELECT COUNT(*) FROM <table> [WHERE <condition>]" rules over the
+# same table are folded into one COUNT(CASE WHEN ...) scan of the table.
+# Conditions that could end or nest a statement are left alone.
+_IDENTIFIER = r'(?:"[^"]+"|`[^`]+`|[\w$]+)'
+_COUNT_RE = re.compile(
+    rf"^\s*select\s+count\(\s*\*\s*\)\s+from\s+(?P<table>{_IDENTIFIER}(?:\.{_IDENTIFIER})*)"
+    r"(?:\s+where\s+(?P<condition>.+?))?\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+_UNFUSABLE_RE = re.compile(
+    r"\b(?:select|group|having|order|limit|offset|fetch|union|intersect|except|window|qualify)\b|;|--|/\*",
+    re.IGNORECASE,
+)
+
+# Compiled statement cache entries per engine; fused batches and rule sets
+# add many distinct statements, more than SQLAlchemy's default of 500
+_QUERY_CACHE_SIZE = 1200
+_POOL_RECYCLE_SECONDS = 1800
+
+# Fewer rules than this are not worth spreading over several connections
+_PARALLEL_MIN_RULES = 5
+
+# Marks a query whose outcome is neither cached nor run yet
+_NOT_RUN = object()
+
+# Above this many numeric single-check rules, comparisons run as NumPy
+# ufuncs; integers beyond float64's exact range are compared in Python
+_VECTORIZE_MIN_RULES = 32
+_MAX_EXACT_FLOAT_INT = 2 ** 53
+_UFUNCS = {
+    operator.eq: np.equal, operator.ne: np.not_equal,
+    operator.gt: np.greater, operator.lt: np.less,
+    operator.ge: np.greater_equal, operator.le: np.less_equal,
+}
+
+
+class _Check(namedtuple("_Check", "name description operator expected_value compare")):
+    """One comparison of a rule against a column of its query's result row."""
+    __slots__ = ()
+
+
+class ValidationRule(namedtuple("ValidationRule", "name description query statement checks combined")):
+    """
+    An immutable validation rule, normalized once for repeated runs.
+
+    The query is wrapped in a shared SQL statement and each operator is
+    resolved to its comparison function when the rule is built. A combined
+    rule (one with columns_to_results) has one check per entry; any other
+    rule has a single check of its own.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, rule: Dict[str, Any]) -> "ValidationRule":
+        """
+        Build a rule from the dictionary format used in rule files
+
+        Args:
+            rule: Validation rule dictionary
+
+        Returns:
+            ValidationRule
+
+        Raises:
+            ValueError: If the rule is missing required fields
+        """
+        missing_fields = [field for field in _REQUIRED_RULE_FIELDS if field not in rule]
+        if missing_fields:
+            raise ValueError(f"Rule is missing required fields: {', '.join(missing_fields)}")
+
+        checks = []
+        for check in _rule_checks(rule):
+            op = check.get("operator", "equals")
+            checks.append(_Check(check["name"], check.get("description", ""), op,
+                                 check.get("expected_value", 0), _OPERATORS.get(op)))
+        query = rule["query"]
+        return cls(rule["name"], rule.get("description", ""), query, _text(query),
+                   tuple(checks), bool(rule.get("columns_to_results")))
+
+    @property
+    def batchable(self) -> bool:
+        """Whether the rule reports a single value from a plain SELECT."""
+        return not self.combined and bool(_SELECT_RE.match(self.query))
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the rule as a validation rule dictionary."""
+        rule = {"name": self.name, "description": self.description, "query": self.query}
+        parts = [{"name": check.name, "description": check.description,
+                  "operator": check.operator, "expected_value": check.expected_value}
+                 for check in self.checks]
+        if self.combined:
+            rule["columns_to_results"] = parts
+        else:
+            rule["operator"] = parts[0]["operator"]
+            rule["expected_value"] = parts[0]["expected_value"]
+        return rule
 
 
 def load_rules_from_file(file_path: Union[str, Path]) -> List[Dict[str, Any]]:
     """
     Load validation rules from a YAML or JSON file
 
+    Parsed files are cached by path, modification time and size, so loading
+    an unchanged file again is cheap; each call returns its own copy.
+
     Args:
         file_path: Path to YAML or JSON file with validation rules
 
@@ -26,119 +173,702 @@ def load_rules_from_file(file_path: Union[str, Path]) -> List[Dict[str, Any]]:
     if not path.exists():
         raise ValueError(f"File not found: {path}")
 
-    if path.suffix.lower() in ['.yaml', '.yml']:
-        with open(path, 'r') as f:
-            data = yaml.safe_load(f)
-    elif path.suffix.lower() == '.json':
-        with open(path, 'r') as f:
-            data = json.load(f)
-    else:
+    stat = path.stat()
+    return copy.deepcopy(_load_rules(str(path.resolve()), stat.st_mtime_ns, stat.st_size))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_rules(path_str: str, mtime_ns: int, size: int) -> List[Dict[str, Any]]:
+    """Parse and validate a rule file; mtime_ns and size only key the cache."""
+    path = Path(path_str)
+
+    suffix = path.suffix.lower()
+    if suffix not in ['.yaml', '.yml', '.json']:
         raise ValueError(f"Unsupported file format: {path.suffix}. Use .yaml, .yml, or .json")
 
+    with open(path, 'rb') as f:
+        if size < _MMAP_MIN_SIZE:
+            data = yaml.load(f, Loader=_YamlLoader) if suffix != '.json' else _parse_json(f.read())
+        else:
+            # Parse straight from the page cache instead of copying the file
+            # into a Python buffer first
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if suffix != '.json':
+                    data = yaml.load(mm, Loader=_YamlLoader)
+                else:
+                    with memoryview(mm) as buffer:
+                        data = _parse_json(buffer)
+
     # Check if the data has the expected format (list of rules or dict with rules key)
     if isinstance(data, list):
         rules = data
     elif isinstance(data, dict) and 'rules' in data:
         rules = data['rules']
     else:
-        raise ValueError("Invalid rule file format. Expected a list of rules or a dict with a 'rules' key")
+        raise ValueError(_INVALID_FORMAT)
 
-    # Validate each rule
     for rule in rules:
-        required_fields = ['name', 'query']
-        missing_fields = [field for field in required_fields if field not in rule]
+        _prepare_rule(rule)
 
-        if missing_fields:
-            raise ValueError(f"Rule is missing required fields: {', '.join(missing_fields)}")
+    return rules
 
-        # Set default values for optional fields
-        if 'description' not in rule:
-            rule['description'] = f"Validation rule: {rule['name']}"
 
-        if 'operator' not in rule:
-            rule['operator'] = 'equals'
+def _parse_json(buffer) -> Any:
+    """Parse JSON from bytes or a memoryview, with orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(buffer)
+    return json.loads(bytes(buffer))
 
-        if 'expected_value' not in rule:
-            rule['expected_value'] = 0
 
-    return rules
+def iter_rules_from_file(file_path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Stream validation rules from a YAML or JSON file
 
+    Unlike load_rules_from_file, the file is parsed one rule at a time, so
+    memory use stays bounded for very large rule files and an invalid rule
+    is reported as soon as it is reached. JSON files are streamed with ijson
+    when it is installed and parsed whole otherwise.
 
-def run_validations(connection_str: str, validation_rules: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    Args:
+        file_path: Path to YAML or JSON file with validation rules
+
+    Yields:
+        Validation rule dictionaries, with defaults filled in
+
+    Raises:
+        ValueError: If the file format is not supported or file is invalid
+    """
+    path = Path(file_path) if isinstance(file_path, str) else file_path
+
+    if not path.exists():
+        raise ValueError(f"File not found: {path}")
+
+    if path.suffix.lower() in ['.yaml', '.yml']:
+        rules = _iter_yaml_rules(path)
+    elif path.suffix.lower() == '.json':
+        rules = _iter_json_rules(path)
+    else:
+        raise ValueError(f"Unsupported file format: {path.suffix}. Use .yaml, .yml, or .json")
+
+    for rule in rules:
+        _prepare_rule(rule)
+        yield rule
+
+
+def _prepare_rule(rule: Dict[str, Any]) -> None:
+    """Validate a parsed rule and fill in its optional fields."""
+    missing_fields = [field for field in _REQUIRED_RULE_FIELDS if field not in rule]
+
+    if missing_fields:
+        raise ValueError(f"Rule is missing required fields: {', '.join(missing_fields)}")
+
+    # Set default values for optional fields
+    rule.setdefault('description', f"Validation rule: {rule['name']}")
+
+    # A combined rule reports one result per query column instead
+    for check in _rule_checks(rule):
+        check.setdefault('operator', 'equals')
+        check.setdefault('expected_value', 0)
+
+        if check['operator'] not in _OPERATORS:
+            raise ValueError(f"Rule {check['name']} has an unsupported operator: {check['operator']}")
+
+
+def _iter_json_rules(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield the raw rules of a JSON rule file."""
+    if ijson is None:
+        data = _parse_json(path.read_bytes())
+        if isinstance(data, dict) and 'rules' in data:
+            data = data['rules']
+        if not isinstance(data, list):
+            raise ValueError(_INVALID_FORMAT)
+        yield from data
+        return
+
+    with open(path, 'rb') as f:
+        first = f.read(64).lstrip()[:1]
+        f.seek(0)
+        if first == b'[':
+            prefix = 'item'
+        elif first == b'{':
+            prefix = 'rules.item'
+        else:
+            raise ValueError(_INVALID_FORMAT)
+        yield from ijson.items(f, prefix, use_float=True)
+
+
+def _iter_yaml_rules(path: Path) -> Iterator[Dict[str, Any]]:
+    """Yield the raw rules of a YAML rule file, building one rule at a time from parser events."""
+    with open(path, 'rb') as f:
+        loader = _YamlLoader(f)
+        anchors = {}
+        try:
+            loader.get_event()  # StreamStartEvent
+            if not loader.check_event(yaml.DocumentStartEvent):
+                raise ValueError(_INVALID_FORMAT)
+            loader.get_event()
+
+            if loader.check_event(yaml.SequenceStartEvent):
+                rules_found = True
+                yield from _iter_yaml_items(loader, anchors)
+            elif loader.check_event(yaml.MappingStartEvent):
+                rules_found = False
+                loader.get_event()
+                while not loader.check_event(yaml.MappingEndEvent):
+                    key = loader.construct_document(_compose_yaml_node(loader, anchors))
+                    if key == 'rules' and loader.check_event(yaml.SequenceStartEvent):
+                        rules_found = True
+                        yield from _iter_yaml_items(loader, anchors)
+                    else:
+                        _compose_yaml_node(loader, anchors)  # skip the value
+            else:
+                rules_found = False
+
+            if not rules_found:
+                raise ValueError(_INVALID_FORMAT)
+        finally:
+            loader.dispose()
+
+
+def _iter_yaml_items(loader, anchors) -> Iterator[Any]:
+    """Consume a YAML sequence from the parser, yielding each item as it is read."""
+    loader.get_event()  # SequenceStartEvent
+    while not loader.check_event(yaml.SequenceEndEvent):
+        yield loader.construct_document(_compose_yaml_node(loader, anchors))
+    loader.get_event()
+
+
+def _compose_yaml_node(loader, anchors):
+    """Build the representation node for the next value from parser events."""
+    event = loader.get_event()
+    if isinstance(event, yaml.AliasEvent):
+        if event.anchor not in anchors:
+            raise ValueError(f"Undefined YAML alias: {event.anchor}")
+        return anchors[event.anchor]
+
+    if isinstance(event, yaml.ScalarEvent):
+        tag = event.tag if event.tag not in (None, '!') else loader.resolve(yaml.ScalarNode, event.value, event.implicit)
+        node = yaml.ScalarNode(tag, event.value, event.start_mark, event.end_mark, style=event.style)
+    elif isinstance(event, yaml.SequenceStartEvent):
+        tag = event.tag if event.tag not in (None, '!') else loader.resolve(yaml.SequenceNode, None, event.implicit)
+        node = yaml.SequenceNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+        while not loader.check_event(yaml.SequenceEndEvent):
+            node.value.append(_compose_yaml_node(loader, anchors))
+        node.end_mark = loader.get_event().end_mark
+    else:  # MappingStartEvent
+        tag = event.tag if event.tag not in (None, '!') else loader.resolve(yaml.MappingNode, None, event.implicit)
+        node = yaml.MappingNode(tag, [], event.start_mark, None, flow_style=event.flow_style)
+        while not loader.check_event(yaml.MappingEndEvent):
+            key = _compose_yaml_node(loader, anchors)
+            node.value.append((key, _compose_yaml_node(loader, anchors)))
+        node.end_mark = loader.get_event().end_mark
+
+    if event.anchor is not None:
+        anchors[event.anchor] = node
+    return node
+
+
+def run_validations(connection_str: str, validation_rules: List[Union[Dict[str, Any], ValidationRule]],
+                    max_workers: int = 8, parallel: Optional[bool] = None,
+                    cache: Optional[MutableMapping] = None) -> List[Dict[str, Any]]:
     """
     Run custom validation rules defined by the user.
     Each rule should have a name, query, and expected result.
+
+    Rules are spread over up to max_workers connections and run concurrently;
+    results are returned in the same order as the rules. By default rules
+    run concurrently when there are more than a handful of them and the
+    database is not SQLite.
+
+    With a cache (e.g. sparvi.cache.TTLCache), query results are kept per
+    connection string and query and reused by later calls; queries that
+    fail are never cached. Use invalidate_results() after changing a table. A rule with
+    columns_to_results produces one result per entry, read from the
+    matching column of its query's result row. Single-value SELECT rules are
+    sent to the database in batches of scalar subqueries; if a batch fails,
+    its rules are retried one by one.
+
+    Args:
+        connection_str: Database connection string
+        validation_rules: List of validation rule dictionaries or ValidationRules
+        max_workers: Maximum number of concurrent connections
+        parallel: Whether to run rules concurrently; None decides from the
+            number of rules and the database
+        cache: Optional mapping to keep query results in across calls
+
+    Returns:
+        List of validation result dictionaries
+
+    Raises:
+        ValueError: If a rule is missing required fields
+    """
+    return _execute_rules(connection_str, _normalize_rules(validation_rules), None, max_workers, parallel, cache)
+
+
+def invalidate_results(cache: MutableMapping, table_name: str) -> int:
+    """
+    Drop cached query results for queries that mention a table
+
+    Args:
+        cache: Mapping passed as run_validations' cache
+        table_name: Table whose data changed
+
+    Returns:
+        Number of entries removed
+    """
+    pattern = re.compile(rf"(?<![\w$]){re.escape(table_name)}(?![\w$])", re.IGNORECASE)
+    stale = [key for key in list(cache) if pattern.search(key[2])]
+    for key in stale:
+        cache.pop(key, None)
+    return len(stale)
+
+
+def _normalize_rules(validation_rules) -> List[ValidationRule]:
+    """Convert rule dictionaries to ValidationRules, keeping existing ones."""
+    return [rule if isinstance(rule, ValidationRule) else ValidationRule.from_dict(rule)
+            for rule in validation_rules]
+
+
+class CompiledRuleSet:
+    """
+    A set of validation rules prepared once for repeated runs.
+
+    Rules are normalized into ValidationRules up front and share a compiled
+    statement cache that outlives the per-run engine, so scheduled monitors
+    that run the same rules every few minutes skip re-parsing and
+    re-compiling them on each run.
+    """
+
+    def __init__(self, validation_rules: List[Union[Dict[str, Any], ValidationRule]]):
+        """
+        Args:
+            validation_rules: List of validation rule dictionaries or ValidationRules
+
+        Raises:
+            ValueError: If a rule is missing required fields
+        """
+        self.rules = _normalize_rules(validation_rules)
+        self.compiled_cache = {}
+
+    def run(self, connection_str: str, max_workers: int = 8, parallel: Optional[bool] = None,
+            cache: Optional[MutableMapping] = None) -> List[Dict[str, Any]]:
+        """
+        Run the rule set against a database
+
+        Args:
+            connection_str: Database connection string
+            max_workers: Maximum number of concurrent connections
+            parallel: Whether to run rules concurrently; None decides from
+                the number of rules and the database
+            cache: Optional mapping to keep query results in across runs
+
+        Returns:
+            List of validation result dictionaries, in rule order
+        """
+        return _execute_rules(connection_str, self.rules, self.compiled_cache, max_workers, parallel, cache)
+
+
+def _execute_rules(connection_str: str, validation_rules: List[ValidationRule],
+                   compiled_cache: Optional[Dict], max_workers: int,
+                   parallel: Optional[bool] = None,
+                   cache: Optional[MutableMapping] = None) -> List[Dict[str, Any]]:
     """
-    import os
-    if "DATABASE_URL" not in os.environ:
-        # Set a default or log a warning
-        os.environ["DATABASE_URL"] = connection_str  # Use the connection_string that's passed to the function
-        print(f"Warning: DATABASE_URL was not set, using provided connection string instead")
+    Run validation rules
+
+    Args:
+        connection_str: Database connection string
+        validation_rules: List of ValidationRules
+        compiled_cache: Compiled statement cache to use instead of the
+            engine's own, or None
+        max_workers: Maximum number of concurrent connections
+        parallel: Whether to run rules concurrently, or None to decide
+        cache: Mapping of query results from earlier calls, or None
+
+    Returns:
+        List of validation result dictionaries, in rule order
+    """
+    # Rules with the same query read one shared result row; only their
+    # operators and expected values differ
+    query_index = {}
+    queries = []
+    for rule in validation_rules:
+        key = (rule.combined, rule.query.strip())
+        if key not in query_index:
+            query_index[key] = len(queries)
+            queries.append(rule)
+
+    outcomes = [_NOT_RUN] * len(queries)
+    if cache is not None:
+        for i, rule in enumerate(queries):
+            outcomes[i] = cache.get((connection_str, rule.combined, rule.query.strip()), _NOT_RUN)
+    pending = [i for i, outcome in enumerate(outcomes) if outcome is _NOT_RUN]
+
+    engine = None
+
+    try:
+        if pending:
+            # No separate connection probe: a failure to connect surfaces
+            # from the first worker and fails every rule below
+            engine = _get_engine(connection_str, max_workers)
+            for i, outcome in zip(pending, _run_queries(engine, [queries[i] for i in pending],
+                                                        compiled_cache, max_workers, parallel)):
+                outcomes[i] = outcome
+                if cache is not None and not isinstance(outcome, Exception):
+                    rule = queries[i]
+                    cache[(connection_str, rule.combined, rule.query.strip())] = (
+                        tuple(outcome) if outcome is not None else None
+                    )
+    except Exception as e:
+        if isinstance(e, OperationalError) and engine is not None:
+            # Drop the pooled connections so the next run reconnects
+            engine.dispose()
+        # If the engine creation or connection fails, return failure for all rules
+        return [_error_result(check, f"Database connection error: {str(e)}")
+                for rule in validation_rules for check in rule.checks]
+
+    rule_outcomes = [outcomes[query_index[(rule.combined, rule.query.strip())]] for rule in validation_rules]
+    vectorized = _vectorized_results(validation_rules, rule_outcomes)
 
     results = []
+    for i, (rule, outcome) in enumerate(zip(validation_rules, rule_outcomes)):
+        results.extend(vectorized[i] if i in vectorized else _rule_results(rule, outcome))
+    return results
+
+
+def _run_queries(engine, rules: List[ValidationRule], compiled_cache: Optional[Dict],
+                 max_workers: int, parallel: Optional[bool]) -> List[Any]:
+    """
+    Run rule queries, concurrently when worthwhile
+
+    Returns:
+        The outcome of each rule's query, in rule order (see _run_rules)
+    """
+    if parallel is None:
+        # SQLite serializes access to the database file, so extra
+        # connections only add contention
+        parallel = len(rules) >= _PARALLEL_MIN_RULES and engine.dialect.name != "sqlite"
+    # Only a QueuePool hands out independent connections to each thread
+    workers = min(max_workers, len(rules)) if parallel and isinstance(engine.pool, QueuePool) else 1
+    if workers <= 1:
+        return _run_rules(engine, rules, compiled_cache)
+
+    # Give each worker a contiguous slice so it reuses one connection
+    chunk_size = -(-len(rules) // workers)
+    chunks = [rules[i:i + chunk_size] for i in range(0, len(rules), chunk_size)]
+    outcomes = []
+    with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+        for chunk_outcomes in executor.map(lambda chunk: _run_rules(engine, chunk, compiled_cache), chunks):
+            outcomes.extend(chunk_outcomes)
+    return outcomes
+
+
+def _get_engine(connection_str: str, pool_size: int):
+    """
+    Get the engine for a connection string, shared across runs.
+
+    Engines come from the process-wide cache (see
+    sparvi.db.connection.get_or_create_engine), so repeated runs against the
+    same database reuse pooled connections instead of reconnecting and
+    re-authenticating, and engines are disposed at exit. Pooled connections
+    are pinged before use and replaced after _POOL_RECYCLE_SECONDS so stale
+    ones are not handed out. Snowflake sessions get the connection manager's
+    login settings, including the result cache, so rules repeating a query
+    already run (by another rule set or run) are answered without a
+    warehouse scan.
+
+    Args:
+        connection_str: Database connection string
+        pool_size: Number of pooled connections
+
+    Returns:
+        SQLAlchemy engine
+    """
+    options = {"pool_pre_ping": True, "pool_recycle": _POOL_RECYCLE_SECONDS, "query_cache_size": _QUERY_CACHE_SIZE}
+    if connection_str.lower().startswith("snowflake"):
+        # The connection manager defaults Snowflake to NullPool; concurrent
+        # rules need a pool that hands each worker its own connection
+        options["poolclass"] = QueuePool
+    # Pools that hold a single connection (e.g. in-memory SQLite or DuckDB)
+    # or none (the connection manager's NullPool for BigQuery) do not take a
+    # size and reject one with a TypeError; those rules run serially
+    poolclass = options.get("poolclass") or get_connection_manager(connection_str).pool_class()
+    if issubclass(poolclass, QueuePool):
+        options.update(pool_size=pool_size, max_overflow=0)
+    return get_or_create_engine(connection_str, **options)
+
+
+@functools.lru_cache(maxsize=1024)
+def _text(query: str):
+    """Return a shared text() statement for a query string."""
+    return text(query)
+
+
+def _run_rules(engine, rules: List[ValidationRule], compiled_cache: Optional[Dict] = None) -> List[Any]:
+    """
+    Run validation rule queries one after another over a single connection
+
+    Consecutive batches of up to _BATCH_SIZE scalar rules are fused into one
+    query; the remaining rules, and the rules of a batch that failed, run
+    on their own.
+
+    Args:
+        engine: SQLAlchemy engine
+        rules: ValidationRules to run
+        compiled_cache: Compiled statement cache to use instead of the
+            engine's own, or None
+
+    Returns:
+        Each rule's result row (None if its query returned no rows) or the
+        exception its query raised, in rule order
+    """
+    with engine.connect() as conn:
+        if compiled_cache is not None:
+            conn = conn.execution_options(compiled_cache=compiled_cache)
+        outcomes = [None] * len(rules)
+        done = [False] * len(rules)
+        scalar = [i for i, rule in enumerate(rules) if rule.batchable]
+        for start in range(0, len(scalar), _BATCH_SIZE):
+            batch = scalar[start:start + _BATCH_SIZE]
+            if len(batch) > 1:
+                row = _run_batch(conn, [rules[i] for i in batch])
+                if row is not None:
+                    for column, i in enumerate(batch):
+                        outcomes[i] = (row[column],)
+                        done[i] = True
+
+        for i, rule in enumerate(rules):
+            if not done[i]:
+                outcomes[i] = _run_rule(conn, rule)
+        return outcomes
+
 
+@functools.lru_cache(maxsize=1024)
+def _count_filter(query: str):
+    """
+    Split a plain filtered row count query into its table and condition
+
+    Returns:
+        (table, condition) tuple, with condition None for an unfiltered
+        count, or None if the query does not have that form
+    """
+    match = _COUNT_RE.match(query)
+    if match is None:
+        return None
+    condition = match.group("condition")
+    if condition is not None and _UNFUSABLE_RE.search(condition):
+        return None
+    return match.group("table"), condition
+
+
+def _batch_query(queries: List[str]) -> str:
+    """
+    Fuse scalar queries into one SELECT with a column per query
+
+    Row counts of the same table are computed together by one aggregate
+    subquery, so the table is scanned once for all of them.
+    """
+    filters = [_count_filter(query) for query in queries]
+    shared = Counter(f[0] for f in filters if f is not None)
+    groups = {}
+    for i, count_filter in enumerate(filters):
+        if count_filter is not None and shared[count_filter[0]] > 1:
+            groups.setdefault(count_filter[0], []).append((i, count_filter[1]))
+
+    columns = {}
+    sources = []
+    for g, (table, members) in enumerate(groups.items()):
+        aggregates = ",\n".join(
+            f"COUNT(*) AS c{i}" if condition is None else f"COUNT(CASE WHEN {condition} THEN 1 END) AS c{i}"
+            for i, condition in members
+        )
+        sources.append(f"(\nSELECT\n{aggregates}\nFROM {table}\n) AS g{g}")
+        columns.update((i, f"g{g}.c{i} AS c{i}") for i, _ in members)
+
+    # Each query sits on its own lines so a trailing "--" comment cannot
+    # swallow the closing parenthesis
+    select = ",\n".join(columns.get(i) or f"(\n{query.strip().rstrip(';')}\n) AS c{i}"
+                         for i, query in enumerate(queries))
+    if not sources:
+        return f"SELECT\n{select}"
+    return f"SELECT\n{select}\nFROM " + ",\n".join(sources)
+
+
+def _run_batch(conn, rules: List[ValidationRule]):
+    """
+    Run scalar rules as one fused query
+
+    Args:
+        conn: Open SQLAlchemy connection
+        rules: Batchable ValidationRules
+
+    Returns:
+        Result row with one column per rule, or None if the fused query failed
+    """
+    try:
+        return conn.execute(_text(_batch_query([rule.query for rule in rules]))).fetchone()
+    except Exception:
+        # One bad query fails the whole batch; the caller reruns each rule
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+        return None
+
+
+def _rule_checks(rule: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Return the checks a rule reports on: its columns_to_results, or the rule itself."""
+    return rule.get("columns_to_results") or [rule]
+
+
+def _run_rule(conn, rule: ValidationRule):
+    """
+    Run a single validation rule's query on an open connection
+
+    Args:
+        conn: Open SQLAlchemy connection
+        rule: ValidationRule to run
+
+    Returns:
+        Result row, None if the query returned no rows, or the exception
+        the query raised
+    """
+    try:
+        return conn.execute(rule.statement).fetchone()
+    except Exception as e:
+        # A failed statement can leave the transaction aborted (e.g. on
+        # Postgres); roll back so the remaining rules can still run
+        try:
+            conn.rollback()
+        except Exception:
+            pass
+        return e
+
+
+def _rule_results(rule: ValidationRule, outcome) -> List[Dict[str, Any]]:
+    """
+    Evaluate a rule's checks against the outcome of its query
+
+    Args:
+        rule: ValidationRule
+        outcome: Result row, None, or the exception raised by the query
+
+    Returns:
+        Validation result dictionaries, one per check of the rule
+    """
+    if isinstance(outcome, Exception):
+        return [_error_result(check, str(outcome)) for check in rule.checks]
     try:
-        engine = create_engine(connection_str)
-        # Test the connection
-        with engine.connect() as conn:
-            pass  # Just test if connection works
-
-        # Get the adapter for this connection type
-        adapter = get_adapter_for_connection(engine)
-
-        for rule in validation_rules:
-            try:
-                with engine.connect() as conn:
-                    # Use the adapter for any database-specific operations
-                    # For example, if needed for query transformation:
-                    # transformed_query = adapter.transform_query(rule["query"])
-
-                    query_result = conn.execute(text(rule["query"])).fetchone()
-                    actual_value = query_result[0] if query_result else None
-
-                    is_valid = False
-                    if rule["operator"] == "equals" or rule["operator"] == "==":
-                        is_valid = actual_value == rule["expected_value"]
-                    elif rule["operator"] == "greater_than" or rule["operator"] == ">":
-                        is_valid = actual_value > rule["expected_value"]
-                    elif rule["operator"] == "less_than" or rule["operator"] == "<":
-                        is_valid = actual_value < rule["expected_value"]
-                    elif rule["operator"] == "greater_than_or_equal" or rule["operator"] == ">=":
-                        is_valid = actual_value >= rule["expected_value"]
-                    elif rule["operator"] == "less_than_or_equal" or rule["operator"] == "<=":
-                        is_valid = actual_value <= rule["expected_value"]
-                    elif rule["operator"] == "not_equals" or rule["operator"] == "!=":
-                        is_valid = actual_value != rule["expected_value"]
-                    elif rule["operator"] == "between":
-                        is_valid = rule["expected_value"][0] <= actual_value <= rule["expected_value"][1]
-
-                    results.append({
-                        "name": rule["name"],
-                        "is_valid": is_valid,
-                        "actual_value": actual_value,
-                        "expected_value": rule["expected_value"],
-                        "description": rule.get("description", "")
-                    })
-            except Exception as e:
-                results.append({
-                    "name": rule["name"],
-                    "is_valid": False,
-                    "error": str(e),
-                    "description": rule.get("description", "")
-                })
+        return _check_results(rule.checks, outcome)
     except Exception as e:
-        # If the engine creation or adapter fails, return failure for all rules
-        for rule in validation_rules:
-            results.append({
-                "name": rule["name"],
-                "is_valid": False,
-                "error": f"Database connection error: {str(e)}",
-                "description": rule.get("description", "")
-            })
+        return [_error_result(check, str(e)) for check in rule.checks]
+
+
+def _is_exact_number(value) -> bool:
+    """Return whether a value is an int or float that float64 represents exactly."""
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return -_MAX_EXACT_FLOAT_INT <= value <= _MAX_EXACT_FLOAT_INT
+    return isinstance(value, float)
 
+
+def _vectorized_results(rules: List[ValidationRule], outcomes: List[Any]) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Evaluate numeric single-check rules with NumPy when there are many
+
+    Args:
+        rules: ValidationRules
+        outcomes: The outcome of each rule's query, in rule order
+
+    Returns:
+        Validation results keyed by rule position; rules not covered here,
+        or all rules when there are too few numeric ones, are left out
+    """
+    by_op = {}
+    count = 0
+    for i, (rule, outcome) in enumerate(zip(rules, outcomes)):
+        if rule.combined or not outcome or isinstance(outcome, Exception):
+            continue
+        check = rule.checks[0]
+        if check.compare in _UFUNCS and _is_exact_number(outcome[0]) and _is_exact_number(check.expected_value):
+            by_op.setdefault(check.compare, []).append((i, check, outcome[0]))
+            count += 1
+    if count <= _VECTORIZE_MIN_RULES:
+        return {}
+
+    results = {}
+    for compare, entries in by_op.items():
+        actual = np.array([value for _, _, value in entries], dtype=np.float64)
+        expected = np.array([check.expected_value for _, check, _ in entries], dtype=np.float64)
+        for (i, check, value), is_valid in zip(entries, _UFUNCS[compare](actual, expected).tolist()):
+            results[i] = [{
+                "name": check.name,
+                "rule_name": check.name,
+                "is_valid": is_valid,
+                "actual_value": value,
+                "expected_value": check.expected_value,
+                "description": check.description
+            }]
     return results
 
 
+def _check_results(checks, row) -> List[Dict[str, Any]]:
+    """
+    Compare a query result row against checks
+
+    Args:
+        checks: Checks reading the row's columns in order
+        row: Result row, or None if the query returned no rows
+
+    Returns:
+        Validation result dictionaries, one per check
+    """
+    results = []
+    for i, check in enumerate(checks):
+        actual_value = row[i] if row else None
+
+        if check.compare is None:
+            raise ValueError(f"Unsupported operator: {check.operator}")
+        is_valid = check.compare(actual_value, check.expected_value)
+
+        results.append({
+            "name": check.name,
+            "rule_name": check.name,
+            "is_valid": is_valid,
+            "actual_value": actual_value,
+            "expected_value": check.expected_value,
+            "description": check.description
+        })
+    return results
+
+
+def _error_result(check: _Check, error: str) -> Dict[str, Any]:
+    """Build the result for a check that could not be evaluated."""
+    return {
+        "name": check.name,
+        "rule_name": check.name,
+        "is_valid": False,
+        "error": error,
+        "description": check.description
+    }
+
+
+def _plain(value: Any) -> Any:
+    """
+    Convert a rule value into plain dicts, lists and Python scalars.
+
+    The safe YAML dumper only represents plain Python types, so tuples (e.g.
+    a between range), sets and NumPy scalars are converted before dumping.
+    """
+    if isinstance(value, dict):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_plain(item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
 def export_rules(rules: List[Dict[str, Any]], file_path: Union[str, Path], format: str = 'yaml') -> None:
     """
     Export validation rules to a file
@@ -157,11 +887,15 @@ def export_rules(rules: List[Dict[str, Any]], file_path: Union[str, Path], forma
     path.parent.mkdir(parents=True, exist_ok=True)
 
     # Convert rules to the appropriate format
+    # Serialize in memory and write the file in one call
+    document = {'rules': _plain(rules)}
     if format.lower() == 'yaml':
-        with open(path, 'w') as f:
-            yaml.dump({'rules': rules}, f, sort_keys=False)
+        path.write_bytes(yaml.dump(document, Dumper=_YamlDumper, sort_keys=False, encoding='utf-8'))
     elif format.lower() == 'json':
-        with open(path, 'w') as f:
-            json.dump({'rules': rules}, f, indent=2)
+        if orjson is not None:
+            path.write_bytes(orjson.dumps(document, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        else:
+            # Match orjson's output: UTF-8, not ASCII escapes
+            path.write_bytes((json.dumps(document, indent=2, ensure_ascii=False) + "\n").encode('utf-8'))
     else:
         raise ValueError(f"Unsupported format: {format}. Use 'yaml' or 'json'")
\ No newline at end of file
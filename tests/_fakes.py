@@ -0,0 +1,82 @@
+"""
+Lightweight stand-ins for SQLAlchemy engines, connections and inspectors.
+
+They implement only what the profiler and the rule generator call, and
+record the SQL they are sent, so dialect-specific tests can run without a
+live database.
+"""
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Dict, List, Tuple
+
+
+@dataclass
+class FakeResult:
+    """Result of a statement: every query returns the same row."""
+    row: Tuple[Any, ...]
+
+    def fetchone(self):
+        return self.row
+
+    def fetchall(self):
+        return []
+
+
+@dataclass
+class FakeConnection:
+    """Connection that records executed SQL and answers with a fixed row."""
+    row: Tuple[Any, ...] = (10,) * 64
+    calls: List[str] = field(default_factory=list)
+
+    def execute(self, statement, *args, **kwargs):
+        self.calls.append(str(statement))
+        return FakeResult(self.row)
+
+    def execution_options(self, **kwargs):
+        return self
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+@dataclass
+class FakeEngine:
+    """Engine whose connections all share one FakeConnection."""
+    dialect_name: str = "snowflake"
+    connection: FakeConnection = field(default_factory=FakeConnection)
+
+    @property
+    def dialect(self):
+        return SimpleNamespace(name=self.dialect_name)
+
+    def connect(self):
+        return self.connection
+
+    def dispose(self):
+        pass
+
+
+@dataclass
+class FakeInspector:
+    """Inspector reporting the same columns and keys for every table."""
+    columns: List[Dict[str, Any]]
+    primary_keys: List[str] = field(default_factory=list)
+    foreign_keys: List[Dict[str, Any]] = field(default_factory=list)
+
+    def get_columns(self, table_name, schema=None):
+        return self.columns
+
+    def get_pk_constraint(self, table_name, schema=None):
+        return {"constrained_columns": self.primary_keys}
+
+    def get_foreign_keys(self, table_name, schema=None):
+        return self.foreign_keys
@@ -1,53 +1,51 @@
-import os
 import pytest
 import duckdb
-import pandas as pd
-import tempfile
-import uuid
+
 
 @pytest.fixture(scope="session")
-def sample_db_path():
-    """Create a DuckDB database file in the user home directory."""
-    # Create a test directory in the current project folder
-    test_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "test_data")
-    os.makedirs(test_dir, exist_ok=True)
-    
-    # Create a unique filename
-    db_file = os.path.join(test_dir, f"test_{uuid.uuid4().hex}.duckdb")
-    
+def sample_db_path(tmp_path_factory):
+    """Create a DuckDB database file shared by the whole test session."""
+    db_file = tmp_path_factory.mktemp("test_data") / "sample.duckdb"
+
     # Create connection and tables
-    conn = duckdb.connect(db_file)
-    
-    # Create test data
-    employees_data = {
-        "id": range(1, 11),
-        "name": [f"Employee {i}" for i in range(1, 11)],
-        "age": [25, 30, 35, None, 45, 50, 55, 60, None, 70],
-        "salary": [50000, 60000, None, 80000, 90000, 100000, 110000, 120000, None, 140000],
-        "department": ["HR", "IT", "Finance", "IT", "HR", "Finance", "HR", None, "IT", "Finance"]
-    }
+    conn = duckdb.connect(str(db_file))
 
     # Create the employees table
-    employees_df = pd.DataFrame(employees_data)
-    conn.execute("CREATE TABLE employees AS SELECT * FROM employees_df")
+    conn.execute("""
+        CREATE TABLE employees (
+            id BIGINT, name VARCHAR, age DOUBLE, salary DOUBLE, department VARCHAR
+        )
+    """)
+    conn.execute("""
+        INSERT INTO employees VALUES
+            (1, 'Employee 1', 25, 50000, 'HR'),
+            (2, 'Employee 2', 30, 60000, 'IT'),
+            (3, 'Employee 3', 35, NULL, 'Finance'),
+            (4, 'Employee 4', NULL, 80000, 'IT'),
+            (5, 'Employee 5', 45, 90000, 'HR'),
+            (6, 'Employee 6', 50, 100000, 'Finance'),
+            (7, 'Employee 7', 55, 110000, 'HR'),
+            (8, 'Employee 8', 60, 120000, NULL),
+            (9, 'Employee 9', NULL, NULL, 'IT'),
+            (10, 'Employee 10', 70, 140000, 'Finance')
+    """)
 
     # Create a second table for testing validations
-    products_data = {
-        "product_id": range(1, 6),
-        "name": ["Product A", "Product B", "Product C", "Product D", "Product E"],
-        "price": [10.99, 20.50, 5.99, 100.00, -1.00],  # One negative price for validation testing
-        "category": ["Electronics", "Clothing", "Food", "Electronics", "Clothing"]
-    }
-
-    products_df = pd.DataFrame(products_data)
-    conn.execute("CREATE TABLE products AS SELECT * FROM products_df")
+    conn.execute("""
+        CREATE TABLE products (
+            product_id BIGINT, name VARCHAR, price DOUBLE, category VARCHAR
+        )
+    """)
+    conn.execute("""
+        INSERT INTO products VALUES
+            (1, 'Product A', 10.99, 'Electronics'),
+            (2, 'Product B', 20.50, 'Clothing'),
+            (3, 'Product C', 5.99, 'Food'),
+            (4, 'Product D', 100.00, 'Electronics'),
+            (5, 'Product E', -1.00, 'Clothing')  -- One negative price for validation testing
+    """)
     conn.close()
-    
-    # Return the connection string for the database file
-    yield f"duckdb:///{db_file}"
-    
-    # Clean up
-    try:
-        os.remove(db_file)
-    except:
-        pass  # Ignore cleanup errors
\ No newline at end of file
+
+    # Return the connection string for the database file; pytest removes
+    # the temporary directory
+    return f"duckdb:///{db_file}"
@@ -0,0 +1,45 @@
+import sparvi
+from sparvi.cache import TTLCache
+from sparvi.validations import default_validations
+
+
+def test_ttl_cache_expires_and_evicts():
+    """Test that entries expire after the TTL and the oldest entry is evicted when full."""
+    now = [0.0]
+    cache = TTLCache(maxsize=2, ttl=10, timer=lambda: now[0])
+
+    cache["a"] = 1
+    now[0] = 5
+    cache["b"] = 2
+    assert cache["a"] == 1 and len(cache) == 2
+
+    now[0] = 12
+    assert "a" not in cache
+    assert cache.get("b") == 2
+
+    cache["c"] = 3
+    cache["d"] = 4
+    assert sorted(cache) == ["c", "d"]
+
+
+def test_default_validations_reuse_reflected_schema(sample_db_path, monkeypatch):
+    """Test that repeated rule generation reflects a table once until the cache is cleared."""
+    calls = []
+    reflect = default_validations.reflect_table
+    monkeypatch.setattr(default_validations, "reflect_table",
+                        lambda *args: calls.append(args[1]) or reflect(*args))
+    sparvi.cache.clear()
+
+    first = default_validations.get_default_validations(sample_db_path, "employees")
+    assert default_validations.get_default_validations(sample_db_path, "employees") == first
+    assert calls == ["employees"]
+
+    sparvi.cache.clear()
+    with sparvi.caching_schema(sample_db_path):
+        default_validations.get_default_validations(sample_db_path, "employees")
+        default_validations.get_default_validations(sample_db_path, "employees")
+    assert calls == ["employees", "employees"]
+
+    # Schemas reflected inside the block are forgotten when it ends
+    default_validations.get_default_validations(sample_db_path, "employees")
+    assert calls == ["employees", "employees", "employees"]
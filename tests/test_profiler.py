@@ -1,8 +1,12 @@
 """
 Tests for the profile_engine module.
 """
+import json
+
 import pytest
-from sparvi.profiler.profile_engine import profile_table
+import sparvi
+from sparvi.profiler import profile_engine
+from sparvi.profiler.profile_engine import profile_table, _introspect_columns
 
 
 def test_basic_profile(sample_db_path):
@@ -32,6 +36,63 @@ def test_basic_profile(sample_db_path):
     assert len(profile["samples"]) > 0
 
 
+def test_profile_is_json_serializable(sample_db_path):
+    """Test that profile values are plain types the stdlib json module can encode."""
+    profile = profile_table(sample_db_path, "employees", include_samples=True)
+
+    encoded = json.dumps(profile)
+    assert json.loads(encoded)["row_count"] == 10
+    assert isinstance(profile["numeric_stats"]["salary"]["avg"], float)
+
+
+def test_frequent_values_keep_column_types(sample_db_path):
+    """Test that batched frequent values are bucketed per column with native types."""
+    profile = profile_table(sample_db_path, "employees")
+
+    frequent = profile["frequent_values"]
+    assert set(frequent) == {"id", "name", "age", "salary", "department"}
+    assert isinstance(frequent["id"]["value"], int)
+    assert frequent["department"]["frequency"] == 3
+    assert frequent["department"]["percentage"] == 30.0
+
+
+def test_column_introspection_is_cached(sample_db_path, monkeypatch):
+    """Test that repeated profiles of a table reuse the cached column metadata."""
+    calls = []
+    reflect = profile_engine.reflect_table
+    monkeypatch.setattr(profile_engine, "reflect_table",
+                        lambda *args: calls.append(args[1]) or reflect(*args))
+    sparvi.cache.clear()
+
+    profile_table(sample_db_path, "employees")
+    profile_table(sample_db_path, "employees")
+    assert calls == ["employees"]
+
+
+def test_column_introspection_expires(tmp_path, monkeypatch):
+    """Test that a dropped column is picked up once the cached schema expires."""
+    import duckdb
+
+    db_file = tmp_path / "shift.duckdb"
+    conn = duckdb.connect(str(db_file))
+    conn.execute("CREATE TABLE t (a INTEGER, b VARCHAR)")
+    conn.execute("INSERT INTO t VALUES (1, 'x'), (2, 'y')")
+    conn.close()
+    connection_str = f"duckdb:///{db_file}"
+
+    now = [0.0]
+    monkeypatch.setattr(sparvi.cache._schema_cache, "_timer", lambda: now[0])
+    first = profile_table(connection_str, "t")
+
+    with profile_engine._get_engine(connection_str).begin() as conn:
+        conn.exec_driver_sql("ALTER TABLE t DROP COLUMN b")
+    now[0] += sparvi.cache.SCHEMA_TTL_SECONDS + 1
+
+    second = profile_table(connection_str, "t", historical_data=first)
+    assert set(second["completeness"]) == {"a"}
+    assert {(s["type"], s["column"]) for s in second["schema_shifts"]} == {("column_removed", "b")}
+
+
 def test_comparison_with_historical_data(sample_db_path):
     """Test profiling with historical data for comparison."""
     # Create mock historical data
@@ -58,4 +119,128 @@ def test_comparison_with_historical_data(sample_db_path):
 
     # Check specific anomaly types
     anomaly_types = [a["type"] for a in profile["anomalies"]]
-    assert "row_count" in anomaly_types  # Should detect row count change
\ No newline at end of file
+    assert "row_count" in anomaly_types  # Should detect row count change
+
+def test_schema_shifts_and_trends(sample_db_path):
+    """Test that added/removed columns are reported and trends carry history forward."""
+    historical_data = {
+        "row_count": 10,
+        "completeness": {
+            "id": {"null_percentage": 0},
+            "name": {"null_percentage": 0},
+            "age": {"null_percentage": 20.0},
+            "salary": {"null_percentage": 20.0},
+            "legacy_code": {"null_percentage": 0}
+        }
+    }
+
+    profile = profile_table(sample_db_path, "employees", historical_data)
+
+    shifts = {(s["type"], s["column"]) for s in profile["schema_shifts"]}
+    assert shifts == {("column_added", "department"), ("column_removed", "legacy_code")}
+    assert profile["anomalies"] == []
+    assert profile["trends"]["row_counts"] == [10, 10]
+    assert profile["trends"]["null_rates"]["age"] == [20.0, 20.0]
+    assert "legacy_code" not in profile["trends"]["null_rates"]
+
+
+def test_primary_key_skips_duplicate_check(tmp_path):
+    """Test that tables with an enforced primary key skip the duplicate check."""
+    import sqlite3
+
+    db_file = tmp_path / "pk.sqlite"
+    conn = sqlite3.connect(db_file)
+    conn.execute("CREATE TABLE accounts (id INTEGER PRIMARY KEY, name VARCHAR)")
+    conn.execute("INSERT INTO accounts VALUES (1, 'a'), (2, 'b'), (3, 'b')")
+    conn.commit()
+    conn.close()
+
+    connection_str = f"sqlite:///{db_file}"
+    profile = profile_table(connection_str, "accounts")
+
+    assert profile["duplicate_count"] == 0
+    assert _introspect_columns(connection_str, "accounts")[4] == ("id",)
+
+
+@pytest.mark.parametrize("dialect", ["duckdb", "sqlite"])
+def test_duplicate_count_counts_surplus_rows(tmp_path, monkeypatch, dialect):
+    """Test that duplicates are surplus rows from the scan, with and without a row hash."""
+    from sqlalchemy import create_engine
+    from sparvi.db.adapters import SqlAdapter
+
+    connection_str = f"{dialect}:///{tmp_path / 'dups.db'}"
+    engine = create_engine(connection_str)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE events (kind VARCHAR, n INTEGER)")
+        conn.exec_driver_sql("INSERT INTO events VALUES ('a', 1), ('a', 1), ('a', 1), ('b', 2), ('b', 2), ('c', 3)")
+    engine.dispose()
+
+    # A stale metadata row count must not leak into the duplicate count
+    adapter_cls = type(SqlAdapter.get_adapter(connection_str))
+    monkeypatch.setattr(adapter_cls, "fast_row_count", lambda self, conn, table: 100)
+
+    profile = profile_table(connection_str, "events")
+    assert profile["row_count"] == 100
+    assert profile["duplicate_count"] == 3
+
+
+def test_profile_tables(sample_db_path):
+    """Test profiling several tables in one call."""
+    from sparvi import profile_tables
+
+    profiles = profile_tables(sample_db_path, ["employees", "products"])
+
+    assert set(profiles) == {"employees", "products"}
+    assert profiles["employees"]["row_count"] == 10
+    assert profiles["products"]["row_count"] == 5
+
+
+def test_profile_tables_share_metrics_sql(tmp_path):
+    """Test that tables with the same schema reuse one prebuilt metrics statement."""
+    import duckdb
+    from sparvi import profile_tables
+
+    db_file = tmp_path / "partitions.duckdb"
+    conn = duckdb.connect(str(db_file))
+    for day in ("20230101", "20230102", "20230103"):
+        conn.execute(f"CREATE TABLE events_{day} (id INTEGER, kind VARCHAR)")
+        conn.execute(f"INSERT INTO events_{day} VALUES (1, 'a'), (2, 'b')")
+    conn.close()
+
+    profile_engine._metrics_plan.cache_clear()
+    tables = ["events_20230101", "events_20230102", "events_20230103"]
+    profiles = profile_tables(f"duckdb:///{db_file}", tables, max_workers=1)
+
+    assert [profiles[table]["row_count"] for table in tables] == [2, 2, 2]
+    info = profile_engine._metrics_plan.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_date_stats_come_from_fused_query(tmp_path):
+    """Test that date ranges are profiled from the fused metrics query."""
+    import duckdb
+    from sqlalchemy import event
+    from sparvi.profiler.profile_engine import _get_engine
+
+    db_file = tmp_path / "dates.duckdb"
+    conn = duckdb.connect(str(db_file))
+    conn.execute("CREATE TABLE events (id BIGINT, created_at TIMESTAMP, closed_on DATE)")
+    conn.execute("""
+        INSERT INTO events VALUES
+            (1, TIMESTAMP '2024-01-01 08:00:00', DATE '2024-02-01'),
+            (2, TIMESTAMP '2024-01-11 09:30:00', NULL),
+            (3, NULL, NULL)
+    """)
+    conn.close()
+
+    connection_str = f"duckdb:///{db_file}"
+    statements = []
+    event.listen(_get_engine(connection_str), "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    profile = profile_table(connection_str, "events")
+
+    assert profile["date_stats"]["created_at"]["date_range_days"] == 10
+    assert profile["date_stats"]["created_at"]["distinct_count"] == 2
+    assert profile["date_stats"]["closed_on"]["date_range_days"] == 0
+    # The date range comes from the fused query, not a per-column scan
+    assert sum("MIN(created_at)" in statement for statement in statements) == 1